@@ -19,6 +19,7 @@ from .predictor import (
     SprintPredictor,
     SprintPrediction,
     RiskLevel,
+    RiskFlag,
     VelocityStats,
     predict_sprint_completion
 )
@@ -46,6 +47,7 @@ __all__ = [
     "SprintPredictor",
     "SprintPrediction",
     "RiskLevel",
+    "RiskFlag",
     "VelocityStats",
     "predict_sprint_completion",
     
@@ -4,14 +4,21 @@ Team Capacity Analyzer
 Calculates workload scores and identifies overloaded team members.
 """
 
+import heapq
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from datetime import datetime, date
+from operator import attrgetter
 from typing import Optional
 from enum import Enum
 
+from . import _json
 from .integrations import GitHubUser, JiraUser, UserAvailability
 
 
+_by_workload = attrgetter("workload_percentage")
+
+
 class WorkloadStatus(Enum):
     """Workload health status."""
     HEALTHY = "healthy"      # 0-80%
@@ -19,7 +26,18 @@ class WorkloadStatus(Enum):
     OVERLOADED = "overloaded"    # 100%+
 
 
-@dataclass
+# Lower bounds (in percent) of each status band above HEALTHY
+_STATUS_THRESHOLDS = (80, 100)
+_STATUS_BANDS = (WorkloadStatus.HEALTHY, WorkloadStatus.AT_CAPACITY, WorkloadStatus.OVERLOADED)
+
+_STATUS_EMOJI = {
+    WorkloadStatus.HEALTHY: "🟢",
+    WorkloadStatus.AT_CAPACITY: "🟡",
+    WorkloadStatus.OVERLOADED: "🔴"
+}
+
+
+@dataclass(frozen=True, slots=True)
 class WorkloadWeights:
     """Configurable weights for workload calculation."""
     github_open_prs: float = 3.0
@@ -37,9 +55,27 @@ class WorkloadWeights:
     max_assigned_issues: int = 10
     max_story_points: float = 13.0
     max_meeting_hours: float = 20.0
+    
+    # Derived normalization, computed once since the weights are immutable
+    max_score: float = field(init=False, repr=False, compare=False)
+    inv_max_score_100: float = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        max_score = (
+            self.max_open_prs * self.github_open_prs +
+            self.max_pending_reviews * self.github_pending_reviews +
+            self.max_assigned_issues * self.github_assigned_issues +
+            self.max_story_points * self.jira_story_points +
+            self.max_meeting_hours * self.meeting_hours
+        )
+        if max_score <= 0:
+            raise ValueError("WorkloadWeights must produce a positive max score")
+        
+        object.__setattr__(self, "max_score", max_score)
+        object.__setattr__(self, "inv_max_score_100", 100.0 / max_score)
 
 
-@dataclass
+@dataclass(slots=True)
 class TeamMemberWorkload:
     """Complete workload picture for a team member."""
     name: str
@@ -68,23 +104,16 @@ class TeamMemberWorkload:
     @property
     def status(self) -> WorkloadStatus:
         """Get workload status based on percentage."""
-        if self.workload_percentage >= 100:
-            return WorkloadStatus.OVERLOADED
-        elif self.workload_percentage >= 80:
-            return WorkloadStatus.AT_CAPACITY
-        return WorkloadStatus.HEALTHY
+        return _STATUS_BANDS[bisect_right(_STATUS_THRESHOLDS, self.workload_percentage)]
     
     @property
     def status_emoji(self) -> str:
         """Get emoji for workload status."""
-        return {
-            WorkloadStatus.HEALTHY: "🟢",
-            WorkloadStatus.AT_CAPACITY: "🟡",
-            WorkloadStatus.OVERLOADED: "🔴"
-        }[self.status]
+        return _STATUS_EMOJI[self.status]
     
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
+        status = self.status
         return {
             "name": self.name,
             "email": self.email,
@@ -107,49 +136,83 @@ class TeamMemberWorkload:
             "workload": {
                 "score": round(self.workload_score, 1),
                 "percentage": round(self.workload_percentage, 1),
-                "status": self.status.value,
-                "emoji": self.status_emoji
+                "status": status.value,
+                "emoji": _STATUS_EMOJI[status]
             }
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TeamWorkloadSummary:
     """Summary of team workload."""
     members: list[TeamMemberWorkload] = field(default_factory=list)
     calculated_at: datetime = field(default_factory=datetime.now)
     
+    _calculated_at_iso: Optional[tuple[datetime, str]] = field(default=None, init=False, repr=False, compare=False)
+    _calculated_at_str: Optional[tuple[datetime, str]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def _stats(self) -> tuple[int, int, int, float, float]:
+        """
+        Walk members once, collecting status counts and workload mean/std dev.
+        
+        Returns:
+            (healthy, at_capacity, overloaded, average, std_dev)
+        """
+        # Welford's online mean/variance: one pass, no E[x^2]-E[x]^2 cancellation
+        counts = [0, 0, 0]
+        n = 0
+        mean = 0.0
+        m2 = 0.0
+        for m in self.members:
+            p = m.workload_percentage
+            n += 1
+            delta = p - mean
+            mean += delta / n
+            m2 += delta * (p - mean)
+            counts[bisect_right(_STATUS_THRESHOLDS, p)] += 1
+        healthy, at_capacity, overloaded = counts
+        
+        average = mean if n else 0
+        std_dev = (m2 / n) ** 0.5 if n >= 2 else 0
+        
+        return healthy, at_capacity, overloaded, average, std_dev
+    
+    def get_member(self, name: str) -> Optional[TeamMemberWorkload]:
+        """Look up a member by name, case-insensitively."""
+        name = name.lower()
+        return next((m for m in self.members if m.name.lower() == name), None)
+    
+    @property
+    def calculated_at_str(self) -> str:
+        """calculated_at as shown in reports (YYYY-MM-DD HH:MM), formatted once."""
+        if self._calculated_at_str is None or self._calculated_at_str[0] != self.calculated_at:
+            self._calculated_at_str = (self.calculated_at, self.calculated_at.strftime("%Y-%m-%d %H:%M"))
+        return self._calculated_at_str[1]
+    
     @property
     def team_size(self) -> int:
         return len(self.members)
     
     @property
     def overloaded_count(self) -> int:
-        return len([m for m in self.members if m.status == WorkloadStatus.OVERLOADED])
+        return self._stats()[2]
     
     @property
     def at_capacity_count(self) -> int:
-        return len([m for m in self.members if m.status == WorkloadStatus.AT_CAPACITY])
+        return self._stats()[1]
     
     @property
     def healthy_count(self) -> int:
-        return len([m for m in self.members if m.status == WorkloadStatus.HEALTHY])
+        return self._stats()[0]
     
     @property
     def average_workload(self) -> float:
-        if not self.members:
-            return 0
-        return sum(m.workload_percentage for m in self.members) / len(self.members)
+        return self._stats()[3]
     
     @property
     def workload_variance(self) -> float:
         """Standard deviation of workload percentages."""
-        if len(self.members) < 2:
-            return 0
-        
-        avg = self.average_workload
-        variance = sum((m.workload_percentage - avg) ** 2 for m in self.members) / len(self.members)
-        return variance ** 0.5
+        return self._stats()[4]
     
     @property
     def is_balanced(self) -> bool:
@@ -158,29 +221,37 @@ class TeamWorkloadSummary:
     
     def get_most_overloaded(self, n: int = 3) -> list[TeamMemberWorkload]:
         """Get the N most overloaded team members."""
-        sorted_members = sorted(self.members, key=lambda m: m.workload_percentage, reverse=True)
-        return sorted_members[:n]
+        return heapq.nlargest(n, self.members, key=_by_workload)
     
     def get_available_capacity(self, n: int = 3) -> list[TeamMemberWorkload]:
         """Get team members with most available capacity."""
-        sorted_members = sorted(self.members, key=lambda m: m.workload_percentage)
-        return sorted_members[:n]
+        return heapq.nsmallest(n, self.members, key=_by_workload)
     
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
+        healthy, at_capacity, overloaded, average, std_dev = self._stats()
+        
+        # Reuse the formatted timestamp across repeated serializations
+        if self._calculated_at_iso is None or self._calculated_at_iso[0] != self.calculated_at:
+            self._calculated_at_iso = (self.calculated_at, self.calculated_at.isoformat())
+        
         return {
-            "calculated_at": self.calculated_at.isoformat(),
+            "calculated_at": self._calculated_at_iso[1],
             "summary": {
-                "team_size": self.team_size,
-                "overloaded": self.overloaded_count,
-                "at_capacity": self.at_capacity_count,
-                "healthy": self.healthy_count,
-                "average_workload": round(self.average_workload, 1),
-                "variance": round(self.workload_variance, 1),
+                "team_size": len(self.members),
+                "overloaded": overloaded,
+                "at_capacity": at_capacity,
+                "healthy": healthy,
+                "average_workload": round(average, 1),
+                "variance": round(std_dev, 1),
                 "is_balanced": self.is_balanced
             },
             "members": [m.to_dict() for m in self.members]
         }
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize to JSON bytes (via orjson when available)."""
+        return _json.dumps(self.to_dict())
 
 
 class WorkloadAnalyzer:
@@ -198,37 +269,23 @@ class WorkloadAnalyzer:
     
     def __init__(self, weights: Optional[WorkloadWeights] = None):
         self.weights = weights or WorkloadWeights()
-    
-    def _calculate_github_score(self, user: GitHubUser) -> float:
-        """Calculate GitHub workload contribution."""
-        return (
-            user.open_prs * self.weights.github_open_prs +
-            user.pending_reviews * self.weights.github_pending_reviews +
-            user.assigned_issues * self.weights.github_assigned_issues +
-            user.recent_commits * self.weights.github_recent_commits
-        )
-    
-    def _calculate_jira_score(self, user: JiraUser) -> float:
-        """Calculate Jira workload contribution."""
-        return (
-            user.total_story_points * self.weights.jira_story_points +
-            user.tickets_in_progress * self.weights.jira_in_progress +
-            user.tickets_blocked * self.weights.jira_blocked
-        )
-    
-    def _calculate_calendar_score(self, availability: UserAvailability) -> float:
-        """Calculate calendar/meeting workload contribution."""
-        return availability.meeting_hours_this_week * self.weights.meeting_hours
-    
-    def _calculate_max_score(self) -> float:
-        """Calculate theoretical maximum workload score (100%)."""
-        return (
-            self.weights.max_open_prs * self.weights.github_open_prs +
-            self.weights.max_pending_reviews * self.weights.github_pending_reviews +
-            self.weights.max_assigned_issues * self.weights.github_assigned_issues +
-            self.weights.max_story_points * self.weights.jira_story_points +
-            self.weights.max_meeting_hours * self.weights.meeting_hours
+        
+        # Scoring weights unpacked in analyze_member order, so the hot path reads
+        # plain locals instead of attribute chains on self.weights
+        w = self.weights
+        self._score_weights = (
+            w.github_open_prs,
+            w.github_pending_reviews,
+            w.github_assigned_issues,
+            w.github_recent_commits,
+            w.jira_story_points,
+            w.jira_in_progress,
+            w.jira_blocked,
+            w.meeting_hours,
         )
+        
+        # Normalization is precomputed on the (frozen) weights themselves
+        self._inv_max_score_100 = w.inv_max_score_100
     
     def analyze_member(
         self,
@@ -250,27 +307,40 @@ class WorkloadAnalyzer:
             TeamMemberWorkload with calculated scores
         """
         member = TeamMemberWorkload(name=name)
+        w_open, w_reviews, w_issues, w_commits, w_points, w_in_progress, w_blocked, w_meetings = self._score_weights
         total_score = 0.0
         
+        # Each source attribute is read once, copied and folded into the score
+        # in the same step (Jira values are properties that walk all tickets).
+        
         # GitHub metrics
         if github:
-            member.github_open_prs = github.open_prs
-            member.github_pending_reviews = github.pending_reviews
-            member.github_assigned_issues = github.assigned_issues
-            member.github_recent_commits = github.recent_commits
-            total_score += self._calculate_github_score(github)
+            open_prs = member.github_open_prs = github.open_prs
+            pending_reviews = member.github_pending_reviews = github.pending_reviews
+            assigned_issues = member.github_assigned_issues = github.assigned_issues
+            recent_commits = member.github_recent_commits = github.recent_commits
+            total_score += (
+                open_prs * w_open +
+                pending_reviews * w_reviews +
+                assigned_issues * w_issues +
+                recent_commits * w_commits
+            )
         
         # Jira metrics
         if jira:
-            member.jira_story_points = jira.total_story_points
-            member.jira_tickets_in_progress = jira.tickets_in_progress
-            member.jira_tickets_blocked = jira.tickets_blocked
-            total_score += self._calculate_jira_score(jira)
+            story_points = member.jira_story_points = jira.total_story_points
+            in_progress = member.jira_tickets_in_progress = jira.tickets_in_progress
+            blocked = member.jira_tickets_blocked = jira.tickets_blocked
+            total_score += (
+                story_points * w_points +
+                in_progress * w_in_progress +
+                blocked * w_blocked
+            )
         
         # Calendar metrics
         if calendar:
             member.email = calendar.email
-            member.meeting_hours_this_week = calendar.meeting_hours_this_week
+            meeting_hours = member.meeting_hours_this_week = calendar.meeting_hours_this_week
             
             if calendar.pto_periods:
                 member.pto_days_upcoming = sum(p.days for p in calendar.pto_periods)
@@ -278,12 +348,11 @@ class WorkloadAnalyzer:
                 if next_pto:
                     member.next_pto_date = next_pto.start_date
             
-            total_score += self._calculate_calendar_score(calendar)
+            total_score += meeting_hours * w_meetings
         
         # Calculate final scores
         member.workload_score = total_score
-        max_score = self._calculate_max_score()
-        member.workload_percentage = (total_score / max_score) * 100 if max_score > 0 else 0
+        member.workload_percentage = total_score * self._inv_max_score_100
         
         return member
     
@@ -308,34 +377,39 @@ class WorkloadAnalyzer:
         Returns:
             TeamWorkloadSummary with all member workloads
         """
+        # One timestamp for the whole analysis run
+        calculated_at = datetime.now()
+        
         # Build lookup dictionaries
         github_lookup = {u.login.lower(): u for u in (github_data or [])}
         jira_lookup = {u.display_name.lower(): u for u in (jira_data or [])}
         calendar_lookup = {a.user.lower(): a for a in (calendar_data or [])}
         
-        # Determine team members
+        # Determine team members as (display name, lookup key) pairs
         if team_members:
-            names = team_members
+            names = [(name, name.lower()) for name in team_members]
         else:
-            # Union of all names from all sources
-            names = set(github_lookup.keys()) | set(jira_lookup.keys()) | set(calendar_lookup.keys())
+            # Union of all names from all sources; keys are already lowercased
+            names = [(name, name) for name in github_lookup.keys() | jira_lookup.keys() | calendar_lookup.keys()]
         
         # Analyze each member
         members = []
-        for name in names:
-            name_lower = name.lower()
-            member = self.analyze_member(
-                name=name,
-                github=github_lookup.get(name_lower),
-                jira=jira_lookup.get(name_lower),
-                calendar=calendar_lookup.get(name_lower)
-            )
-            members.append(member)
+        for name, name_lower in names:
+            github = github_lookup.get(name_lower)
+            jira = jira_lookup.get(name_lower)
+            calendar = calendar_lookup.get(name_lower)
+            
+            if github is None and jira is None and calendar is None:
+                # No data from any source: an all-zero record, no scoring needed
+                members.append(TeamMemberWorkload(name=name))
+                continue
+            
+            members.append(self.analyze_member(name, github=github, jira=jira, calendar=calendar))
         
         # Sort by workload percentage descending
         members.sort(key=lambda m: m.workload_percentage, reverse=True)
         
-        return TeamWorkloadSummary(members=members)
+        return TeamWorkloadSummary(members=members, calculated_at=calculated_at)
     
     def identify_overloaded(
         self,
@@ -368,21 +442,32 @@ class WorkloadAnalyzer:
         
         overloaded = [m for m in summary.members if m.status == WorkloadStatus.OVERLOADED]
         available = [m for m in summary.members if m.status == WorkloadStatus.HEALTHY]
+        if not overloaded or not available:
+            return suggestions
+        
+        # The least-loaded healthy member gives the largest gap for everyone, so
+        # once the gap falls below the threshold no later (lighter) overload qualifies.
+        overloaded.sort(key=_by_workload, reverse=True)
+        avail = min(available, key=_by_workload)
+        
+        avail_name = avail.name
+        avail_load = avail.workload_percentage
+        avail_rounded = round(avail_load, 1)
         
         for over in overloaded:
-            # Find someone with capacity
-            for avail in available:
-                capacity_diff = over.workload_percentage - avail.workload_percentage
-                
-                if capacity_diff > 30:  # Only suggest if significant difference
-                    suggestions.append({
-                        "from": over.name,
-                        "to": avail.name,
-                        "from_load": round(over.workload_percentage, 1),
-                        "to_load": round(avail.workload_percentage, 1),
-                        "recommendation": f"Consider moving some work from {over.name} ({over.workload_percentage:.0f}%) to {avail.name} ({avail.workload_percentage:.0f}%)"
-                    })
-                    break  # One suggestion per overloaded person
+            over_load = over.workload_percentage
+            
+            if over_load - avail_load <= 30:  # Only suggest if significant difference
+                break
+            
+            over_name = over.name
+            suggestions.append({
+                "from": over_name,
+                "to": avail_name,
+                "from_load": round(over_load, 1),
+                "to_load": avail_rounded,
+                "recommendation": f"Consider moving some work from {over_name} ({over_load:.0f}%) to {avail_name} ({avail_load:.0f}%)"
+            })
         
         return suggestions
 
@@ -4,128 +4,189 @@ FastAPI Backend for Team Capacity Planner
 Provides REST API for the dashboard and integrations.
 """
 
+import asyncio
+import hashlib
 import os
+import time
+from functools import lru_cache
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 from contextlib import asynccontextmanager
 
+import httpx
 import yaml
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
 
+from . import _json
 from .integrations import (
     GitHubClient,
     JiraClient,
-    CalendarClient,
+    JiraTicket,
+    Sprint,
     get_github_workload,
-    get_jira_workload,
-    get_team_pto_conflicts
+    get_jira_workload
 )
 from .analyzer import WorkloadAnalyzer, TeamWorkloadSummary, WorkloadWeights
 from .predictor import SprintPredictor, SprintPrediction
-from .visualizer import Visualizer
 
 
 # Configuration
+
+# Use the libyaml-backed loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Environment variables that override config values: (env var, section, key)
+_ENV_MAPPING: tuple[tuple[str, str, str], ...] = (
+    ("GITHUB_TOKEN", "github", "token"),
+    ("GITHUB_ORG", "github", "org"),
+    ("JIRA_URL", "jira", "url"),
+    ("JIRA_EMAIL", "jira", "email"),
+    ("JIRA_TOKEN", "jira", "token"),
+    ("JIRA_PROJECT", "jira", "project"),
+    ("SLACK_WEBHOOK", "slack", "webhook_url"),
+    ("CALENDAR_PROVIDER", "calendar", "provider"),
+    ("GOOGLE_CALENDAR_TOKEN", "calendar", "google_token"),
+    ("OUTLOOK_TOKEN", "calendar", "outlook_token"),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class GitHubSettings:
+    """GitHub integration settings."""
+    token: Optional[str] = None
+    org: Optional[str] = None
+    repos: list[str] = field(default_factory=list)
+    enabled: bool = field(init=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, "enabled", bool(self.token))
+
+
+@dataclass(frozen=True, slots=True)
+class JiraSettings:
+    """Jira integration settings."""
+    url: Optional[str] = None
+    email: Optional[str] = None
+    token: Optional[str] = None
+    project: Optional[str] = None
+    enabled: bool = field(init=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, "enabled", all([self.url, self.email, self.token]))
+
+
 class Config:
-    """Load configuration from config.yaml and environment."""
+    """
+    Load configuration from config.yaml and environment.
+    
+    Values used on request paths are resolved once at load time into plain
+    attributes (and frozen per-integration settings).
+    """
     
     def __init__(self, config_path: str = "config/config.yaml"):
-        self.config = {}
-        
-        if os.path.exists(config_path):
-            with open(config_path) as f:
-                self.config = yaml.safe_load(f) or {}
+        self.config = self._read_config(config_path)
         
         # Override with environment variables
         self._load_env()
+        
+        self.github = GitHubSettings(
+            token=self.get("github", "token"),
+            org=self.get("github", "org"),
+            repos=self.get("github", "repos", [])
+        )
+        self.jira = JiraSettings(
+            url=self.get("jira", "url"),
+            email=self.get("jira", "email"),
+            token=self.get("jira", "token"),
+            project=self.get("jira", "project")
+        )
+        self.slack_webhook: Optional[str] = self.get("slack", "webhook_url")
+        self.team_members: list[str] = self.get("team", "members", [])
+        self.calendar_provider: str = self.get("calendar", "provider", "google")
+        self.cache_ttl: float = self.get("cache", "ttl", 300)  # seconds
+        self.cors_origins: list[str] = self.get("api", "cors_origins", ["http://localhost:3000"])
+        self.thresholds: dict = self.config.get("thresholds", {
+            "overload": 100,
+            "at_risk": 80,
+            "balance_variance": 30
+        })
+    
+    @staticmethod
+    def _read_config(config_path: str) -> dict:
+        """
+        Read the config file, preferring a JSON sibling (e.g. config.json)
+        when present since it parses much faster than YAML.
+        """
+        json_path = os.path.splitext(config_path)[0] + ".json"
+        try:
+            with open(json_path, "rb") as f:
+                return _json.loads(f.read()) or {}
+        except FileNotFoundError:
+            pass
+        
+        try:
+            with open(config_path) as f:
+                return yaml.load(f, Loader=_YAML_LOADER) or {}
+        except FileNotFoundError:
+            return {}
     
     def _load_env(self):
         """Load configuration from environment variables."""
-        env_mapping = {
-            "GITHUB_TOKEN": ("github", "token"),
-            "GITHUB_ORG": ("github", "org"),
-            "JIRA_URL": ("jira", "url"),
-            "JIRA_EMAIL": ("jira", "email"),
-            "JIRA_TOKEN": ("jira", "token"),
-            "JIRA_PROJECT": ("jira", "project"),
-            "SLACK_WEBHOOK": ("slack", "webhook_url"),
-            "CALENDAR_PROVIDER": ("calendar", "provider"),
-            "GOOGLE_CALENDAR_TOKEN": ("calendar", "google_token"),
-            "OUTLOOK_TOKEN": ("calendar", "outlook_token"),
-        }
-        
-        for env_var, (section, key) in env_mapping.items():
-            value = os.getenv(env_var)
+        environ = os.environ
+        for env_var, section, key in _ENV_MAPPING:
+            value = environ.get(env_var)
             if value:
-                if section not in self.config:
-                    self.config[section] = {}
-                self.config[section][key] = value
+                self.config.setdefault(section, {})[key] = value
     
     def get(self, section: str, key: str, default=None):
         """Get configuration value."""
         return self.config.get(section, {}).get(key, default)
-    
-    @property
-    def github_token(self) -> Optional[str]:
-        return self.get("github", "token")
-    
-    @property
-    def github_org(self) -> Optional[str]:
-        return self.get("github", "org")
-    
-    @property
-    def github_repos(self) -> list[str]:
-        return self.get("github", "repos", [])
-    
-    @property
-    def jira_url(self) -> Optional[str]:
-        return self.get("jira", "url")
-    
-    @property
-    def jira_email(self) -> Optional[str]:
-        return self.get("jira", "email")
-    
-    @property
-    def jira_token(self) -> Optional[str]:
-        return self.get("jira", "token")
-    
-    @property
-    def jira_project(self) -> Optional[str]:
-        return self.get("jira", "project")
-    
-    @property
-    def slack_webhook(self) -> Optional[str]:
-        return self.get("slack", "webhook_url")
-    
-    @property
-    def team_members(self) -> list[str]:
-        return self.get("team", "members", [])
-    
-    @property
-    def thresholds(self) -> dict:
-        return self.config.get("thresholds", {
-            "overload": 100,
-            "at_risk": 80,
-            "balance_variance": 30
-        })
 
 
 # Global instances
 config = Config()
 analyzer = WorkloadAnalyzer()
 predictor = SprintPredictor()
-visualizer = Visualizer()
+
+
+@lru_cache(maxsize=1)
+def _visualizer():
+    """Report renderer, imported on first use since only report endpoints need it."""
+    from .visualizer import Visualizer
+    return Visualizer()
+
+
+@dataclass(frozen=True, slots=True)
+class SprintSnapshot:
+    """A sprint prediction together with the Jira data it was computed from."""
+    prediction: SprintPrediction
+    sprint: Sprint
+    tickets: list[JiraTicket]
+    velocity: list[dict]
+
 
 # Cached data
 _cache = {
     "team_workload": None,
-    "sprint_prediction": None,
+    "team_workload_expires": 0.0,  # time.monotonic() deadline
+    "team_workload_payload": None,  # (summary, etag, json bytes)
+    "team_reports": None,  # (summary, {format: rendered report})
+    "sprint": None,  # SprintSnapshot
+    "sprint_expires": 0.0,  # time.monotonic() deadline
     "last_update": None
 }
 
+# Serializes workload refreshes so concurrent cache misses share one upstream fetch
+_workload_lock = asyncio.Lock()
+
+# Same for the sprint snapshot fallback used by what-if and sprint reports
+_sprint_lock = asyncio.Lock()
+
 
 # Pydantic models for API
 class TeamMember(BaseModel):
@@ -150,73 +211,110 @@ class AlertSettings(BaseModel):
 async def lifespan(app: FastAPI):
     """Startup and shutdown events."""
     print("🚀 Team Capacity Planner API starting up...")
+    
+    # One pooled HTTP client shared by all integrations, so upstream
+    # connections are kept alive across API requests
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        timeout=30.0
+    )
+    app.state.http_client = http_client
+    
+    app.state.github = None
+    if config.github.enabled:
+        app.state.github = GitHubClient(
+            token=config.github.token,
+            org=config.github.org,
+            repos=config.github.repos,
+            http_client=http_client,
+            cache_ttl=config.cache_ttl
+        )
+    
+    app.state.jira = None
+    if config.jira.enabled:
+        app.state.jira = JiraClient(
+            url=config.jira.url,
+            email=config.jira.email,
+            token=config.jira.token,
+            project=config.jira.project,
+            http_client=http_client,
+            cache_ttl=config.cache_ttl
+        )
+    
+    # Created on first PTO request, see _calendar_client()
+    app.state.calendar = None
+    
     yield
+    
+    await http_client.aclose()
     print("👋 Team Capacity Planner API shutting down...")
 
 
 # Create FastAPI app
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson when available."""
+
+    def render(self, content) -> bytes:
+        return _json.dumps(content)
+
+
 app = FastAPI(
     title="Team Capacity Planner",
     description="API for team workload analysis and sprint predictions",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse
 )
 
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
+    allow_origins=config.cors_origins,
     allow_credentials=True,
-    allow_methods=["*"],
+    allow_methods=["GET", "POST"],
     allow_headers=["*"],
+    max_age=86400,  # let browsers cache preflights for a day
 )
 
 
 # Health check
+
+# Config is fixed for the process lifetime, so integration status is too
+_HEALTH_INTEGRATIONS = {
+    "github": config.github.token is not None,
+    "jira": config.jira.token is not None,
+    "slack": config.slack_webhook is not None
+}
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
     return {
         "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
-        "integrations": {
-            "github": config.github_token is not None,
-            "jira": config.jira_token is not None,
-            "slack": config.slack_webhook is not None
-        }
+        "timestamp": datetime.now(),
+        "integrations": _HEALTH_INTEGRATIONS
     }
 
 
 # Team workload endpoints
-@app.get("/api/workload")
-async def get_team_workload():
-    """Get current team workload summary."""
+async def _fetch_team_workload() -> TeamWorkloadSummary:
+    """Fetch and analyze team workload from the configured sources, then cache it."""
     try:
-        github_data = None
-        jira_data = None
+        # GitHub and Jira are independent, so fetch them concurrently;
+        # an unconfigured source resolves to None
+        github_fetch = (
+            app.state.github.get_team_workload(members=config.team_members)
+            if config.github.enabled and config.github.repos
+            else asyncio.sleep(0)
+        )
+        jira_fetch = (
+            app.state.jira.get_team_workload(users=config.team_members)
+            if config.jira.enabled
+            else asyncio.sleep(0)
+        )
         
-        # Fetch GitHub data
-        if config.github_token and config.github_repos:
-            github_client = GitHubClient(
-                token=config.github_token,
-                org=config.github_org,
-                repos=config.github_repos
-            )
-            github_data = await github_client.get_team_workload(
-                members=config.team_members
-            )
-        
-        # Fetch Jira data
-        if all([config.jira_url, config.jira_email, config.jira_token]):
-            jira_client = JiraClient(
-                url=config.jira_url,
-                email=config.jira_email,
-                token=config.jira_token,
-                project=config.jira_project
-            )
-            jira_data = await jira_client.get_team_workload(
-                users=config.team_members
-            )
+        github_data, jira_data = await asyncio.gather(github_fetch, jira_fetch)
         
         # Analyze workload
         summary = analyzer.analyze(
@@ -225,31 +323,81 @@ async def get_team_workload():
             team_members=config.team_members
         )
         
-        # Cache result
-        _cache["team_workload"] = summary
-        _cache["last_update"] = datetime.now()
-        
-        return summary.to_dict()
-        
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    
+    # Cache result
+    _cache["team_workload"] = summary
+    _cache["team_workload_expires"] = time.monotonic() + config.cache_ttl
+    _cache["last_update"] = datetime.now()
+    
+    return summary
+
+
+def _fresh_workload() -> Optional[TeamWorkloadSummary]:
+    """Cached team workload, or None if missing or expired."""
+    if time.monotonic() < _cache["team_workload_expires"]:
+        return _cache["team_workload"]
+    return None
+
+
+async def _get_workload_summary() -> TeamWorkloadSummary:
+    """Get the team workload, refetching only when the cached copy has expired."""
+    summary = _fresh_workload()
+    if summary is not None:
+        return summary
+    
+    async with _workload_lock:
+        # Another request may have refreshed the cache while we waited
+        summary = _fresh_workload()
+        if summary is None:
+            summary = await _fetch_team_workload()
+    return summary
+
+
+def _workload_payload(summary: TeamWorkloadSummary) -> tuple[str, bytes]:
+    """ETag and serialized JSON for a summary, computed once per summary."""
+    cached = _cache["team_workload_payload"]
+    if cached is not None and cached[0] is summary:
+        return cached[1], cached[2]
+    
+    body = summary.to_json_bytes()
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    _cache["team_workload_payload"] = (summary, etag, body)
+    return etag, body
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match header covers etag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # Weak comparison, as RFC 9110 requires for If-None-Match
+    return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
+
+
+@app.get("/api/workload")
+async def get_team_workload(request: Request):
+    """Get current team workload summary."""
+    summary = await _get_workload_summary()
+    
+    etag, body = _workload_payload(summary)
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 
 @app.get("/api/workload/{member_name}")
 async def get_member_workload(member_name: str):
     """Get workload for a specific team member."""
     # Get cached summary or fetch new
-    summary = _cache.get("team_workload")
-    
-    if not summary:
-        # Fetch fresh data
-        result = await get_team_workload()
-        summary = _cache.get("team_workload")
+    summary = await _get_workload_summary()
     
-    # Find member
-    for member in summary.members:
-        if member.name.lower() == member_name.lower():
-            return member.to_dict()
+    member = summary.get_member(member_name)
+    if member is not None:
+        return member.to_dict()
     
     raise HTTPException(status_code=404, detail=f"Member {member_name} not found")
 
@@ -257,11 +405,7 @@ async def get_member_workload(member_name: str):
 @app.get("/api/workload/overloaded")
 async def get_overloaded_members(threshold: float = 100):
     """Get team members exceeding workload threshold."""
-    summary = _cache.get("team_workload")
-    
-    if not summary:
-        await get_team_workload()
-        summary = _cache.get("team_workload")
+    summary = await _get_workload_summary()
     
     overloaded = analyzer.identify_overloaded(summary, threshold)
     return {
@@ -274,11 +418,7 @@ async def get_overloaded_members(threshold: float = 100):
 @app.get("/api/workload/suggestions")
 async def get_rebalancing_suggestions():
     """Get suggestions for rebalancing team workload."""
-    summary = _cache.get("team_workload")
-    
-    if not summary:
-        await get_team_workload()
-        summary = _cache.get("team_workload")
+    summary = await _get_workload_summary()
     
     suggestions = analyzer.suggest_rebalancing(summary)
     return {
@@ -289,56 +429,78 @@ async def get_rebalancing_suggestions():
 
 
 # Sprint prediction endpoints
-@app.get("/api/sprint/current")
-async def get_current_sprint():
-    """Get current sprint information and prediction."""
-    if not all([config.jira_url, config.jira_email, config.jira_token]):
+async def _fetch_sprint() -> Optional[SprintSnapshot]:
+    """Fetch the active sprint, predict its completion and cache the result."""
+    if not config.jira.enabled:
         raise HTTPException(status_code=400, detail="Jira not configured")
     
     try:
-        jira_client = JiraClient(
-            url=config.jira_url,
-            email=config.jira_email,
-            token=config.jira_token,
-            project=config.jira_project
-        )
+        jira_client = app.state.jira
         
         # Get active sprint
         sprint = await jira_client.get_active_sprint()
         if not sprint:
-            return {"message": "No active sprint found"}
+            return None
         
-        # Get sprint tickets
-        tickets = await jira_client.get_sprint_tickets(sprint.id)
-        
-        # Get velocity history
-        velocity = await jira_client.get_velocity_history()
+        # Sprint tickets and velocity history are independent
+        tickets, velocity = await asyncio.gather(
+            jira_client.get_sprint_tickets(sprint.id),
+            jira_client.get_velocity_history()
+        )
         
         # Predict completion
         prediction = predictor.predict(sprint, tickets, velocity)
         
-        # Cache
-        _cache["sprint_prediction"] = prediction
-        
-        return prediction.to_dict()
-        
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    
+    # Cache the inputs too, so what-if scenarios never refetch them
+    snapshot = SprintSnapshot(prediction, sprint, tickets, velocity)
+    _cache["sprint"] = snapshot
+    _cache["sprint_expires"] = time.monotonic() + config.cache_ttl
+    
+    return snapshot
+
+
+def _fresh_sprint() -> Optional[SprintSnapshot]:
+    """Cached sprint snapshot, or None if missing or expired."""
+    if time.monotonic() < _cache["sprint_expires"]:
+        return _cache["sprint"]
+    return None
+
+
+async def _get_sprint() -> Optional[SprintSnapshot]:
+    """Get the sprint snapshot, refetching only when the cached copy has expired."""
+    snapshot = _fresh_sprint()
+    if snapshot is not None:
+        return snapshot
+    
+    async with _sprint_lock:
+        # Another request may have fetched it while we waited
+        snapshot = _fresh_sprint()
+        if snapshot is None:
+            snapshot = await _fetch_sprint()
+    return snapshot
+
+
+@app.get("/api/sprint/current")
+async def get_current_sprint():
+    """Get current sprint information and prediction."""
+    snapshot = await _fetch_sprint()
+    if not snapshot:
+        return {"message": "No active sprint found"}
+    
+    return Response(content=snapshot.prediction.to_json_bytes(), media_type="application/json")
 
 
 @app.get("/api/sprint/burndown")
 async def get_sprint_burndown():
     """Get burndown data for current sprint."""
-    if not all([config.jira_url, config.jira_email, config.jira_token]):
+    if not config.jira.enabled:
         raise HTTPException(status_code=400, detail="Jira not configured")
     
     try:
-        jira_client = JiraClient(
-            url=config.jira_url,
-            email=config.jira_email,
-            token=config.jira_token,
-            project=config.jira_project
-        )
+        jira_client = app.state.jira
         
         sprint = await jira_client.get_active_sprint()
         if not sprint:
@@ -354,16 +516,11 @@ async def get_sprint_burndown():
 @app.get("/api/sprint/velocity")
 async def get_velocity_history(num_sprints: int = 5):
     """Get historical velocity data."""
-    if not all([config.jira_url, config.jira_email, config.jira_token]):
+    if not config.jira.enabled:
         raise HTTPException(status_code=400, detail="Jira not configured")
     
     try:
-        jira_client = JiraClient(
-            url=config.jira_url,
-            email=config.jira_email,
-            token=config.jira_token,
-            project=config.jira_project
-        )
+        jira_client = app.state.jira
         
         velocity = await jira_client.get_velocity_history(num_sprints=num_sprints)
         stats = predictor.calculate_velocity_stats(velocity)
@@ -387,28 +544,16 @@ async def get_velocity_history(num_sprints: int = 5):
 @app.post("/api/sprint/what-if")
 async def run_what_if_scenario(request: WhatIfRequest):
     """Run what-if scenario analysis."""
-    prediction = _cache.get("sprint_prediction")
+    snapshot = await _get_sprint()
     
-    if not prediction:
-        # Fetch current sprint first
-        await get_current_sprint()
-        prediction = _cache.get("sprint_prediction")
-    
-    if not prediction:
+    if not snapshot:
         raise HTTPException(status_code=400, detail="No sprint prediction available")
     
+    prediction, sprint, tickets, velocity = (
+        snapshot.prediction, snapshot.sprint, snapshot.tickets, snapshot.velocity
+    )
+    
     try:
-        jira_client = JiraClient(
-            url=config.jira_url,
-            email=config.jira_email,
-            token=config.jira_token,
-            project=config.jira_project
-        )
-        
-        sprint = await jira_client.get_active_sprint()
-        tickets = await jira_client.get_sprint_tickets(sprint.id)
-        velocity = await jira_client.get_velocity_history()
-        
         if request.scenario_type == "remove_person" and request.person_name:
             scenario = predictor.what_if_remove_person(
                 prediction, request.person_name, tickets, sprint, velocity
@@ -420,27 +565,35 @@ async def run_what_if_scenario(request: WhatIfRequest):
         else:
             raise HTTPException(status_code=400, detail="Invalid scenario parameters")
         
-        return scenario.to_dict()
+        return Response(content=scenario.to_json_bytes(), media_type="application/json")
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 # PTO and calendar endpoints
+def _calendar_client():
+    """
+    App-wide calendar client, created on first use so deployments without
+    calendar credentials only fail on the PTO endpoints.
+    """
+    if app.state.calendar is None:
+        from .integrations import CalendarClient
+        app.state.calendar = CalendarClient(
+            provider=config.calendar_provider,
+            cache_ttl=config.cache_ttl,
+            http_client=app.state.http_client
+        )
+    return app.state.calendar
+
+
 @app.get("/api/pto/conflicts")
 async def get_pto_conflicts(days_ahead: int = 30, min_coverage: int = 2):
     """Find PTO coverage conflicts."""
-    calendar_provider = config.get("calendar", "provider", "google")
-    
     try:
         emails = [f"{name}@company.com" for name in config.team_members]  # Customize as needed
         
-        conflicts = await get_team_pto_conflicts(
-            provider=calendar_provider,
-            emails=emails,
-            days_ahead=days_ahead,
-            min_coverage=min_coverage
-        )
+        conflicts = await _calendar_client().find_pto_conflicts(emails, days_ahead, min_coverage)
         
         return {
             "days_checked": days_ahead,
@@ -453,77 +606,95 @@ async def get_pto_conflicts(days_ahead: int = 30, min_coverage: int = 2):
 
 
 # Visualization endpoints
+
+# Rendering is pure string building (~2ms for 1000 members), so only large
+# teams are worth the threadpool hop to keep the event loop responsive
+_THREADPOOL_REPORT_MIN_MEMBERS = 200
+
+
+async def _render_team_report(summary: TeamWorkloadSummary, format: str):
+    """Render a team report once per summary, off the event loop for large teams."""
+    cached = _cache["team_reports"]
+    if cached is None or cached[0] is not summary:
+        cached = _cache["team_reports"] = (summary, {})
+    reports = cached[1]
+    
+    report = reports.get(format)
+    if report is None:
+        if len(summary.members) >= _THREADPOOL_REPORT_MIN_MEMBERS:
+            report = await run_in_threadpool(_visualizer().team_report, summary, format=format)
+        else:
+            report = _visualizer().team_report(summary, format=format)
+        reports[format] = report
+    return report
+
+
 @app.get("/api/reports/workload", response_class=HTMLResponse)
-async def get_workload_html_report():
+async def get_workload_html_report(request: Request):
     """Get HTML dashboard for team workload."""
-    summary = _cache.get("team_workload")
-    
-    if not summary:
-        await get_team_workload()
-        summary = _cache.get("team_workload")
-    
-    return visualizer.team_report(summary, format="html")
+    summary = await _get_workload_summary()
+    
+    # The page is rendered purely from the summary, so derive its tag from the JSON one
+    etag = _workload_payload(summary)[0][:-1] + '-html"'
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    headers = {"ETag": etag}
+    
+    if len(summary.members) >= _THREADPOOL_REPORT_MIN_MEMBERS:
+        # Stream member cards as they render; Starlette iterates sync
+        # generators in the threadpool, so the event loop stays free
+        return StreamingResponse(
+            _visualizer().html.iter_team_dashboard(summary),
+            media_type="text/html",
+            headers=headers
+        )
+    return HTMLResponse(await _render_team_report(summary, "html"), headers=headers)
 
 
 @app.get("/api/reports/workload/text")
 async def get_workload_text_report():
     """Get text report for team workload."""
-    summary = _cache.get("team_workload")
-    
-    if not summary:
-        await get_team_workload()
-        summary = _cache.get("team_workload")
+    summary = await _get_workload_summary()
     
-    return {"report": visualizer.team_report(summary, format="text")}
+    return {"report": await _render_team_report(summary, "text")}
 
 
 @app.get("/api/reports/sprint/text")
 async def get_sprint_text_report():
     """Get text report for sprint prediction."""
-    prediction = _cache.get("sprint_prediction")
+    snapshot = await _get_sprint()
     
-    if not prediction:
-        await get_current_sprint()
-        prediction = _cache.get("sprint_prediction")
-    
-    if not prediction:
+    if not snapshot:
         return {"report": "No sprint data available"}
     
-    return {"report": visualizer.sprint_report(prediction, format="text")}
+    return {"report": _visualizer().sprint_report(snapshot.prediction, format="text")}
 
 
 # Slack integration
 @app.get("/api/slack/workload-summary")
 async def get_slack_workload_summary():
     """Get Slack-formatted workload summary."""
-    summary = _cache.get("team_workload")
-    
-    if not summary:
-        await get_team_workload()
-        summary = _cache.get("team_workload")
+    summary = await _get_workload_summary()
     
-    return visualizer.team_report(summary, format="slack")
+    payload = await _render_team_report(summary, "slack")
+    return Response(content=_json.dumps(payload), media_type="application/json")
 
 
 @app.get("/api/slack/sprint-alert")
 async def get_slack_sprint_alert():
     """Get Slack-formatted sprint alert."""
-    prediction = _cache.get("sprint_prediction")
+    snapshot = await _get_sprint()
     
-    if not prediction:
-        await get_current_sprint()
-        prediction = _cache.get("sprint_prediction")
-    
-    if not prediction:
+    if not snapshot:
         raise HTTPException(status_code=400, detail="No sprint data available")
     
-    return visualizer.sprint_report(prediction, format="slack")
+    payload = _visualizer().sprint_report(snapshot.prediction, format="slack")
+    return Response(content=_json.dumps(payload), media_type="application/json")
 
 
 # Sample data endpoint (for testing)
-@app.get("/api/sample-data")
-async def get_sample_data():
-    """Get sample data for testing the dashboard."""
+def _build_sample_summary() -> TeamWorkloadSummary:
+    """Analyze a fixed sample team."""
     from .integrations import GitHubUser, JiraUser, JiraTicket
     
     # Generate sample data
@@ -535,20 +706,32 @@ async def get_sample_data():
         GitHubUser(login="eve", open_prs=4, pending_reviews=6, assigned_issues=5, recent_commits=10),
     ]
     
-    sample_jira = []
-    for user in ["Alice", "Bob", "Carol", "Dave", "Eve"]:
-        tickets = [
-            JiraTicket(key=f"PROJ-{i}", summary=f"Task {i}", status="In Progress", assignee=user, story_points=3)
-            for i in range(1, 4)
-        ]
-        sample_jira.append(JiraUser(account_id=user.lower(), display_name=user, assigned_tickets=tickets))
+    sample_jira = [
+        JiraUser(
+            account_id=user.lower(),
+            display_name=user,
+            assigned_tickets=[
+                JiraTicket(key=f"PROJ-{i}", summary=f"Task {i}", status="In Progress", assignee=user, story_points=3)
+                for i in range(1, 4)
+            ]
+        )
+        for user in ("Alice", "Bob", "Carol", "Dave", "Eve")
+    ]
     
-    summary = analyzer.analyze(
+    return analyzer.analyze(
         github_data=sample_github,
         jira_data=sample_jira
     )
-    
-    return summary.to_dict()
+
+
+# The sample data never changes, so serialize it once at import
+_SAMPLE_PAYLOAD = _build_sample_summary().to_json_bytes()
+
+
+@app.get("/api/sample-data")
+async def get_sample_data():
+    """Get sample data for testing the dashboard."""
+    return Response(content=_SAMPLE_PAYLOAD, media_type="application/json")
 
 
 # Run with: uvicorn src.api:app --reload
@@ -0,0 +1,60 @@
+"""
+Retry with backoff for transient upstream failures.
+
+Rate limiting (429, or GitHub's 403 with no remaining quota), 5xx gateway
+errors and dropped connections are usually gone a moment later, so they are
+retried a few times; anything else is raised immediately.
+"""
+
+import asyncio
+import random
+import time
+from typing import Awaitable, Callable, Optional, TypeVar
+
+import httpx
+
+T = TypeVar("T")
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Longest we will wait between attempts, even if the server asks for more
+MAX_DELAY = 8.0
+
+
+def is_retryable(exc: Exception) -> bool:
+    """Whether a failed request is worth retrying."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        response = exc.response
+        if response.status_code in RETRY_STATUSES:
+            return True
+        return response.status_code == 403 and response.headers.get("x-ratelimit-remaining") == "0"
+    return isinstance(exc, httpx.TransportError)
+
+
+def retry_delay(attempt: int, response: Optional[httpx.Response] = None) -> float:
+    """
+    Seconds to wait after the given (0-based) failed attempt.
+
+    Honors Retry-After and X-RateLimit-Reset when the response has them,
+    otherwise uses jittered exponential backoff.
+    """
+    if response is not None:
+        retry_after = response.headers.get("retry-after", "")
+        if retry_after.isdigit():
+            return min(float(retry_after), MAX_DELAY)
+        reset = response.headers.get("x-ratelimit-reset", "")
+        if reset.isdigit() and response.headers.get("x-ratelimit-remaining") == "0":
+            return min(max(int(reset) - time.time(), 0.0), MAX_DELAY)
+    return min(2 ** attempt * 0.25 + random.random() * 0.25, MAX_DELAY)
+
+
+async def with_retry(fetch: Callable[[], Awaitable[T]], attempts: int = 3) -> T:
+    """Await fetch(), retrying transient HTTP failures up to attempts times in total."""
+    for attempt in range(attempts):
+        try:
+            return await fetch()
+        except httpx.HTTPError as e:
+            if attempt == attempts - 1 or not is_retryable(e):
+                raise
+            response = e.response if isinstance(e, httpx.HTTPStatusError) else None
+            await asyncio.sleep(retry_delay(attempt, response))
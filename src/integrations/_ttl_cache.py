@@ -0,0 +1,61 @@
+"""
+In-memory TTL cache shared by the integration clients.
+
+Upstream data (PRs, calendars, org membership) changes on a minutes-to-hours
+scale, so long-lived clients keep recent results instead of refetching them.
+"""
+
+import time
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """
+    Dict-backed cache whose entries expire after a time-to-live.
+
+    Holds at most maxsize entries; past that the oldest-stored are evicted.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        # Kept in insertion order, oldest first
+        self._entries: dict[Hashable, tuple[float, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if time.monotonic() >= expires:
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """
+        Store a value for ttl seconds (defaults to the cache's ttl).
+
+        When the cache is full, expired entries are dropped first, then the
+        oldest ones if it is still full.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+        now = time.monotonic()
+        entries = self._entries
+        entries.pop(key, None)
+        if len(entries) >= self.maxsize:
+            for stale in [k for k, (expires, _) in entries.items() if now >= expires]:
+                del entries[stale]
+        while len(entries) >= self.maxsize:
+            del entries[next(iter(entries))]
+        entries[key] = (now + ttl, value)
+
+    def clear(self):
+        """Drop all entries."""
+        self._entries.clear()
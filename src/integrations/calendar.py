@@ -4,16 +4,34 @@ Calendar Integration for Team Capacity Planner
 Pulls PTO, meetings, and out-of-office from Google Calendar or Outlook.
 """
 
+import asyncio
+import logging
 import os
+import re
+from contextlib import nullcontext
 from datetime import datetime, timedelta, date
 from typing import Optional, Literal
 from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
+from operator import attrgetter
 
 import httpx
 
+from .. import _json
+from ._retry import with_retry
+from ._ttl_cache import TTLCache
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+
+# Substring match on any PTO keyword, case-insensitive, in one scan of the title
+_PTO_RE = re.compile(
+    "pto|vacation|holiday|time off|ooo|out of office|leave",
+    re.IGNORECASE
+)
+
+
+@dataclass(slots=True)
 class CalendarEvent:
     """Represents a calendar event."""
     id: str
@@ -33,9 +51,7 @@ class CalendarEvent:
     @property
     def is_pto(self) -> bool:
         """Check if event looks like PTO."""
-        pto_keywords = ["pto", "vacation", "holiday", "time off", "ooo", "out of office", "leave"]
-        title_lower = self.title.lower()
-        return any(kw in title_lower for kw in pto_keywords)
+        return _PTO_RE.search(self.title) is not None
     
     @property
     def is_meeting(self) -> bool:
@@ -43,7 +59,7 @@ class CalendarEvent:
         return len(self.attendees) > 1
 
 
-@dataclass
+@dataclass(slots=True)
 class PTOPeriod:
     """Represents a PTO/vacation period."""
     user: str
@@ -54,20 +70,22 @@ class PTOPeriod:
     @property
     def days(self) -> int:
         """Number of days off (excluding weekends)."""
-        count = 0
-        current = self.start_date
-        while current <= self.end_date:
-            if current.weekday() < 5:  # Monday = 0, Friday = 4
-                count += 1
-            current += timedelta(days=1)
-        return count
+        total = (self.end_date - self.start_date).days + 1
+        if total <= 0:
+            return 0
+        # Every full week has 5 weekdays; check the leftover days individually
+        full_weeks, remainder = divmod(total, 7)
+        first_weekday = self.start_date.weekday()  # Monday = 0, Friday = 4
+        return full_weeks * 5 + sum(
+            1 for offset in range(remainder) if (first_weekday + offset) % 7 < 5
+        )
     
     def overlaps(self, other: "PTOPeriod") -> bool:
         """Check if this PTO overlaps with another."""
         return not (self.end_date < other.start_date or self.start_date > other.end_date)
 
 
-@dataclass
+@dataclass(slots=True)
 class UserAvailability:
     """User's availability summary."""
     user: str
@@ -88,8 +106,12 @@ class UserAvailability:
     def next_pto(self) -> Optional[PTOPeriod]:
         """Get next upcoming PTO."""
         today = date.today()
-        future_pto = [p for p in self.pto_periods if p.end_date >= today]
-        return min(future_pto, key=lambda p: p.start_date) if future_pto else None
+        # First period (by start date) not yet over, in one pass
+        return min(
+            (p for p in self.pto_periods if p.end_date >= today),
+            key=attrgetter("start_date"),
+            default=None
+        )
     
     @property
     def meeting_load_score(self) -> float:
@@ -97,8 +119,56 @@ class UserAvailability:
         return (self.meeting_hours_this_week / 40) * 100
 
 
+def _weekly_meeting_hours(events: list[CalendarEvent], now: datetime) -> tuple[float, float]:
+    """Meeting hours starting this week and next week, in one pass over events."""
+    week_start = now - timedelta(days=now.weekday())
+    week_end = week_start + timedelta(days=7)
+    next_week_end = week_end + timedelta(days=7)
+    
+    this_week = next_week = 0.0
+    for e in events:
+        if not e.is_meeting:
+            continue
+        if week_start <= e.start < week_end:
+            this_week += e.duration_hours
+        elif week_end <= e.start < next_week_end:
+            next_week += e.duration_hours
+    return this_week, next_week
+
+
 class CalendarProvider(ABC):
-    """Abstract base class for calendar providers."""
+    """
+    Abstract base class for calendar providers.
+    
+    Providers reuse one pooled httpx client: either a shared one passed in as
+    http_client, or one they own while used as an async context manager.
+    Outside a context and without a shared client, each request opens its own.
+    """
+    
+    http_client: Optional[httpx.AsyncClient] = None
+    _owns_client: bool = False
+    
+    def _client(self):
+        """Async context yielding the pooled client, or a one-off client if there is none."""
+        if self.http_client is not None:
+            return nullcontext(self.http_client)
+        return httpx.AsyncClient()
+    
+    async def __aenter__(self):
+        if self.http_client is None:
+            self.http_client = httpx.AsyncClient(timeout=30.0)
+            self._owns_client = True
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+    
+    async def aclose(self):
+        """Close the pooled client if this provider created it."""
+        if self._owns_client:
+            await self.http_client.aclose()
+            self.http_client = None
+            self._owns_client = False
     
     @abstractmethod
     async def get_events(
@@ -136,10 +206,13 @@ class GoogleCalendarClient(CalendarProvider):
     def __init__(
         self,
         credentials_file: Optional[str] = None,
-        token: Optional[str] = None
+        token: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None
     ):
         self.credentials_file = credentials_file or os.getenv("GOOGLE_CREDENTIALS_FILE")
         self.token = token or os.getenv("GOOGLE_CALENDAR_TOKEN")
+        # Optional shared, pooled client (owned and closed by the caller)
+        self.http_client = http_client
         
         # In production, would use google-auth library for proper OAuth
         if not self.token:
@@ -159,7 +232,7 @@ class GoogleCalendarClient(CalendarProvider):
         params: Optional[dict] = None
     ) -> dict:
         """Make authenticated request to Google Calendar API."""
-        async with httpx.AsyncClient() as client:
+        async with self._client() as client:
             response = await client.get(
                 f"{self.BASE_URL}{endpoint}",
                 headers=self.headers,
@@ -167,7 +240,7 @@ class GoogleCalendarClient(CalendarProvider):
                 timeout=30.0
             )
             response.raise_for_status()
-            return response.json()
+            return _json.loads(response.content)
     
     async def get_events(
         self,
@@ -196,8 +269,8 @@ class GoogleCalendarClient(CalendarProvider):
                 event_end = datetime.fromisoformat(end_data["date"])
                 all_day = True
             else:
-                event_start = datetime.fromisoformat(start_data["dateTime"].replace("Z", "+00:00"))
-                event_end = datetime.fromisoformat(end_data["dateTime"].replace("Z", "+00:00"))
+                event_start = datetime.fromisoformat(start_data["dateTime"])
+                event_end = datetime.fromisoformat(end_data["dateTime"])
                 all_day = False
             
             attendees = [
@@ -241,19 +314,7 @@ class GoogleCalendarClient(CalendarProvider):
                 ))
         
         # Calculate meeting hours
-        week_start = now - timedelta(days=now.weekday())
-        week_end = week_start + timedelta(days=7)
-        next_week_end = week_end + timedelta(days=7)
-        
-        this_week_meetings = sum(
-            e.duration_hours for e in events
-            if e.is_meeting and week_start <= e.start < week_end
-        )
-        
-        next_week_meetings = sum(
-            e.duration_hours for e in events
-            if e.is_meeting and week_end <= e.start < next_week_end
-        )
+        this_week_meetings, next_week_meetings = _weekly_meeting_hours(events, now)
         
         return UserAvailability(
             user=email.split("@")[0],
@@ -275,8 +336,14 @@ class OutlookCalendarClient(CalendarProvider):
     
     BASE_URL = "https://graph.microsoft.com/v1.0"
     
-    def __init__(self, token: Optional[str] = None):
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None
+    ):
         self.token = token or os.getenv("OUTLOOK_TOKEN")
+        # Optional shared, pooled client (owned and closed by the caller)
+        self.http_client = http_client
         
         if not self.token:
             raise ValueError(
@@ -295,7 +362,7 @@ class OutlookCalendarClient(CalendarProvider):
         params: Optional[dict] = None
     ) -> dict:
         """Make authenticated request to Microsoft Graph API."""
-        async with httpx.AsyncClient() as client:
+        async with self._client() as client:
             response = await client.get(
                 f"{self.BASE_URL}{endpoint}",
                 headers=self.headers,
@@ -303,7 +370,7 @@ class OutlookCalendarClient(CalendarProvider):
                 timeout=30.0
             )
             response.raise_for_status()
-            return response.json()
+            return _json.loads(response.content)
     
     async def get_events(
         self,
@@ -369,19 +436,7 @@ class OutlookCalendarClient(CalendarProvider):
                 ))
         
         # Calculate meeting hours (same as Google)
-        week_start = now - timedelta(days=now.weekday())
-        week_end = week_start + timedelta(days=7)
-        next_week_end = week_end + timedelta(days=7)
-        
-        this_week_meetings = sum(
-            e.duration_hours for e in events
-            if e.is_meeting and week_start <= e.start < week_end
-        )
-        
-        next_week_meetings = sum(
-            e.duration_hours for e in events
-            if e.is_meeting and week_end <= e.start < next_week_end
-        )
+        this_week_meetings, next_week_meetings = _weekly_meeting_hours(events, now)
         
         return UserAvailability(
             user=email.split("@")[0],
@@ -397,16 +452,25 @@ class CalendarClient:
     Unified calendar client that supports multiple providers.
     
     Usage:
-        client = CalendarClient(provider="google")
-        availability = await client.get_team_availability(["alice@co.com", "bob@co.com"])
+        async with CalendarClient(provider="google") as client:
+            availability = await client.get_team_availability(["alice@co.com", "bob@co.com"])
     """
     
     def __init__(
         self,
         provider: Literal["google", "outlook"] = "google",
+        batch_size: Optional[int] = None,
+        cache_ttl: Optional[float] = None,
         **kwargs
     ):
         self.provider = provider
+        # How many users' calendars to fetch concurrently
+        self.batch_size = batch_size or int(os.getenv("CALENDAR_BATCH_SIZE", "10"))
+        self._semaphore = asyncio.Semaphore(self.batch_size)
+        # Recent availability per user, so repeated team queries skip the API
+        self._cache = TTLCache(
+            cache_ttl if cache_ttl is not None else float(os.getenv("CALENDAR_CACHE_TTL", "300"))
+        )
         
         if provider == "google":
             self.client = GoogleCalendarClient(**kwargs)
@@ -415,6 +479,17 @@ class CalendarClient:
         else:
             raise ValueError(f"Unknown provider: {provider}")
     
+    async def __aenter__(self):
+        await self.client.__aenter__()
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.client.__aexit__(*exc_info)
+    
+    async def aclose(self):
+        """Close the provider's pooled client if it owns one."""
+        await self.client.aclose()
+    
     async def get_events(
         self,
         start: datetime,
@@ -430,7 +505,12 @@ class CalendarClient:
         days_ahead: int = 30
     ) -> UserAvailability:
         """Get user's availability."""
-        return await self.client.get_user_availability(email, days_ahead)
+        key = (email, days_ahead)
+        availability = self._cache.get(key)
+        if availability is None:
+            availability = await self.client.get_user_availability(email, days_ahead)
+            self._cache.set(key, availability)
+        return availability
     
     async def get_team_availability(
         self,
@@ -438,14 +518,30 @@ class CalendarClient:
         days_ahead: int = 30
     ) -> list[UserAvailability]:
         """Get availability for multiple team members."""
+        async def fetch(email: str) -> UserAvailability:
+            async with self._semaphore:
+                # Rate limits and 5xx are usually transient, so retry before giving up on a user
+                return await with_retry(lambda: self.get_user_availability(email, days_ahead))
+        
+        # Fetch concurrently, bounded by the semaphore to avoid flooding the calendar API
+        results = await asyncio.gather(
+            *(fetch(email) for email in emails),
+            return_exceptions=True
+        )
+        
         availabilities = []
-        for email in emails:
-            try:
-                avail = await self.get_user_availability(email, days_ahead)
-                availabilities.append(avail)
-            except Exception as e:
+        for email, result in zip(emails, results):
+            if isinstance(result, BaseException):
+                # Cancellation (and interpreter exit) must propagate, not be logged away
+                if not isinstance(result, Exception):
+                    raise result
                 # Log error but continue with other users
-                print(f"Error fetching availability for {email}: {e}")
+                logger.warning(
+                    "Error fetching availability for %s: %s", email, result,
+                    extra={"user": email}
+                )
+            else:
+                availabilities.append(result)
         
         return availabilities
     
@@ -467,38 +563,68 @@ class CalendarClient:
             List of conflict dates with details
         """
         availabilities = await self.get_team_availability(emails, days_ahead)
+        return self._coverage_conflicts(availabilities, len(emails), days_ahead, min_coverage)
+    
+    @staticmethod
+    def _coverage_conflicts(
+        availabilities: list[UserAvailability],
+        total_people: int,
+        days_ahead: int,
+        min_coverage: int
+    ) -> list[dict]:
+        """
+        Sweep PTO boundaries to find weekdays with too few people available.
         
-        # Build a map of date -> who's out
-        date_pto_map = {}
+        Who is out only changes where a PTO period starts or ends, so walk those
+        boundary dates in order and only expand the spans that lack coverage
+        into per-day records.
+        """
+        if days_ahead <= 0:
+            return []
+        
+        one_day = timedelta(days=1)
         today = date.today()
+        horizon = today + timedelta(days=days_ahead)  # exclusive
+        
+        # date -> [(availability index, +1 entering PTO / -1 leaving PTO)]
+        changes: dict[date, list[tuple[int, int]]] = {}
+        for idx, avail in enumerate(availabilities):
+            for pto in avail.pto_periods:
+                start = max(pto.start_date, today)
+                end = min(pto.end_date + one_day, horizon)
+                if start < end:
+                    changes.setdefault(start, []).append((idx, 1))
+                    changes.setdefault(end, []).append((idx, -1))
+        
+        boundaries = sorted({today, horizon, *changes})
+        
+        # availability index -> number of PTO periods covering the current span
+        out_counts: dict[int, int] = {}
+        conflicts = []
         
-        for i in range(days_ahead):
-            check_date = today + timedelta(days=i)
-            if check_date.weekday() >= 5:  # Skip weekends
-                continue
+        for span_start, span_end in zip(boundaries, boundaries[1:]):
+            for idx, delta in changes.get(span_start, ()):
+                count = out_counts.get(idx, 0) + delta
+                if count:
+                    out_counts[idx] = count
+                else:
+                    del out_counts[idx]
             
-            people_out = []
-            for avail in availabilities:
-                for pto in avail.pto_periods:
-                    if pto.start_date <= check_date <= pto.end_date:
-                        people_out.append(avail.user)
-                        break
+            available = total_people - len(out_counts)
+            if available >= min_coverage:
+                continue
             
-            date_pto_map[check_date] = people_out
-        
-        # Find conflicts
-        total_people = len(emails)
-        conflicts = []
-        
-        for check_date, people_out in date_pto_map.items():
-            available = total_people - len(people_out)
-            if available < min_coverage:
-                conflicts.append({
-                    "date": check_date.isoformat(),
-                    "people_out": people_out,
-                    "available_count": available,
-                    "severity": "critical" if available == 0 else "warning"
-                })
+            people_out = [availabilities[idx].user for idx in sorted(out_counts)]
+            check_date = span_start
+            while check_date < span_end:
+                if check_date.weekday() < 5:  # Skip weekends
+                    conflicts.append({
+                        "date": check_date.isoformat(),
+                        "people_out": list(people_out),
+                        "available_count": available,
+                        "severity": "critical" if available == 0 else "warning"
+                    })
+                check_date += one_day
         
         return conflicts
 
@@ -526,5 +652,5 @@ async def get_team_pto_conflicts(
         for conflict in conflicts:
             print(f"{conflict['date']}: {conflict['people_out']} out")
     """
-    client = CalendarClient(provider=provider, **kwargs)
-    return await client.find_pto_conflicts(emails, days_ahead, min_coverage)
+    async with CalendarClient(provider=provider, **kwargs) as client:
+        return await client.find_pto_conflicts(emails, days_ahead, min_coverage)
@@ -4,15 +4,22 @@ GitHub Integration for Team Capacity Planner
 Pulls PRs, issues, reviews, and commit activity from GitHub.
 """
 
+import asyncio
 import os
-from datetime import datetime, timedelta
-from typing import Optional
+import re
+from contextlib import nullcontext
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Optional
 from dataclasses import dataclass, field
 
 import httpx
 
+from .. import _json
+from ._retry import with_retry
+from ._ttl_cache import TTLCache
 
-@dataclass
+
+@dataclass(slots=True)
 class GitHubUser:
     """Represents a GitHub user with workload metrics."""
     login: str
@@ -33,7 +40,7 @@ class GitHubUser:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class PullRequest:
     """Represents a GitHub Pull Request."""
     number: int
@@ -66,7 +73,14 @@ class PullRequest:
             return 5.0
 
 
-@dataclass 
+# Label keyword matching for Issue, case-insensitive substring search
+_BUG_RE = re.compile("bug", re.IGNORECASE)
+_PRIORITY_RE = re.compile("p0|critical|p1|high|p2|medium", re.IGNORECASE)
+_PRIORITY_RANKS = {"p0": 0, "critical": 0, "p1": 1, "high": 1, "p2": 2, "medium": 2}
+_PRIORITIES = ("critical", "high", "medium")
+
+
+@dataclass(slots=True)
 class Issue:
     """Represents a GitHub Issue."""
     number: int
@@ -78,41 +92,144 @@ class Issue:
     
     @property
     def is_bug(self) -> bool:
-        return any('bug' in label.lower() for label in self.labels)
+        # Labels are newline-joined so a match can't span two labels
+        return _BUG_RE.search("\n".join(self.labels)) is not None
     
     @property
     def priority(self) -> str:
         """Extract priority from labels."""
         for label in self.labels:
-            if 'p0' in label.lower() or 'critical' in label.lower():
-                return 'critical'
-            elif 'p1' in label.lower() or 'high' in label.lower():
-                return 'high'
-            elif 'p2' in label.lower() or 'medium' in label.lower():
-                return 'medium'
+            # The first label with any priority keyword decides; within it the highest wins
+            ranks = [_PRIORITY_RANKS[kw.lower()] for kw in _PRIORITY_RE.findall(label)]
+            if ranks:
+                return _PRIORITIES[min(ranks)]
         return 'normal'
 
 
+# Merged PRs in a repository, most recently updated first, with their reviews
+_PR_REVIEW_STATS_QUERY = """
+query($owner: String!, $name: String!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(states: MERGED, first: 100, after: $cursor, orderBy: {field: UPDATED_AT, direction: DESC}) {
+      pageInfo { endCursor hasNextPage }
+      nodes {
+        createdAt
+        updatedAt
+        mergedAt
+        reviews(first: 50) { nodes { author { login } } }
+      }
+    }
+  }
+}
+"""
+
+
+def _parse_time(value: str) -> datetime:
+    """Parse a GitHub ISO 8601 timestamp."""
+    return datetime.fromisoformat(value)
+
+
+def _parse_logins(page: list[dict]) -> list[str]:
+    """Logins from a page of GitHub user objects."""
+    return [user["login"] for user in page]
+
+
+def _parse_prs(page: list[dict]) -> list[PullRequest]:
+    """PullRequests from a page of the pulls endpoint, keeping only the fields used."""
+    return [
+        PullRequest(
+            number=pr["number"],
+            title=pr["title"],
+            author=pr["user"]["login"],
+            state=pr["state"],
+            created_at=_parse_time(pr["created_at"]),
+            updated_at=_parse_time(pr["updated_at"]),
+            reviewers=[r["login"] for r in pr.get("requested_reviewers", [])],
+            additions=pr.get("additions", 0),
+            deletions=pr.get("deletions", 0)
+        )
+        for pr in page
+    ]
+
+
+def _parse_issues(page: list[dict], assignee: Optional[str] = None) -> list[Issue]:
+    """
+    Issues from a page of the issues endpoint, skipping PRs (they show up as issues too).
+    
+    With no assignee, an issue with several assignees yields one Issue per
+    assignee login, as the per-assignee filter would.
+    """
+    issues = []
+    for issue in page:
+        if "pull_request" in issue:
+            continue
+        labels = [l["name"] for l in issue.get("labels", [])]
+        created_at = _parse_time(issue["created_at"])
+        if assignee is not None:
+            logins = (assignee,)
+        else:
+            assignees = issue.get("assignees") or [issue["assignee"]]
+            logins = {a["login"] for a in assignees if a}
+        for login in logins:
+            issues.append(Issue(
+                number=issue["number"],
+                title=issue["title"],
+                assignee=login,
+                state=issue["state"],
+                labels=labels,
+                created_at=created_at
+            ))
+    return issues
+
+
 class GitHubClient:
     """
     GitHub API client for fetching team workload data.
     
     Usage:
-        client = GitHubClient(token="ghp_xxx", org="mycompany")
-        workloads = await client.get_team_workload(team="engineering")
+        async with GitHubClient(token="ghp_xxx", org="mycompany") as client:
+            workloads = await client.get_team_workload(team="engineering")
     """
     
     BASE_URL = "https://api.github.com"
     
+    # Org and team membership rarely changes, so it is cached longer
+    MEMBERS_CACHE_TTL = 3600
+    
+    # Most GET responses remembered for conditional requests
+    ETAG_CACHE_SIZE = 512
+    
     def __init__(
         self,
         token: Optional[str] = None,
         org: Optional[str] = None,
-        repos: Optional[list[str]] = None
+        repos: Optional[list[str]] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        max_concurrency: Optional[int] = None,
+        cache_ttl: Optional[float] = None
     ):
         self.token = token or os.getenv("GITHUB_TOKEN")
         self.org = org or os.getenv("GITHUB_ORG")
         self.repos = repos or []
+        # Optional shared, pooled client (owned and closed by the caller)
+        self.http_client = http_client
+        self._owns_client = False
+        # Caps in-flight requests, since team and repo fetches fan out concurrently
+        self._semaphore = asyncio.Semaphore(
+            max_concurrency or int(os.getenv("GITHUB_MAX_CONCURRENCY", "10"))
+        )
+        # repo -> (owner, name), filled as repos are first used
+        self._repo_parts: dict[str, tuple[str, str]] = {}
+        for repo in self.repos:
+            self._split_repo(repo)
+        # Recent results, so repeated team queries within the TTL skip the API
+        self._cache = TTLCache(
+            cache_ttl if cache_ttl is not None else float(os.getenv("GITHUB_CACHE_TTL", "300"))
+        )
+        # (endpoint, params) -> (ETag, decoded result) of the last response that
+        # carried an ETag; revalidated with If-None-Match, and a 304 (which is
+        # free against the rate limit) reuses the result
+        self._etag_results: dict[tuple, tuple[str, Any]] = {}
         
         if not self.token:
             raise ValueError("GitHub token required. Set GITHUB_TOKEN env var or pass token parameter.")
@@ -123,33 +240,159 @@ class GitHubClient:
             "X-GitHub-Api-Version": "2022-11-28"
         }
     
-    async def _request(self, endpoint: str, params: Optional[dict] = None) -> dict:
-        """Make authenticated request to GitHub API."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
+    async def __aenter__(self):
+        if self.http_client is None:
+            self.http_client = httpx.AsyncClient(timeout=30.0)
+            self._owns_client = True
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+    
+    async def aclose(self):
+        """Close the pooled client if this client created it."""
+        if self._owns_client:
+            await self.http_client.aclose()
+            self.http_client = None
+            self._owns_client = False
+    
+    def _split_repo(self, repo: str) -> tuple[str, str]:
+        """Split "repo" or "owner/repo" into (owner, name), once per repo."""
+        parts = self._repo_parts.get(repo)
+        if parts is None:
+            owner = self.org or repo.split("/")[0]
+            repo_name = repo if "/" not in repo else repo.split("/")[1]
+            parts = self._repo_parts[repo] = (owner, repo_name)
+        return parts
+    
+    def _client(self):
+        """Async context yielding the shared client, or a one-off client if none was given."""
+        if self.http_client is not None:
+            return nullcontext(self.http_client)
+        return httpx.AsyncClient()
+    
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        headers: Optional[dict] = None,
+        **kwargs
+    ) -> httpx.Response:
+        """Make one authenticated request to GitHub API (304 Not Modified is not an error)."""
+        async with self._semaphore, self._client() as client:
+            response = await client.request(
+                method,
                 f"{self.BASE_URL}{endpoint}",
-                headers=self.headers,
-                params=params,
-                timeout=30.0
+                headers={**self.headers, **headers} if headers else self.headers,
+                timeout=30.0,
+                **kwargs
             )
-            response.raise_for_status()
-            return response.json()
+            if response.status_code != 304:
+                response.raise_for_status()
+            return response
+    
+    async def _get(
+        self,
+        endpoint: str,
+        params: Optional[dict] = None,
+        decode: Optional[Callable[[httpx.Response], Any]] = None
+    ) -> Any:
+        """
+        Make authenticated GET request to GitHub API, retrying rate limits and 5xx.
+        
+        Returns decode(response), by default the parsed JSON body. Repeats of an
+        earlier request are sent with If-None-Match, and when GitHub answers 304
+        the earlier decoded result is returned instead. Only that result and the
+        ETag are kept, not the response itself.
+        """
+        decode = decode or (lambda response: _json.loads(response.content))
+        key = (endpoint, tuple(sorted((params or {}).items())))
+        cached = self._etag_results.get(key)
+        headers = {"If-None-Match": cached[0]} if cached is not None else None
+        
+        response = await with_retry(
+            lambda: self._send("GET", endpoint, headers=headers, params=params)
+        )
+        if response.status_code == 304 and cached is not None:
+            return cached[1]
+        
+        result = decode(response)
+        etag = response.headers.get("etag")
+        if etag is not None:
+            # Re-insert so the dict stays ordered oldest-first for eviction
+            self._etag_results.pop(key, None)
+            self._etag_results[key] = (etag, result)
+            if len(self._etag_results) > self.ETAG_CACHE_SIZE:
+                del self._etag_results[next(iter(self._etag_results))]
+        return result
+    
+    async def _request(self, endpoint: str, params: Optional[dict] = None) -> dict:
+        """Make authenticated request to GitHub API."""
+        return await self._get(endpoint, params)
+    
+    async def _graphql(self, query: str, variables: Optional[dict] = None) -> dict:
+        """Run a GitHub GraphQL query and return its data."""
+        body = {"query": query, "variables": variables or {}}
+        response = await with_retry(lambda: self._send("POST", "/graphql", json=body))
+        result = _json.loads(response.content)
+        
+        # GraphQL reports query errors in the body of a 200 response
+        if result.get("errors"):
+            raise RuntimeError(f"GitHub GraphQL error: {result['errors'][0].get('message')}")
+        return result["data"]
     
-    async def _paginate(self, endpoint: str, params: Optional[dict] = None) -> list:
-        """Paginate through all results."""
+    async def _paginate(
+        self,
+        endpoint: str,
+        params: Optional[dict] = None,
+        parse: Optional[Callable[[list], list]] = None
+    ) -> list:
+        """
+        Paginate through all results.
+        
+        When the first page's Link header names the last page, the remaining
+        pages are fetched concurrently; otherwise pages are walked in order.
+        If parse is given, each page is passed through it as soon as it is
+        decoded, so only the parsed records (not the raw GitHub objects, which
+        carry dozens of unused fields) are kept across pages and for ETag reuse.
+        """
         params = params or {}
         params["per_page"] = 100
         params["page"] = 1
+        parse = parse or (lambda page: page)
+        
+        def decode(response: httpx.Response) -> tuple[int, list, Optional[str]]:
+            page = _json.loads(response.content)
+            return len(page), parse(page), response.links.get("last", {}).get("url")
+        
+        async def fetch_page(page_params: dict) -> tuple[int, list]:
+            count, results, _ = await self._get(endpoint, page_params, decode)
+            return count, results
+        
+        count, results, last_url = await self._get(endpoint, params, decode)
+        # Copied, since the parsed page may be held for ETag revalidation
+        all_results = list(results)
+        if count < 100:
+            return all_results
+        
+        if last_url:
+            last_page = int(httpx.URL(last_url).params.get("page", 1))
+            pages = await asyncio.gather(*(
+                fetch_page({**params, "page": page})
+                for page in range(2, last_page + 1)
+            ))
+            for _, results in pages:
+                all_results.extend(results)
+            return all_results
         
-        all_results = []
         while True:
-            results = await self._request(endpoint, params)
-            if not results:
+            params["page"] += 1
+            count, results = await fetch_page(params)
+            if not count:
                 break
             all_results.extend(results)
-            if len(results) < 100:
+            if count < 100:
                 break
-            params["page"] += 1
         
         return all_results
     
@@ -158,67 +401,116 @@ class GitHubClient:
         if not self.org:
             raise ValueError("Organization not configured")
         
-        members = await self._paginate(f"/orgs/{self.org}/members")
-        return [m["login"] for m in members]
+        key = ("org_members", self.org)
+        logins = self._cache.get(key)
+        if logins is None:
+            logins = await self._paginate(f"/orgs/{self.org}/members", parse=_parse_logins)
+            self._cache.set(key, logins, self.MEMBERS_CACHE_TTL)
+        return logins
     
     async def get_team_members(self, team_slug: str) -> list[str]:
         """Get members of a specific team."""
-        members = await self._paginate(f"/orgs/{self.org}/teams/{team_slug}/members")
-        return [m["login"] for m in members]
+        key = ("team_members", self.org, team_slug)
+        logins = self._cache.get(key)
+        if logins is None:
+            logins = await self._paginate(
+                f"/orgs/{self.org}/teams/{team_slug}/members", parse=_parse_logins
+            )
+            self._cache.set(key, logins, self.MEMBERS_CACHE_TTL)
+        return logins
     
     async def get_open_prs(self, repo: str) -> list[PullRequest]:
         """Get all open PRs for a repository."""
-        owner = self.org or repo.split("/")[0]
-        repo_name = repo if "/" not in repo else repo.split("/")[1]
+        owner, repo_name = self._split_repo(repo)
         
-        prs_data = await self._paginate(f"/repos/{owner}/{repo_name}/pulls", {"state": "open"})
+        key = ("open_prs", owner, repo_name)
+        prs = self._cache.get(key)
+        if prs is not None:
+            return prs
         
-        prs = []
-        for pr in prs_data:
-            reviewers = [r["login"] for r in pr.get("requested_reviewers", [])]
-            prs.append(PullRequest(
-                number=pr["number"],
-                title=pr["title"],
-                author=pr["user"]["login"],
-                state=pr["state"],
-                created_at=datetime.fromisoformat(pr["created_at"].replace("Z", "+00:00")),
-                updated_at=datetime.fromisoformat(pr["updated_at"].replace("Z", "+00:00")),
-                reviewers=reviewers,
-                additions=pr.get("additions", 0),
-                deletions=pr.get("deletions", 0)
-            ))
+        prs = await self._paginate(
+            f"/repos/{owner}/{repo_name}/pulls", {"state": "open"}, parse=_parse_prs
+        )
         
+        self._cache.set(key, prs)
         return prs
     
     async def get_assigned_issues(self, repo: str, assignee: str) -> list[Issue]:
         """Get open issues assigned to a user."""
-        owner = self.org or repo.split("/")[0]
-        repo_name = repo if "/" not in repo else repo.split("/")[1]
+        owner, repo_name = self._split_repo(repo)
         
-        issues_data = await self._paginate(
+        return await self._paginate(
             f"/repos/{owner}/{repo_name}/issues",
-            {"state": "open", "assignee": assignee}
+            {"state": "open", "assignee": assignee},
+            parse=lambda page: _parse_issues(page, assignee)
         )
+    
+    async def get_all_assigned_issues(self, repo: str) -> dict[str, list[Issue]]:
+        """
+        Get open issues in a repository grouped by assignee login.
         
-        # Filter out PRs (they show up as issues too)
-        issues = []
-        for issue in issues_data:
-            if "pull_request" not in issue:
-                issues.append(Issue(
-                    number=issue["number"],
-                    title=issue["title"],
-                    assignee=assignee,
-                    state=issue["state"],
-                    labels=[l["name"] for l in issue.get("labels", [])],
-                    created_at=datetime.fromisoformat(issue["created_at"].replace("Z", "+00:00"))
-                ))
+        GitHub logins are case-insensitive, so the groups are keyed by the
+        casefolded login.
+        """
+        owner, repo_name = self._split_repo(repo)
+        
+        key = ("assigned_issues", owner, repo_name)
+        by_assignee = self._cache.get(key)
+        if by_assignee is not None:
+            return by_assignee
+        
+        issues = await self._paginate(
+            f"/repos/{owner}/{repo_name}/issues",
+            {"state": "open", "assignee": "*"},
+            parse=_parse_issues
+        )
         
-        return issues
+        by_assignee = {}
+        for issue in issues:
+            by_assignee.setdefault(issue.assignee.casefold(), []).append(issue)
+        
+        self._cache.set(key, by_assignee)
+        return by_assignee
     
     async def get_pending_reviews(self, repo: str, reviewer: str) -> list[PullRequest]:
-        """Get PRs waiting for review from a specific user."""
-        all_prs = await self.get_open_prs(repo)
-        return [pr for pr in all_prs if reviewer in pr.reviewers]
+        """
+        Get PRs waiting for review from a specific user.
+        
+        Filters the cached open-PR list when there is one; otherwise asks the
+        search API for just the matching PRs instead of listing every open PR.
+        Search results carry no diff stats, so additions/deletions are 0.
+        """
+        owner, repo_name = self._split_repo(repo)
+        
+        all_prs = self._cache.get(("open_prs", owner, repo_name))
+        if all_prs is not None:
+            return [pr for pr in all_prs if reviewer in pr.reviewers]
+        
+        params = {
+            "q": f"is:open is:pr review-requested:{reviewer} repo:{owner}/{repo_name}",
+            "per_page": 100,
+            "page": 1
+        }
+        
+        prs = []
+        while True:
+            result = await self._request("/search/issues", params)
+            items = result.get("items", [])
+            for item in items:
+                prs.append(PullRequest(
+                    number=item["number"],
+                    title=item["title"],
+                    author=item["user"]["login"],
+                    state=item["state"],
+                    created_at=datetime.fromisoformat(item["created_at"]),
+                    updated_at=datetime.fromisoformat(item["updated_at"]),
+                    reviewers=[reviewer]
+                ))
+            if len(items) < 100 or len(prs) >= result.get("total_count", 0):
+                break
+            params["page"] += 1
+        
+        return prs
     
     async def get_recent_commits(
         self,
@@ -227,24 +519,54 @@ class GitHubClient:
         since_days: int = 7
     ) -> int:
         """Count commits by author in recent days."""
-        owner = self.org or repo.split("/")[0]
-        repo_name = repo if "/" not in repo else repo.split("/")[1]
+        owner, repo_name = self._split_repo(repo)
         since = (datetime.now() - timedelta(days=since_days)).isoformat()
         
+        # Only the count is needed, so keep no part of each commit object
         commits = await self._paginate(
             f"/repos/{owner}/{repo_name}/commits",
-            {"author": author, "since": since}
+            {"author": author, "since": since},
+            parse=lambda page: [None] * len(page)
         )
         
         return len(commits)
     
-    async def get_user_workload(self, username: str, repos: Optional[list[str]] = None) -> GitHubUser:
+    async def _open_prs(
+        self,
+        repo: str,
+        prefetched: Optional[dict[str, list[PullRequest]]]
+    ) -> list[PullRequest]:
+        """Open PRs for repo, from prefetched when present."""
+        if prefetched is not None and repo in prefetched:
+            return prefetched[repo]
+        return await self.get_open_prs(repo)
+    
+    async def _assigned_issues(
+        self,
+        repo: str,
+        assignee: str,
+        prefetched: Optional[dict[str, dict[str, list[Issue]]]]
+    ) -> list[Issue]:
+        """Open issues in repo assigned to assignee, from prefetched when present."""
+        if prefetched is not None and repo in prefetched:
+            return prefetched[repo].get(assignee.casefold(), [])
+        return await self.get_assigned_issues(repo, assignee)
+    
+    async def get_user_workload(
+        self,
+        username: str,
+        repos: Optional[list[str]] = None,
+        open_prs: Optional[dict[str, list[PullRequest]]] = None,
+        assigned_issues: Optional[dict[str, dict[str, list[Issue]]]] = None
+    ) -> GitHubUser:
         """
         Calculate complete workload for a user across repositories.
         
         Args:
             username: GitHub username
             repos: List of repos to check (defaults to configured repos)
+            open_prs: Already-fetched open PRs by repo; other repos are fetched
+            assigned_issues: Already-fetched issues by repo, then by casefolded assignee
             
         Returns:
             GitHubUser with aggregated workload metrics
@@ -253,23 +575,37 @@ class GitHubClient:
         if not repos:
             raise ValueError("No repositories configured")
         
+        key = ("user_workload", username, tuple(repos))
+        user = self._cache.get(key)
+        if user is not None:
+            return user
+        
         user = GitHubUser(login=username)
         
-        for repo in repos:
+        # The per-repo lookups are independent, so fetch them all at once
+        results = await asyncio.gather(*(
+            asyncio.gather(
+                self._open_prs(repo, open_prs),
+                self._assigned_issues(repo, username, assigned_issues),
+                self.get_recent_commits(repo, username)
+            )
+            for repo in repos
+        ))
+        
+        for all_prs, issues, commits in results:
             # Count open PRs authored by user
-            all_prs = await self.get_open_prs(repo)
-            user.open_prs += len([pr for pr in all_prs if pr.author == username])
+            user.open_prs += sum(1 for pr in all_prs if pr.author == username)
             
             # Count pending reviews
-            user.pending_reviews += len([pr for pr in all_prs if username in pr.reviewers])
+            user.pending_reviews += sum(1 for pr in all_prs if username in pr.reviewers)
             
             # Count assigned issues
-            issues = await self.get_assigned_issues(repo, username)
             user.assigned_issues += len(issues)
             
             # Count recent commits
-            user.recent_commits += await self.get_recent_commits(repo, username)
+            user.recent_commits += commits
         
+        self._cache.set(key, user)
         return user
     
     async def get_team_workload(
@@ -294,10 +630,21 @@ class GitHubClient:
         elif not members:
             members = await self.get_org_members()
         
-        workloads = []
-        for member in members:
-            user = await self.get_user_workload(member, repos)
-            workloads.append(user)
+        # Every member's PR and issue counts come from the same per-repo
+        # listings, so fetch each repo once up front rather than once per member
+        repos = repos or self.repos
+        open_prs = assigned_issues = None
+        if repos and members:
+            pr_lists, issue_groups = await asyncio.gather(
+                asyncio.gather(*(self.get_open_prs(repo) for repo in repos)),
+                asyncio.gather(*(self.get_all_assigned_issues(repo) for repo in repos))
+            )
+            open_prs = dict(zip(repos, pr_lists))
+            assigned_issues = dict(zip(repos, issue_groups))
+        
+        workloads = await asyncio.gather(
+            *(self.get_user_workload(member, repos, open_prs, assigned_issues) for member in members)
+        )
         
         # Sort by workload score descending
         workloads.sort(key=lambda u: u.workload_score, reverse=True)
@@ -313,36 +660,53 @@ class GitHubClient:
         - Average time to merge
         - Review distribution by person
         """
-        owner = self.org or repo.split("/")[0]
-        repo_name = repo if "/" not in repo else repo.split("/")[1]
-        since = (datetime.now() - timedelta(days=days)).isoformat()
-        
-        # Get recently merged PRs
-        prs = await self._paginate(
-            f"/repos/{owner}/{repo_name}/pulls",
-            {"state": "closed", "sort": "updated", "direction": "desc"}
-        )
+        owner, repo_name = self._split_repo(repo)
+        # GitHub timestamps are fixed-width UTC ("2024-01-02T03:04:05Z"), so they
+        # order correctly as strings and the window checks need no parsing
+        since = (datetime.now(timezone.utc) - timedelta(days=days)).strftime("%Y-%m-%dT%H:%M:%SZ")
         
-        review_times = []
         merge_times = []
         reviewer_counts = {}
         
-        for pr in prs:
-            if not pr.get("merged_at"):
-                continue
-                
-            created = datetime.fromisoformat(pr["created_at"].replace("Z", "+00:00"))
-            merged = datetime.fromisoformat(pr["merged_at"].replace("Z", "+00:00"))
-            
-            if created < datetime.fromisoformat(since.replace("Z", "+00:00") if "Z" in since else since + "+00:00"):
-                continue
+        # Merged PRs newest-updated first, with their reviews, via GraphQL
+        cursor = None
+        while True:
+            data = await self._graphql(
+                _PR_REVIEW_STATS_QUERY,
+                {"owner": owner, "name": repo_name, "cursor": cursor}
+            )
+            pull_requests = data["repository"]["pullRequests"]
             
-            merge_times.append((merged - created).total_seconds() / 3600)  # hours
+            reached_window_end = False
+            for pr in pull_requests["nodes"]:
+                # A PR created in the window was updated in it too, so once
+                # updates fall before the window every remaining PR is older
+                if pr["updatedAt"] < since:
+                    reached_window_end = True
+                    break
+                
+                if pr["createdAt"] < since:
+                    continue
+                
+                # Only PRs inside the window pay for datetime parsing
+                created = datetime.fromisoformat(pr["createdAt"])
+                merged = datetime.fromisoformat(pr["mergedAt"])
+                
+                merge_times.append((merged - created).total_seconds() / 3600)  # hours
+                
+                # Count each reviewer once per PR
+                reviewers = {
+                    review["author"]["login"]
+                    for review in pr["reviews"]["nodes"]
+                    if review.get("author")
+                }
+                for login in reviewers:
+                    reviewer_counts[login] = reviewer_counts.get(login, 0) + 1
             
-            # Count reviewers (would need additional API call for full data)
-            for reviewer in pr.get("requested_reviewers", []):
-                login = reviewer["login"]
-                reviewer_counts[login] = reviewer_counts.get(login, 0) + 1
+            page_info = pull_requests["pageInfo"]
+            if reached_window_end or not page_info["hasNextPage"]:
+                break
+            cursor = page_info["endCursor"]
         
         return {
             "avg_merge_time_hours": sum(merge_times) / len(merge_times) if merge_times else 0,
@@ -372,5 +736,5 @@ async def get_github_workload(
         for user in workloads:
             print(f"{user.login}: {user.workload_score}")
     """
-    client = GitHubClient(token=token, org=org, repos=repos)
-    return await client.get_team_workload(team=team)
+    async with GitHubClient(token=token, org=org, repos=repos) as client:
+        return await client.get_team_workload(team=team)
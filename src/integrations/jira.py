@@ -4,6 +4,9 @@ Jira Integration for Team Capacity Planner
 Pulls tickets, sprints, and story points from Jira.
 """
 
+import asyncio
+import base64
+import logging
 import os
 from datetime import datetime, timedelta
 from typing import Optional
@@ -12,6 +15,15 @@ from enum import Enum
 
 import httpx
 
+from .. import _json
+from ._ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+# Lowercased statuses that count a ticket as finished
+_DONE_STATUSES = frozenset({"done", "closed", "resolved"})
+
 
 class TicketStatus(Enum):
     """Standard Jira ticket statuses."""
@@ -22,7 +34,7 @@ class TicketStatus(Enum):
     BLOCKED = "Blocked"
 
 
-@dataclass
+@dataclass(slots=True)
 class JiraTicket:
     """Represents a Jira ticket/issue."""
     key: str
@@ -38,20 +50,20 @@ class JiraTicket:
     updated: Optional[datetime] = None
     labels: list[str] = field(default_factory=list)
     
-    @property
-    def is_done(self) -> bool:
-        return self.status.lower() in ["done", "closed", "resolved"]
-    
-    @property
-    def is_in_progress(self) -> bool:
-        return "progress" in self.status.lower()
+    # Status flags, derived once from status and labels at construction since
+    # workload, burndown and prediction code each read them for every ticket
+    is_done: bool = field(init=False, repr=False, compare=False)
+    is_in_progress: bool = field(init=False, repr=False, compare=False)
+    is_blocked: bool = field(init=False, repr=False, compare=False)
     
-    @property
-    def is_blocked(self) -> bool:
-        return "blocked" in self.status.lower() or "blocked" in [l.lower() for l in self.labels]
+    def __post_init__(self):
+        status = self.status.lower()
+        self.is_done = status in _DONE_STATUSES
+        self.is_in_progress = "progress" in status
+        self.is_blocked = "blocked" in status or any(l.lower() == "blocked" for l in self.labels)
 
 
-@dataclass
+@dataclass(slots=True)
 class Sprint:
     """Represents a Jira Sprint."""
     id: int
@@ -67,22 +79,41 @@ class Sprint:
     
     @property
     def days_remaining(self) -> int:
-        if not self.end_date:
-            return 0
-        return max(0, (self.end_date - datetime.now()).days)
+        return self.days_remaining_at(self.now())
     
     @property
     def progress_percentage(self) -> float:
         """How far through the sprint are we."""
+        return self.progress_percentage_at(self.now())
+    
+    def now(self) -> datetime:
+        """
+        Current time in the sprint's timezone.
+        
+        Jira reports sprint dates with a UTC offset, so comparing them with a
+        naive datetime.now() would raise; sprints built with naive dates get a
+        naive now.
+        """
+        reference = self.end_date or self.start_date
+        return datetime.now(reference.tzinfo if reference else None)
+    
+    def days_remaining_at(self, now: datetime) -> int:
+        """Days left in the sprint as of now (from Sprint.now())."""
+        if not self.end_date:
+            return 0
+        return max(0, (self.end_date - now).days)
+    
+    def progress_percentage_at(self, now: datetime) -> float:
+        """How far through the sprint we are as of now (from Sprint.now())."""
         if not self.start_date or not self.end_date:
             return 0
         
         total = (self.end_date - self.start_date).days
-        elapsed = (datetime.now() - self.start_date).days
+        elapsed = (now - self.start_date).days
         return min(100, max(0, (elapsed / total) * 100))
 
 
-@dataclass
+@dataclass(slots=True)
 class JiraUser:
     """Jira user with workload data."""
     account_id: str
@@ -90,49 +121,108 @@ class JiraUser:
     email: Optional[str] = None
     assigned_tickets: list[JiraTicket] = field(default_factory=list)
     
+    def _ticket_stats(self) -> tuple[float, int, int]:
+        """Story points, in-progress count and blocked count, in one pass."""
+        points = in_progress = blocked = 0
+        for t in self.assigned_tickets:
+            points += t.story_points or 0
+            in_progress += t.is_in_progress
+            blocked += t.is_blocked
+        return points, in_progress, blocked
+    
     @property
     def total_story_points(self) -> float:
         """Sum of story points for assigned tickets."""
-        return sum(t.story_points or 0 for t in self.assigned_tickets)
+        return self._ticket_stats()[0]
     
     @property
     def tickets_in_progress(self) -> int:
-        return len([t for t in self.assigned_tickets if t.is_in_progress])
+        return self._ticket_stats()[1]
     
     @property
     def tickets_blocked(self) -> int:
-        return len([t for t in self.assigned_tickets if t.is_blocked])
+        return self._ticket_stats()[2]
     
     @property
     def workload_score(self) -> float:
         """Calculate workload score from Jira activity."""
+        points, in_progress, blocked = self._ticket_stats()
         return (
-            self.total_story_points * 1.0 +
-            self.tickets_in_progress * 2.0 +
-            self.tickets_blocked * 3.0  # Blocked items are stressful!
+            points * 1.0 +
+            in_progress * 2.0 +
+            blocked * 3.0  # Blocked items are stressful!
         )
 
 
+def _jql_quote(value: str) -> str:
+    """Quote a value as a JQL string literal."""
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def _parse_ticket(issue: dict) -> JiraTicket:
+    """Build a JiraTicket from a /search result issue."""
+    fields = issue["fields"]
+    
+    # Extract sprint info if available
+    sprint_data = fields.get("sprint") or (fields.get("sprint") or [None])[0] if isinstance(fields.get("sprint"), list) else None
+    
+    assignee = fields.get("assignee")
+    
+    return JiraTicket(
+        key=issue["key"],
+        summary=fields.get("summary", ""),
+        status=fields["status"]["name"],
+        assignee=assignee["displayName"] if assignee else None,
+        story_points=fields.get("customfield_10016"),  # Story points field
+        issue_type=fields["issuetype"]["name"] if fields.get("issuetype") else "Task",
+        priority=fields["priority"]["name"] if fields.get("priority") else "Medium",
+        sprint_id=sprint_data["id"] if sprint_data else None,
+        sprint_name=sprint_data["name"] if sprint_data else None,
+        labels=fields.get("labels", []),
+        created=datetime.fromisoformat(fields["created"]) if fields.get("created") else None,
+        updated=datetime.fromisoformat(fields["updated"]) if fields.get("updated") else None
+    )
+
+
 class JiraClient:
     """
     Jira Cloud API client for fetching sprint and ticket data.
     
     Usage:
-        client = JiraClient(
+        async with JiraClient(
             url="https://company.atlassian.net",
             email="user@company.com",
             token="api_token"
-        )
-        sprint = await client.get_active_sprint("PROJ")
-        tickets = await client.get_sprint_tickets(sprint.id)
+        ) as client:
+            sprint = await client.get_active_sprint("PROJ")
+            tickets = await client.get_sprint_tickets(sprint.id)
     """
     
+    # Tickets requested per /search call; fewer, larger pages mean fewer round trips
+    SEARCH_BATCH_SIZE = 500
+    
+    SEARCH_FIELDS = (
+        "summary,status,assignee,customfield_10016,issuetype,priority,labels,sprint,created,updated"
+    )
+    
+    # Enough for point totals and done/in-progress/blocked counts
+    POINTS_FIELDS = "status,customfield_10016,labels"
+    
+    # Closed sprints' point totals are final, so velocity history caches them for a day
+    CLOSED_SPRINT_CACHE_TTL = 86400
+    
+    # Set once the server is seen capping the page size, so the warning is logged once
+    _warned_batch_cap = False
+    
     def __init__(
         self,
         url: Optional[str] = None,
         email: Optional[str] = None,
         token: Optional[str] = None,
-        project: Optional[str] = None
+        project: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+        max_concurrency: Optional[int] = None,
+        cache_ttl: Optional[float] = None
     ):
         self.url = (url or os.getenv("JIRA_URL", "")).rstrip("/")
         self.email = email or os.getenv("JIRA_EMAIL")
@@ -146,6 +236,61 @@ class JiraClient:
             )
         
         self.auth = (self.email, self.token)
+        # Built once and sent with every request, rather than encoding Basic
+        # auth and allocating fresh headers per call (the client may be shared)
+        credentials = base64.b64encode(f"{self.email}:{self.token}".encode()).decode()
+        self.headers = {
+            "Authorization": f"Basic {credentials}",
+            "Accept": "application/json"
+        }
+        # Optional shared, pooled client (owned and closed by the caller)
+        self.http_client = http_client
+        self._owns_client = False
+        # Caps in-flight requests, since per-user and per-sprint fetches fan out concurrently
+        self.max_concurrency = max_concurrency or int(os.getenv("JIRA_MAX_CONCURRENCY", "10"))
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        # Boards and the active sprint rarely change, so lookups within the TTL skip the API
+        self._cache = TTLCache(
+            cache_ttl if cache_ttl is not None else float(os.getenv("JIRA_CACHE_TTL", "300"))
+        )
+    
+    async def __aenter__(self):
+        self._pooled_client()
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+    
+    async def aclose(self):
+        """Close the pooled client if this client created it."""
+        if self._owns_client:
+            await self.http_client.aclose()
+            self.http_client = None
+            self._owns_client = False
+    
+    def invalidate_cache(self):
+        """Forget cached boards and active sprints, e.g. after starting a new sprint."""
+        self._cache.clear()
+    
+    def _pooled_client(self) -> httpx.AsyncClient:
+        """
+        The shared client, or one this client creates on first use and keeps.
+        
+        Keeping it means every request after the first reuses a kept-alive
+        connection instead of paying a fresh TCP and TLS handshake; call
+        aclose() (or use the client as an async context manager) to release it.
+        """
+        if self.http_client is None:
+            self.http_client = httpx.AsyncClient(
+                timeout=30.0,
+                # Sized to the request cap, with headroom for connections still closing
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency * 2,
+                    max_keepalive_connections=self.max_concurrency
+                )
+            )
+            self._owns_client = True
+        return self.http_client
     
     async def _request(
         self,
@@ -155,18 +300,17 @@ class JiraClient:
         json: Optional[dict] = None
     ) -> dict:
         """Make authenticated request to Jira API."""
-        async with httpx.AsyncClient() as client:
-            response = await client.request(
+        async with self._semaphore:
+            response = await self._pooled_client().request(
                 method,
                 f"{self.url}/rest/api/3{endpoint}",
-                auth=self.auth,
                 params=params,
                 json=json,
-                headers={"Accept": "application/json"},
+                headers=self.headers,
                 timeout=30.0
             )
             response.raise_for_status()
-            return response.json() if response.content else {}
+            return _json.loads(response.content) if response.content else {}
     
     async def _agile_request(
         self,
@@ -175,24 +319,28 @@ class JiraClient:
         params: Optional[dict] = None
     ) -> dict:
         """Make request to Jira Agile API."""
-        async with httpx.AsyncClient() as client:
-            response = await client.request(
+        async with self._semaphore:
+            response = await self._pooled_client().request(
                 method,
                 f"{self.url}/rest/agile/1.0{endpoint}",
-                auth=self.auth,
                 params=params,
-                headers={"Accept": "application/json"},
+                headers=self.headers,
                 timeout=30.0
             )
             response.raise_for_status()
-            return response.json() if response.content else {}
+            return _json.loads(response.content) if response.content else {}
     
     async def get_boards(self, project: Optional[str] = None) -> list[dict]:
         """Get all boards for a project."""
         project = project or self.project
-        params = {"projectKeyOrId": project} if project else {}
-        result = await self._agile_request("GET", "/board", params)
-        return result.get("values", [])
+        key = ("boards", project)
+        boards = self._cache.get(key)
+        if boards is None:
+            params = {"projectKeyOrId": project} if project else {}
+            result = await self._agile_request("GET", "/board", params)
+            boards = result.get("values", [])
+            self._cache.set(key, boards)
+        return boards
     
     async def get_sprints(
         self,
@@ -218,8 +366,8 @@ class JiraClient:
                 id=s["id"],
                 name=s["name"],
                 state=s["state"],
-                start_date=datetime.fromisoformat(s["startDate"].replace("Z", "+00:00")) if s.get("startDate") else None,
-                end_date=datetime.fromisoformat(s["endDate"].replace("Z", "+00:00")) if s.get("endDate") else None,
+                start_date=datetime.fromisoformat(s["startDate"]) if s.get("startDate") else None,
+                end_date=datetime.fromisoformat(s["endDate"]) if s.get("endDate") else None,
                 goal=s.get("goal")
             ))
         
@@ -228,6 +376,12 @@ class JiraClient:
     async def get_active_sprint(self, project: Optional[str] = None) -> Optional[Sprint]:
         """Get the currently active sprint for a project."""
         project = project or self.project
+        key = ("active_sprint", project)
+        cached = self._cache.get(key)
+        if cached is not None:
+            # Stored in a tuple so that "no active sprint" is cached too
+            return cached[0]
+        
         boards = await self.get_boards(project)
         
         if not boards:
@@ -237,84 +391,128 @@ class JiraClient:
         board_id = boards[0]["id"]
         sprints = await self.get_sprints(board_id, state="active")
         
-        return sprints[0] if sprints else None
+        sprint = sprints[0] if sprints else None
+        self._cache.set(key, (sprint,))
+        return sprint
     
     async def get_sprint_tickets(
         self,
         sprint_id: int,
-        include_done: bool = True
+        include_done: bool = True,
+        fields: Optional[str] = None
     ) -> list[JiraTicket]:
-        """Get all tickets in a sprint."""
+        """Get all tickets in a sprint (fields as for search_tickets)."""
         jql = f"sprint = {sprint_id}"
         if not include_done:
             jql += " AND status != Done"
         
-        return await self.search_tickets(jql)
+        return await self.search_tickets(jql, fields=fields)
+    
+    async def _search_page(self, jql: str, start_at: int, limit: int, fields: str) -> dict:
+        """Fetch one page of /search results."""
+        return await self._request(
+            "GET",
+            "/search",
+            params={
+                "jql": jql,
+                "startAt": start_at,
+                "maxResults": limit,
+                "fields": fields
+            }
+        )
     
     async def search_tickets(
         self,
         jql: str,
-        max_results: int = 100
+        max_results: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        fields: Optional[str] = None
     ) -> list[JiraTicket]:
         """
-        Search for tickets using JQL.
+        Search for tickets using JQL, following pagination.
+        
+        The first page reports the total match count, so the remaining pages
+        are then fetched concurrently (bounded by the client's request cap).
         
         Args:
             jql: Jira Query Language string
-            max_results: Maximum tickets to return
+            max_results: Maximum tickets to return (all matches if None)
+            batch_size: Tickets requested per call (defaults to SEARCH_BATCH_SIZE)
+            fields: Comma-separated Jira fields to return (defaults to
+                SEARCH_FIELDS); fields left out get JiraTicket's defaults
         """
-        result = await self._request(
-            "GET",
-            "/search",
-            params={
-                "jql": jql,
-                "maxResults": max_results,
-                "fields": "summary,status,assignee,customfield_10016,issuetype,priority,labels,sprint,created,updated"
-            }
-        )
+        issues = await self._search_issues(jql, max_results, batch_size, fields)
+        return [_parse_ticket(issue) for issue in issues]
+    
+    async def _search_issues(
+        self,
+        jql: str,
+        max_results: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        fields: Optional[str] = None
+    ) -> list[dict]:
+        """Raw /search result issues for search_tickets."""
+        batch_size = batch_size or self.SEARCH_BATCH_SIZE
+        fields = fields or self.SEARCH_FIELDS
+        limit = batch_size if max_results is None else min(batch_size, max_results)
+        if limit <= 0:
+            return []
         
-        tickets = []
-        for issue in result.get("issues", []):
-            fields = issue["fields"]
-            
-            # Extract sprint info if available
-            sprint_data = fields.get("sprint") or (fields.get("sprint") or [None])[0] if isinstance(fields.get("sprint"), list) else None
-            
-            assignee = fields.get("assignee")
-            
-            tickets.append(JiraTicket(
-                key=issue["key"],
-                summary=fields["summary"],
-                status=fields["status"]["name"],
-                assignee=assignee["displayName"] if assignee else None,
-                story_points=fields.get("customfield_10016"),  # Story points field
-                issue_type=fields["issuetype"]["name"],
-                priority=fields["priority"]["name"] if fields.get("priority") else "Medium",
-                sprint_id=sprint_data["id"] if sprint_data else None,
-                sprint_name=sprint_data["name"] if sprint_data else None,
-                labels=fields.get("labels", []),
-                created=datetime.fromisoformat(fields["created"].replace("Z", "+00:00")) if fields.get("created") else None,
-                updated=datetime.fromisoformat(fields["updated"].replace("Z", "+00:00")) if fields.get("updated") else None
-            ))
+        result = await self._search_page(jql, 0, limit, fields)
+        issues = result.get("issues", [])
+        wanted = result.get("total", 0)
+        if max_results is not None:
+            wanted = min(wanted, max_results)
+        if not issues or len(issues) >= wanted:
+            return issues[:wanted]
+        
+        # Jira silently caps maxResults (commonly at 100); page by what it allows
+        page_size = min(result.get("maxResults", limit), len(issues))
+        if page_size < limit and not self._warned_batch_cap:
+            logger.warning("Jira capped search page size at %d (asked for %d)", page_size, limit)
+            self._warned_batch_cap = True
+        
+        pages = await asyncio.gather(*(
+            self._search_page(jql, start_at, min(page_size, wanted - start_at), fields)
+            for start_at in range(len(issues), wanted, page_size)
+        ))
+        # Offset pages can overlap if issues change while they are fetched, so
+        # keep only the first copy of each issue key
+        seen = {issue["key"] for issue in issues}
+        for page in pages:
+            for issue in page.get("issues", []):
+                if issue["key"] not in seen:
+                    seen.add(issue["key"])
+                    issues.append(issue)
         
-        return tickets
+        return issues
     
-    async def get_user_tickets(
+    def _assigned_jql(
         self,
-        user: str,
-        project: Optional[str] = None,
-        include_done: bool = False
-    ) -> list[JiraTicket]:
-        """Get tickets assigned to a specific user."""
+        assignee_clause: str,
+        project: Optional[str],
+        include_done: bool
+    ) -> str:
+        """JQL for tickets matching an assignee clause, with the usual filters."""
         project = project or self.project
-        jql = f'assignee = "{user}"'
+        clauses = [assignee_clause]
         
         if project:
-            jql += f" AND project = {project}"
+            clauses.append(f"project = {project}")
         
         if not include_done:
-            jql += " AND status != Done"
+            clauses.append("status != Done")
         
+        return " AND ".join(clauses)
+    
+    async def get_user_tickets(
+        self,
+        user: str,
+        project: Optional[str] = None,
+        include_done: bool = False
+    ) -> list[JiraTicket]:
+        """Get tickets assigned to a specific user."""
+        jql = self._assigned_jql(f"assignee = {_jql_quote(user)}", project, include_done)
         return await self.search_tickets(jql)
     
     async def get_team_workload(
@@ -325,21 +523,67 @@ class JiraClient:
         """
         Get workload data for a list of users.
         
+        All users' tickets come from one `assignee in (...)` search and are
+        split up by assignee here, instead of one search per user. Users that
+        no returned assignee field identifies fall back to their own search.
+        
         Args:
             users: List of user display names or account IDs
             project: Optional project filter
         """
-        workloads = []
+        if not users:
+            return []
+        
+        assignees = ", ".join(_jql_quote(user) for user in users)
+        jql = self._assigned_jql(f"assignee in ({assignees})", project, include_done=False)
+        issues = await self._search_issues(jql)
         
+        # Match each ticket back to the requested name, whichever identifier it was
+        by_identifier = {}
         for user in users:
-            tickets = await self.get_user_tickets(user, project)
-            
-            jira_user = JiraUser(
+            by_identifier.setdefault(user.lower(), user)
+        tickets_by_user = {user: [] for user in users}
+        unmatched = set()
+        for issue in issues:
+            assignee = issue["fields"].get("assignee") or {}
+            for identifier in (
+                assignee.get("displayName"),
+                assignee.get("accountId"),
+                assignee.get("emailAddress"),
+                assignee.get("name")
+            ):
+                user = by_identifier.get(identifier.lower()) if identifier else None
+                if user is not None:
+                    tickets_by_user[user].append(_parse_ticket(issue))
+                    break
+            else:
+                unmatched.add(issue["key"])
+        
+        if unmatched:
+            # Jira resolved some requested identifier to an account whose returned
+            # fields don't include it (e.g. an email hidden by privacy settings), so
+            # ask per user for those who matched nothing
+            missing = [user for user in users if not tickets_by_user[user]]
+            results = await asyncio.gather(
+                *(self.get_user_tickets(user, project) for user in missing)
+            )
+            for user, tickets in zip(missing, results):
+                tickets_by_user[user] = tickets
+                unmatched.difference_update(t.key for t in tickets)
+            if unmatched:
+                logger.warning(
+                    "%d Jira issues matched no requested user: %s",
+                    len(unmatched), ", ".join(sorted(unmatched))
+                )
+        
+        workloads = [
+            JiraUser(
                 account_id=user,  # Ideally would look up actual account ID
                 display_name=user,
-                assigned_tickets=tickets
+                assigned_tickets=tickets_by_user[user]
             )
-            workloads.append(jira_user)
+            for user in users
+        ]
         
         # Sort by workload score descending
         workloads.sort(key=lambda u: u.workload_score, reverse=True)
@@ -353,11 +597,22 @@ class JiraClient:
         Returns:
             Dictionary with daily progress data
         """
-        tickets = await self.get_sprint_tickets(sprint_id)
+        tickets = await self.get_sprint_tickets(sprint_id, fields=self.POINTS_FIELDS)
         
-        total_points = sum(t.story_points or 0 for t in tickets)
-        done_points = sum(t.story_points or 0 for t in tickets if t.is_done)
-        in_progress_points = sum(t.story_points or 0 for t in tickets if t.is_in_progress)
+        # One pass, checking each ticket's status flags once
+        total_points = done_points = in_progress_points = 0
+        tickets_done = tickets_in_progress = tickets_blocked = 0
+        for t in tickets:
+            points = t.story_points or 0
+            total_points += points
+            if t.is_done:
+                done_points += points
+                tickets_done += 1
+            if t.is_in_progress:
+                in_progress_points += points
+                tickets_in_progress += 1
+            if t.is_blocked:
+                tickets_blocked += 1
         
         return {
             "total_points": total_points,
@@ -366,11 +621,31 @@ class JiraClient:
             "remaining_points": total_points - done_points,
             "completion_percentage": (done_points / total_points * 100) if total_points > 0 else 0,
             "tickets_total": len(tickets),
-            "tickets_done": len([t for t in tickets if t.is_done]),
-            "tickets_in_progress": len([t for t in tickets if t.is_in_progress]),
-            "tickets_blocked": len([t for t in tickets if t.is_blocked])
+            "tickets_done": tickets_done,
+            "tickets_in_progress": tickets_in_progress,
+            "tickets_blocked": tickets_blocked
         }
     
+    async def _closed_sprint_points(self, sprint_id: int) -> tuple[float, float]:
+        """(committed, completed) story points of a closed sprint."""
+        key = ("closed_sprint_points", sprint_id)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        
+        tickets = await self.get_sprint_tickets(sprint_id, fields=self.POINTS_FIELDS)
+        committed_points = completed_points = 0
+        for t in tickets:
+            points = t.story_points or 0
+            committed_points += points
+            if t.is_done:
+                completed_points += points
+        
+        # Kept longer than other lookups, unless caching is turned off
+        totals = (committed_points, completed_points)
+        self._cache.set(key, totals, self.CLOSED_SPRINT_CACHE_TTL if self._cache.ttl > 0 else 0)
+        return totals
+    
     async def get_velocity_history(
         self,
         project: Optional[str] = None,
@@ -394,12 +669,13 @@ class JiraClient:
         # Get most recent sprints
         sprints = sorted(sprints, key=lambda s: s.end_date or datetime.min, reverse=True)[:num_sprints]
         
+        # Sprint ticket searches are independent, so run them all at once
+        points_per_sprint = await asyncio.gather(
+            *(self._closed_sprint_points(sprint.id) for sprint in sprints)
+        )
+        
         velocity_data = []
-        for sprint in sprints:
-            tickets = await self.get_sprint_tickets(sprint.id)
-            completed_points = sum(t.story_points or 0 for t in tickets if t.is_done)
-            committed_points = sum(t.story_points or 0 for t in tickets)
-            
+        for sprint, (committed_points, completed_points) in zip(sprints, points_per_sprint):
             velocity_data.append({
                 "sprint_name": sprint.name,
                 "sprint_id": sprint.id,
@@ -435,5 +711,5 @@ async def get_jira_workload(
         for user in workloads:
             print(f"{user.display_name}: {user.total_story_points} points")
     """
-    client = JiraClient(url=url, email=email, token=token, project=project)
-    return await client.get_team_workload(users, project)
+    async with JiraClient(url=url, email=email, token=token, project=project) as client:
+        return await client.get_team_workload(users, project)
@@ -5,11 +5,17 @@ Uses historical data and current progress to predict sprint outcomes.
 """
 
 import math
+import statistics
+import heapq
+from bisect import bisect_right
 from dataclasses import dataclass, field
+from functools import lru_cache
+from operator import attrgetter
 from datetime import datetime, date, timedelta
 from typing import Optional
-from enum import Enum
+from enum import Enum, IntFlag
 
+from . import _json
 from .integrations import Sprint, JiraTicket
 
 
@@ -21,9 +27,31 @@ class RiskLevel(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+class RiskFlag(IntFlag):
+    """Machine-readable counterparts of TicketRisk.risk_factors."""
+    BLOCKED = 1
+    UNASSIGNED = 2
+    NOT_STARTED = 4
+    LARGE_LATE = 8
+
+
+_SEVERE_RISK_LEVELS = frozenset({RiskLevel.HIGH, RiskLevel.CRITICAL})
+
+# Lower bounds of each ticket risk score band above LOW
+_RISK_THRESHOLDS = (40, 60, 80)
+_RISK_BANDS = (RiskLevel.LOW, RiskLevel.MEDIUM, RiskLevel.HIGH, RiskLevel.CRITICAL)
+
+# Lowercased statuses of tickets nobody has started yet
+_NOT_STARTED_STATUSES = frozenset({"to do", "backlog", "open"})
+# Of those, the ones worth suggesting for descoping
+_DESCOPABLE_STATUSES = frozenset({"to do", "backlog"})
+
+_INV_SQRT2 = 1 / math.sqrt(2)
+
+
+@dataclass(frozen=True, slots=True)
 class VelocityStats:
-    """Historical velocity statistics."""
+    """Historical velocity statistics (frozen, since computed stats are cached and shared)."""
     average: float
     median: float
     std_dev: float
@@ -39,7 +67,7 @@ class VelocityStats:
         return (max(0, self.average - margin), self.average + margin)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TicketRisk:
     """Risk assessment for a single ticket."""
     ticket_key: str
@@ -49,16 +77,11 @@ class TicketRisk:
     risk_score: float  # 0-100
     risk_factors: list[str] = field(default_factory=list)
     recommendation: Optional[str] = None
+    risk_flags: int = 0  # RiskFlag bits
     
     @property
     def risk_level(self) -> RiskLevel:
-        if self.risk_score >= 80:
-            return RiskLevel.CRITICAL
-        elif self.risk_score >= 60:
-            return RiskLevel.HIGH
-        elif self.risk_score >= 40:
-            return RiskLevel.MEDIUM
-        return RiskLevel.LOW
+        return _RISK_BANDS[bisect_right(_RISK_THRESHOLDS, self.risk_score)]
     
     def to_dict(self) -> dict:
         return {
@@ -73,7 +96,7 @@ class TicketRisk:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SprintPrediction:
     """Sprint completion prediction."""
     sprint_name: str
@@ -101,6 +124,10 @@ class SprintPrediction:
     # Recommendations
     recommendations: list[str] = field(default_factory=list)
     
+    # Every at-risk ticket, in ticket order (at_risk_tickets keeps the top 5);
+    # set by SprintPredictor.predict so what-if scenarios can build on it
+    _all_risks: Optional[list[TicketRisk]] = field(default=None, init=False, repr=False, compare=False)
+    
     @property
     def on_track(self) -> bool:
         """Is sprint on track to complete?"""
@@ -140,9 +167,13 @@ class SprintPrediction:
             "recommendations": self.recommendations,
             "predicted_at": self.predicted_at.isoformat()
         }
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize to JSON bytes (via orjson when available)."""
+        return _json.dumps(self.to_dict())
 
 
-@dataclass
+@dataclass(slots=True)
 class WhatIfScenario:
     """What-if scenario analysis."""
     scenario_name: str
@@ -162,6 +193,62 @@ class WhatIfScenario:
             "original": self.original_prediction.to_dict(),
             "modified": self.modified_prediction.to_dict()
         }
+    
+    def to_json_bytes(self) -> bytes:
+        """Serialize to JSON bytes (via orjson when available)."""
+        return _json.dumps(self.to_dict())
+
+
+@lru_cache(maxsize=32)
+def _velocity_stats(points: tuple[float, ...]) -> VelocityStats:
+    """Velocity statistics for a sequence of completed-points values."""
+    if not points:
+        return VelocityStats(
+            average=0, median=0, std_dev=0, min=0, max=0,
+            trend="unknown", sprints_analyzed=0
+        )
+    
+    n = len(points)
+    
+    # Basic stats; the sorted copy also gives min and max
+    total = math.fsum(points)
+    average = total / n
+    sorted_points = sorted(points)
+    median = sorted_points[n // 2] if n % 2 == 1 else (sorted_points[n//2 - 1] + sorted_points[n//2]) / 2
+    
+    # Population standard deviation
+    std_dev = statistics.pstdev(points, average)
+    
+    # Trend (compare first half to second half)
+    if n >= 4:
+        half = n // 2
+        first_half_total = sum(points[:half])
+        first_half_avg = first_half_total / half
+        second_half_avg = (total - first_half_total) / (n - half)
+        
+        if second_half_avg > first_half_avg * 1.1:
+            trend = "improving"
+        elif second_half_avg < first_half_avg * 0.9:
+            trend = "declining"
+        else:
+            trend = "stable"
+    else:
+        trend = "unknown"
+    
+    return VelocityStats(
+        average=average,
+        median=median,
+        std_dev=std_dev,
+        min=sorted_points[0],
+        max=sorted_points[-1],
+        trend=trend,
+        sprints_analyzed=n
+    )
+
+
+def _top_risks(at_risk_tickets: list[TicketRisk], n: int = 5) -> list[TicketRisk]:
+    """The n highest-risk tickets, highest first (ties keep ticket order)."""
+    return heapq.nlargest(n, at_risk_tickets, key=attrgetter("risk_score"))
 
 
 class SprintPredictor:
@@ -195,47 +282,9 @@ class SprintPredictor:
         Args:
             velocity_history: List of sprint velocity data with 'completed_points'
         """
-        if not velocity_history:
-            return VelocityStats(
-                average=0, median=0, std_dev=0, min=0, max=0,
-                trend="unknown", sprints_analyzed=0
-            )
-        
-        points = [v["completed_points"] for v in velocity_history]
-        n = len(points)
-        
-        # Basic stats
-        average = sum(points) / n
-        sorted_points = sorted(points)
-        median = sorted_points[n // 2] if n % 2 == 1 else (sorted_points[n//2 - 1] + sorted_points[n//2]) / 2
-        
-        # Standard deviation
-        variance = sum((p - average) ** 2 for p in points) / n
-        std_dev = math.sqrt(variance)
-        
-        # Trend (compare first half to second half)
-        if n >= 4:
-            first_half_avg = sum(points[:n//2]) / (n//2)
-            second_half_avg = sum(points[n//2:]) / (n - n//2)
-            
-            if second_half_avg > first_half_avg * 1.1:
-                trend = "improving"
-            elif second_half_avg < first_half_avg * 0.9:
-                trend = "declining"
-            else:
-                trend = "stable"
-        else:
-            trend = "unknown"
-        
-        return VelocityStats(
-            average=average,
-            median=median,
-            std_dev=std_dev,
-            min=min(points),
-            max=max(points),
-            trend=trend,
-            sprints_analyzed=n
-        )
+        # Cached on the points alone, so what-if scenarios over the same
+        # history don't recompute it
+        return _velocity_stats(tuple(v["completed_points"] for v in velocity_history))
     
     def assess_ticket_risk(
         self,
@@ -251,45 +300,78 @@ class SprintPredictor:
             days_remaining: Days left in sprint
             sprint_progress: How far through sprint (0-1)
         """
+        risk_score, risk_flags = self._risk_score(ticket, days_remaining, sprint_progress)
+        return self._ticket_risk(ticket, risk_score, risk_flags, days_remaining, sprint_progress)
+    
+    def _risk_score(
+        self,
+        ticket: JiraTicket,
+        days_remaining: int,
+        sprint_progress: float,
+        reassigned: bool = False
+    ) -> tuple[float, int]:
+        """
+        Uncapped risk score and RiskFlag bits for a ticket, without building any text.
+        
+        A reassigned ticket is scored as blocked and unassigned, whatever it says.
+        """
         risk_score = 0.0
-        risk_factors = []
+        risk_flags = 0
         
         # Not started late in sprint
-        if ticket.status.lower() in ["to do", "backlog", "open"]:
-            if sprint_progress > 0.5:
-                risk_score += 40
-                risk_factors.append("Not started, sprint >50% complete")
-            if sprint_progress > 0.75:
-                risk_score += 20
-                risk_factors.append("Not started, sprint >75% complete")
+        if sprint_progress > 0.5 and ticket.status.lower() in _NOT_STARTED_STATUSES:
+            risk_score += 60 if sprint_progress > 0.75 else 40
+            risk_flags |= RiskFlag.NOT_STARTED
         
         # Large ticket late in sprint
-        if ticket.story_points and ticket.story_points >= 5:
-            if days_remaining < 3:
-                risk_score += 30
-                risk_factors.append(f"Large ticket ({ticket.story_points} points) with {days_remaining} days left")
-            elif days_remaining < 5:
-                risk_score += 15
-                risk_factors.append(f"Large ticket with limited time")
+        if days_remaining < 5 and ticket.story_points and ticket.story_points >= 5:
+            risk_score += 30 if days_remaining < 3 else 15
+            risk_flags |= RiskFlag.LARGE_LATE
         
         # Blocked ticket
-        if ticket.is_blocked:
+        if reassigned or ticket.is_blocked:
             risk_score += 50
-            risk_factors.append("Ticket is blocked")
+            risk_flags |= RiskFlag.BLOCKED
         
         # No assignee
-        if not ticket.assignee:
+        if reassigned or not ticket.assignee:
             risk_score += 20
+            risk_flags |= RiskFlag.UNASSIGNED
+        
+        return risk_score, risk_flags
+    
+    def _ticket_risk(
+        self,
+        ticket: JiraTicket,
+        risk_score: float,
+        risk_flags: int,
+        days_remaining: int,
+        sprint_progress: float
+    ) -> TicketRisk:
+        """Build the TicketRisk (factors and recommendation) for an already scored ticket."""
+        risk_factors = []
+        if risk_flags & RiskFlag.NOT_STARTED:
+            risk_factors.append("Not started, sprint >50% complete")
+            if sprint_progress > 0.75:
+                risk_factors.append("Not started, sprint >75% complete")
+        if risk_flags & RiskFlag.LARGE_LATE:
+            if days_remaining < 3:
+                risk_factors.append(f"Large ticket ({ticket.story_points} points) with {days_remaining} days left")
+            else:
+                risk_factors.append(f"Large ticket with limited time")
+        if risk_flags & RiskFlag.BLOCKED:
+            risk_factors.append("Ticket is blocked")
+        if risk_flags & RiskFlag.UNASSIGNED:
             risk_factors.append("No assignee")
         
         # Generate recommendation
         recommendation = None
         if risk_score >= 60:
-            if ticket.is_blocked:
+            if risk_flags & RiskFlag.BLOCKED:
                 recommendation = "Unblock immediately or move to next sprint"
-            elif not ticket.assignee:
+            elif risk_flags & RiskFlag.UNASSIGNED:
                 recommendation = "Assign to team member with capacity"
-            elif ticket.status.lower() in ["to do", "backlog"]:
+            elif ticket.status.lower() in _DESCOPABLE_STATUSES:
                 recommendation = "Consider descoping to next sprint"
             else:
                 recommendation = "Monitor closely, may need descoping"
@@ -301,34 +383,12 @@ class SprintPredictor:
             status=ticket.status,
             risk_score=min(100, risk_score),
             risk_factors=risk_factors,
-            recommendation=recommendation
+            recommendation=recommendation,
+            risk_flags=risk_flags
         )
     
-    def predict(
-        self,
-        sprint: Sprint,
-        tickets: list[JiraTicket],
-        velocity_history: Optional[list[dict]] = None
-    ) -> SprintPrediction:
-        """
-        Predict sprint completion.
-        
-        Args:
-            sprint: Current sprint
-            tickets: Tickets in the sprint
-            velocity_history: Historical velocity data
-            
-        Returns:
-            SprintPrediction with completion probability and risks
-        """
-        # Calculate points
-        total_points = sum(t.story_points or 0 for t in tickets)
-        completed_points = sum(t.story_points or 0 for t in tickets if t.is_done)
-        in_progress_points = sum(t.story_points or 0 for t in tickets if t.is_in_progress)
-        remaining_points = total_points - completed_points
-        
-        # Calculate time
-        days_remaining = sprint.days_remaining
+    def _sprint_timing(self, sprint: Sprint, days_remaining: int) -> tuple[int, float]:
+        """Days elapsed and progress (0-1) through a sprint with days_remaining left."""
         if sprint.start_date and sprint.end_date:
             total_days = (sprint.end_date - sprint.start_date).days
             days_elapsed = total_days - days_remaining
@@ -336,24 +396,40 @@ class SprintPredictor:
         else:
             days_elapsed = 0
             sprint_progress = 0.5  # Assume midpoint if unknown
-        
-        # Calculate velocity stats
-        velocity_stats = self.calculate_velocity_stats(velocity_history or [])
-        
-        # Predict completion
+        return days_elapsed, sprint_progress
+    
+    def _forecast(
+        self,
+        completed_points: float,
+        total_points: float,
+        remaining_points: float,
+        days_remaining: int,
+        sprint_progress: float,
+        velocity_stats: VelocityStats
+    ) -> tuple[float, float]:
+        """Predicted completed points and completion probability (0-100%)."""
         if velocity_stats.sprints_analyzed >= 3:
             # Use historical velocity
             expected_velocity = velocity_stats.average
             points_per_day = expected_velocity / 10  # Assume 10-day sprint
             predicted_completion = completed_points + (points_per_day * days_remaining)
             
-            # Calculate probability using normal distribution approximation
-            if velocity_stats.std_dev > 0:
-                z_score = (remaining_points - (points_per_day * days_remaining)) / velocity_stats.std_dev
-                # Simplified probability calculation
-                completion_probability = max(0, min(100, 50 - (z_score * 25)))
+            # Model this sprint's velocity as normal with the historical mean and
+            # spread; it completes if the velocity needed for the remaining points
+            # in the days left is reached. This is the exact value a Monte Carlo
+            # over sampled velocities would converge to, without the sampling.
+            if remaining_points <= 0:
+                completion_probability = 100
+            elif days_remaining <= 0:
+                completion_probability = 0
             else:
-                completion_probability = 50
+                needed_velocity = remaining_points * 10 / days_remaining
+                if velocity_stats.std_dev > 0:
+                    z_score = (needed_velocity - expected_velocity) / velocity_stats.std_dev
+                    # P(velocity >= needed) from the normal survival function
+                    completion_probability = 50 * math.erfc(z_score * _INV_SQRT2)
+                else:
+                    completion_probability = 100 if expected_velocity >= needed_velocity else 0
         else:
             # Use linear projection
             if sprint_progress > 0:
@@ -364,21 +440,19 @@ class SprintPredictor:
                 predicted_completion = total_points
                 completion_probability = 50  # Unknown at sprint start
         
-        # Assess ticket risks
-        at_risk_tickets = []
-        for ticket in tickets:
-            if not ticket.is_done:
-                risk = self.assess_ticket_risk(ticket, days_remaining, sprint_progress)
-                if risk.risk_score >= 40:
-                    at_risk_tickets.append(risk)
-        
-        # Sort by risk score
-        at_risk_tickets.sort(key=lambda t: t.risk_score, reverse=True)
-        
+        return predicted_completion, completion_probability
+    
+    def _overall_risk(
+        self,
+        completion_probability: float,
+        at_risk_tickets: list[TicketRisk],
+        velocity_stats: VelocityStats
+    ) -> tuple[RiskLevel, list[str]]:
+        """Sprint risk level and recommendations, given every at-risk ticket (in any order)."""
         # Determine overall risk level
         if completion_probability < 50 or any(t.risk_level == RiskLevel.CRITICAL for t in at_risk_tickets):
             risk_level = RiskLevel.CRITICAL
-        elif completion_probability < 70 or len([t for t in at_risk_tickets if t.risk_level in [RiskLevel.HIGH, RiskLevel.CRITICAL]]) >= 2:
+        elif completion_probability < 70 or len([t for t in at_risk_tickets if t.risk_level in _SEVERE_RISK_LEVELS]) >= 2:
             risk_level = RiskLevel.HIGH
         elif completion_probability < 85:
             risk_level = RiskLevel.MEDIUM
@@ -387,24 +461,87 @@ class SprintPredictor:
         
         # Generate recommendations
         recommendations = []
-        if risk_level in [RiskLevel.HIGH, RiskLevel.CRITICAL]:
+        if risk_level in _SEVERE_RISK_LEVELS:
             if len(at_risk_tickets) > 0:
                 recommendations.append(f"Review {len(at_risk_tickets)} at-risk tickets for descoping")
             
-            blocked = [t for t in at_risk_tickets if "blocked" in " ".join(t.risk_factors).lower()]
+            blocked = sum(1 for t in at_risk_tickets if t.risk_flags & RiskFlag.BLOCKED)
             if blocked:
-                recommendations.append(f"Unblock {len(blocked)} blocked tickets immediately")
+                recommendations.append(f"Unblock {blocked} blocked tickets immediately")
             
-            unassigned = [t for t in at_risk_tickets if "No assignee" in t.risk_factors]
+            unassigned = sum(1 for t in at_risk_tickets if t.risk_flags & RiskFlag.UNASSIGNED)
             if unassigned:
-                recommendations.append(f"Assign {len(unassigned)} unassigned tickets")
+                recommendations.append(f"Assign {unassigned} unassigned tickets")
         
         if velocity_stats.trend == "declining":
             recommendations.append("Team velocity is declining - investigate root cause")
         
-        return SprintPrediction(
+        return risk_level, recommendations
+    
+    def predict(
+        self,
+        sprint: Sprint,
+        tickets: list[JiraTicket],
+        velocity_history: Optional[list[dict]] = None,
+        reassigned: frozenset[str] = frozenset(),
+        predicted_at: Optional[datetime] = None
+    ) -> SprintPrediction:
+        """
+        Predict sprint completion.
+        
+        Args:
+            sprint: Current sprint
+            tickets: Tickets in the sprint
+            velocity_history: Historical velocity data
+            reassigned: Keys of tickets to treat as unassigned and blocked
+            predicted_at: Timestamp to record (defaults to now), so a batch
+                of scenarios can share one clock read
+            
+        Returns:
+            SprintPrediction with completion probability and risks
+        """
+        # Calculate time
+        days_remaining = sprint.days_remaining
+        days_elapsed, sprint_progress = self._sprint_timing(sprint, days_remaining)
+        
+        # Calculate points and assess ticket risks in one pass over the tickets
+        total_points = completed_points = in_progress_points = 0
+        at_risk_tickets = []
+        for t in tickets:
+            points = t.story_points or 0
+            total_points += points
+            if t.is_done:
+                completed_points += points
+                continue
+            if t.is_in_progress:
+                in_progress_points += points
+            # Only tickets that make the cut get their factors and recommendation built
+            risk_score, risk_flags = self._risk_score(
+                t, days_remaining, sprint_progress, t.key in reassigned
+            )
+            if risk_score >= 40:
+                at_risk_tickets.append(
+                    self._ticket_risk(t, risk_score, risk_flags, days_remaining, sprint_progress)
+                )
+        remaining_points = total_points - completed_points
+        
+        # Calculate velocity stats
+        velocity_stats = self.calculate_velocity_stats(velocity_history or [])
+        
+        # Predict completion
+        predicted_completion, completion_probability = self._forecast(
+            completed_points, total_points, remaining_points,
+            days_remaining, sprint_progress, velocity_stats
+        )
+        
+        risk_level, recommendations = self._overall_risk(
+            completion_probability, at_risk_tickets, velocity_stats
+        )
+        
+        prediction = SprintPrediction(
             sprint_name=sprint.name,
             sprint_id=sprint.id,
+            predicted_at=predicted_at or datetime.now(),
             total_points=total_points,
             completed_points=completed_points,
             in_progress_points=in_progress_points,
@@ -415,9 +552,11 @@ class SprintPredictor:
             predicted_completion_points=min(predicted_completion, total_points),
             predicted_remaining_points=max(0, total_points - predicted_completion),
             risk_level=risk_level,
-            at_risk_tickets=at_risk_tickets[:5],  # Top 5 risks
+            at_risk_tickets=_top_risks(at_risk_tickets),
             recommendations=recommendations
         )
+        prediction._all_risks = at_risk_tickets
+        return prediction
     
     def what_if_remove_person(
         self,
@@ -425,7 +564,8 @@ class SprintPredictor:
         person_name: str,
         tickets: list[JiraTicket],
         sprint: Sprint,
-        velocity_history: Optional[list[dict]] = None
+        velocity_history: Optional[list[dict]] = None,
+        predicted_at: Optional[datetime] = None
     ) -> WhatIfScenario:
         """
         Simulate what happens if a person goes on PTO.
@@ -436,35 +576,30 @@ class SprintPredictor:
             tickets: All sprint tickets
             sprint: Sprint data
             velocity_history: Historical velocity
+            predicted_at: Timestamp for the modified prediction (defaults to now)
         """
-        # Filter tickets to exclude person's work (assume unassigned tickets become blocked)
-        person_tickets = [t for t in tickets if t.assignee and person_name.lower() in t.assignee.lower()]
-        
-        # Create modified ticket list
-        modified_tickets = []
-        for ticket in tickets:
-            if ticket in person_tickets and not ticket.is_done:
-                # Mark as blocked (simulate reassignment challenge)
-                modified = JiraTicket(
-                    key=ticket.key,
-                    summary=ticket.summary,
-                    status=ticket.status,
-                    assignee=None,
-                    story_points=ticket.story_points,
-                    labels=ticket.labels + ["blocked"]
-                )
-                modified_tickets.append(modified)
-            else:
-                modified_tickets.append(ticket)
+        # Find the person's work in one pass; their open tickets lose an assignee
+        # and are blocked (simulate reassignment challenge)
+        needle = person_name.lower()
+        person_count = 0
+        points_affected = 0
+        reassigned = set()
+        for t in tickets:
+            if t.assignee and needle in t.assignee.lower():
+                person_count += 1
+                if not t.is_done:
+                    reassigned.add(t.key)
+                    points_affected += t.story_points or 0
         
         # Calculate new prediction
-        modified_prediction = self.predict(sprint, modified_tickets, velocity_history)
+        modified_prediction = self.predict(
+            sprint, tickets, velocity_history,
+            reassigned=frozenset(reassigned), predicted_at=predicted_at
+        )
         
         # Calculate impact
-        points_affected = sum(t.story_points or 0 for t in person_tickets if not t.is_done)
-        
         impact_description = (
-            f"Removing {person_name} affects {len(person_tickets)} tickets "
+            f"Removing {person_name} affects {person_count} tickets "
             f"({points_affected} points). Sprint completion drops from "
             f"{original.completion_probability:.0f}% to {modified_prediction.completion_probability:.0f}%."
         )
@@ -479,16 +614,76 @@ class SprintPredictor:
             impact_description=impact_description
         )
     
+    def _with_added_ticket(
+        self,
+        original: SprintPrediction,
+        ticket: JiraTicket,
+        sprint: Sprint,
+        velocity_history: Optional[list[dict]],
+        predicted_at: Optional[datetime] = None
+    ) -> SprintPrediction:
+        """
+        The prediction predict() would give with ticket (not yet done) added.
+        
+        Only the point totals and the new ticket's risk change, so the
+        original's totals and ticket risks are reused instead of re-walking
+        every ticket.
+        """
+        points = ticket.story_points or 0
+        total_points = original.total_points + points
+        remaining_points = original.remaining_points + points
+        days_remaining = original.days_remaining
+        days_elapsed, sprint_progress = self._sprint_timing(sprint, days_remaining)
+        velocity_stats = self.calculate_velocity_stats(velocity_history or [])
+        
+        predicted_completion, completion_probability = self._forecast(
+            original.completed_points, total_points, remaining_points,
+            days_remaining, sprint_progress, velocity_stats
+        )
+        
+        # The added ticket comes last, as it would in predict()'s ticket list
+        at_risk_tickets = list(original._all_risks)
+        risk = self.assess_ticket_risk(ticket, days_remaining, sprint_progress)
+        if risk.risk_score >= 40:
+            at_risk_tickets.append(risk)
+        
+        risk_level, recommendations = self._overall_risk(
+            completion_probability, at_risk_tickets, velocity_stats
+        )
+        
+        prediction = SprintPrediction(
+            sprint_name=original.sprint_name,
+            sprint_id=original.sprint_id,
+            predicted_at=predicted_at or datetime.now(),
+            total_points=total_points,
+            completed_points=original.completed_points,
+            in_progress_points=original.in_progress_points + (points if ticket.is_in_progress else 0),
+            remaining_points=remaining_points,
+            days_remaining=days_remaining,
+            days_elapsed=days_elapsed,
+            completion_probability=completion_probability,
+            predicted_completion_points=min(predicted_completion, total_points),
+            predicted_remaining_points=max(0, total_points - predicted_completion),
+            risk_level=risk_level,
+            at_risk_tickets=_top_risks(at_risk_tickets),
+            recommendations=recommendations
+        )
+        prediction._all_risks = at_risk_tickets
+        return prediction
+    
     def what_if_add_scope(
         self,
         original: SprintPrediction,
         additional_points: float,
         tickets: list[JiraTicket],
         sprint: Sprint,
-        velocity_history: Optional[list[dict]] = None
+        velocity_history: Optional[list[dict]] = None,
+        predicted_at: Optional[datetime] = None
     ) -> WhatIfScenario:
         """
         Simulate adding scope to the sprint.
+        
+        predicted_at is the modified prediction's timestamp (defaults to now).
         """
         # Add a fake ticket with the additional points
         new_ticket = JiraTicket(
@@ -499,8 +694,15 @@ class SprintPredictor:
             story_points=additional_points
         )
         
-        modified_tickets = tickets + [new_ticket]
-        modified_prediction = self.predict(sprint, modified_tickets, velocity_history)
+        if original._all_risks is None:
+            # Not made by predict(), so there are no per-ticket risks to build on
+            modified_prediction = self.predict(
+                sprint, tickets + [new_ticket], velocity_history, predicted_at=predicted_at
+            )
+        else:
+            modified_prediction = self._with_added_ticket(
+                original, new_ticket, sprint, velocity_history, predicted_at
+            )
         
         impact_description = (
             f"Adding {additional_points} points reduces completion probability from "
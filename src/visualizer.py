@@ -6,13 +6,38 @@ Creates charts, graphs, and reports for team workload data.
 
 import io
 from datetime import datetime, date, timedelta
-from typing import Optional, Literal
+from typing import Iterator, Optional, Literal
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
 
 from .analyzer import TeamWorkloadSummary, TeamMemberWorkload, WorkloadStatus
 from .predictor import SprintPrediction, RiskLevel
 
 
+# Frame rows of the 60-column text report box
+_TOP_BORDER = "╔" + "═" * 60 + "╗"
+_MID_BORDER = "╠" + "═" * 60 + "╣"
+_BOTTOM_BORDER = "╚" + "═" * 60 + "╝"
+_INNER_SEP = "║" + "─" * 60 + "║"
+
+# Pads a text report row to the 60-column box and closes it with the right
+# border in a single formatting step
+_box_line = "{:<61}║".format
+
+# Workload bar status by how many of the 80% / 100% thresholds are reached
+_STATUS_EMOJIS = ("🟢", "🟡", "🔴")
+
+
+@lru_cache(maxsize=32)
+def _burndown_frame(width: int) -> tuple[str, str, str]:
+    """Width-dependent burndown pieces: title rule, x-axis, and day-label start."""
+    return (
+        "═" * width,
+        "      └" + "─" * (width - 7),
+        f"       Day 1{' ' * (width - 18)}"
+    )
+
+
 # ASCII art for terminal output
 class ASCIICharts:
     """Generate ASCII art charts for terminal/text output."""
@@ -39,12 +64,7 @@ class ASCIICharts:
         bar = ASCIICharts.horizontal_bar(percentage, 100, width)
         
         # Add percentage and status
-        if percentage >= 100:
-            status = "🔴"
-        elif percentage >= 80:
-            status = "🟡"
-        else:
-            status = "🟢"
+        status = _STATUS_EMOJIS[(percentage >= 80) + (percentage >= 100)]
         
         return f"{bar} {percentage:5.1f}% {status}"
     
@@ -62,11 +82,14 @@ class ASCIICharts:
         if total_days <= 0:
             return "No sprint data"
         
+        rule, x_axis, day_labels = _burndown_frame(width)
+        
         lines = []
         lines.append("Sprint Burndown")
-        lines.append("═" * width)
+        lines.append(rule)
         
-        remaining = total_points - completed_points
+        # One column per day, cut to fit the chart area
+        columns = len(range(total_days + 1)[:width - 8])
         
         for row in range(height):
             threshold = total_points * (1 - row / height)
@@ -80,27 +103,21 @@ class ASCIICharts:
             else:
                 actual_day = -1
             
-            row_chars = []
-            for day in range(total_days + 1):
-                col = int(day * (width - 10) / total_days)
-                
-                if day == ideal_day:
-                    row_chars.append("─")
-                elif day == actual_day:
-                    row_chars.append("●")
-                elif day == days_elapsed:
-                    row_chars.append("│")
-                else:
-                    row_chars.append(" ")
+            # Place markers lowest precedence first, so the ideal line wins
+            # over the actual point, which wins over today's marker
+            row_chars = [" "] * columns
+            for day, marker in ((days_elapsed, "│"), (actual_day, "●"), (ideal_day, "─")):
+                if 0 <= day < columns:
+                    row_chars[day] = marker
             
             # Pad and add label
-            row_str = "".join(row_chars[:width - 8])
+            row_str = "".join(row_chars)
             points_label = f"{threshold:5.1f}"
             lines.append(f"{points_label} │{row_str}")
         
         # X-axis
-        lines.append("      └" + "─" * (width - 7))
-        lines.append(f"       Day 1{' ' * (width - 18)}Day {total_days}")
+        lines.append(x_axis)
+        lines.append(f"{day_labels}Day {total_days}")
         
         return "\n".join(lines)
 
@@ -114,31 +131,31 @@ class TextReporter:
         lines = []
         
         # Header
-        lines.append("╔" + "═" * 60 + "╗")
+        lines.append(_TOP_BORDER)
         lines.append("║" + "TEAM CAPACITY REPORT".center(60) + "║")
-        lines.append("║" + f"Generated: {summary.calculated_at.strftime('%Y-%m-%d %H:%M')}".center(60) + "║")
-        lines.append("╠" + "═" * 60 + "╣")
+        lines.append("║" + f"Generated: {summary.calculated_at_str}".center(60) + "║")
+        lines.append(_MID_BORDER)
         
         # Summary stats
-        lines.append("║ SUMMARY".ljust(61) + "║")
-        lines.append("║" + "─" * 60 + "║")
-        lines.append(f"║  Team Size: {summary.team_size}".ljust(61) + "║")
-        lines.append(f"║  Average Workload: {summary.average_workload:.1f}%".ljust(61) + "║")
-        lines.append(f"║  🟢 Healthy: {summary.healthy_count}  🟡 At Capacity: {summary.at_capacity_count}  🔴 Overloaded: {summary.overloaded_count}".ljust(61) + "║")
-        lines.append(f"║  Balance: {'✓ Balanced' if summary.is_balanced else '⚠ Unbalanced'}".ljust(61) + "║")
-        lines.append("╠" + "═" * 60 + "╣")
+        lines.append(_box_line("║ SUMMARY"))
+        lines.append(_INNER_SEP)
+        lines.append(_box_line(f"║  Team Size: {summary.team_size}"))
+        lines.append(_box_line(f"║  Average Workload: {summary.average_workload:.1f}%"))
+        lines.append(_box_line(f"║  🟢 Healthy: {summary.healthy_count}  🟡 At Capacity: {summary.at_capacity_count}  🔴 Overloaded: {summary.overloaded_count}"))
+        lines.append(_box_line(f"║  Balance: {('⚠ Unbalanced', '✓ Balanced')[summary.is_balanced]}"))
+        lines.append(_MID_BORDER)
         
         # Individual workloads
-        lines.append("║ INDIVIDUAL WORKLOADS".ljust(61) + "║")
-        lines.append("║" + "─" * 60 + "║")
+        lines.append(_box_line("║ INDIVIDUAL WORKLOADS"))
+        lines.append(_INNER_SEP)
         
         for member in summary.members:
             name = member.name[:15].ljust(15)
             bar = ASCIICharts.workload_bar(member.workload_percentage, 15)
-            lines.append(f"║  {name} {bar}".ljust(61) + "║")
+            lines.append(_box_line(f"║  {name} {bar}"))
         
         # Footer
-        lines.append("╚" + "═" * 60 + "╝")
+        lines.append(_BOTTOM_BORDER)
         
         return "\n".join(lines)
     
@@ -148,9 +165,9 @@ class TextReporter:
         lines = []
         
         # Header
-        lines.append("╔" + "═" * 60 + "╗")
+        lines.append(_TOP_BORDER)
         lines.append("║" + f"SPRINT PREDICTION: {prediction.sprint_name}".center(60) + "║")
-        lines.append("╠" + "═" * 60 + "╣")
+        lines.append(_MID_BORDER)
         
         # Progress
         progress_bar = ASCIICharts.horizontal_bar(
@@ -158,33 +175,33 @@ class TextReporter:
             prediction.total_points, 
             30
         )
-        lines.append(f"║  Progress: {progress_bar} {prediction.completion_percentage:.0f}%".ljust(61) + "║")
-        lines.append(f"║  Points: {prediction.completed_points:.0f} / {prediction.total_points:.0f}".ljust(61) + "║")
-        lines.append(f"║  Days Remaining: {prediction.days_remaining}".ljust(61) + "║")
-        lines.append("║" + "─" * 60 + "║")
+        lines.append(_box_line(f"║  Progress: {progress_bar} {prediction.completion_percentage:.0f}%"))
+        lines.append(_box_line(f"║  Points: {prediction.completed_points:.0f} / {prediction.total_points:.0f}"))
+        lines.append(_box_line(f"║  Days Remaining: {prediction.days_remaining}"))
+        lines.append(_INNER_SEP)
         
         # Prediction
-        prob_emoji = "✓" if prediction.on_track else "⚠"
-        lines.append(f"║  {prob_emoji} Completion Probability: {prediction.completion_probability:.0f}%".ljust(61) + "║")
-        lines.append(f"║  Risk Level: {prediction.risk_level.value.upper()}".ljust(61) + "║")
+        prob_emoji = ("⚠", "✓")[prediction.on_track]
+        lines.append(_box_line(f"║  {prob_emoji} Completion Probability: {prediction.completion_probability:.0f}%"))
+        lines.append(_box_line(f"║  Risk Level: {prediction.risk_level.value.upper()}"))
         
         # At-risk tickets
         if prediction.at_risk_tickets:
-            lines.append("║" + "─" * 60 + "║")
-            lines.append("║  AT-RISK TICKETS:".ljust(61) + "║")
+            lines.append(_INNER_SEP)
+            lines.append(_box_line("║  AT-RISK TICKETS:"))
             for ticket in prediction.at_risk_tickets[:3]:
-                risk_indicator = "🔴" if ticket.risk_level == RiskLevel.CRITICAL else "🟡"
+                risk_indicator = ("🟡", "🔴")[ticket.risk_level == RiskLevel.CRITICAL]
                 line = f"║    {risk_indicator} {ticket.ticket_key}: {ticket.ticket_title[:30]}..."
-                lines.append(line.ljust(61) + "║")
+                lines.append(_box_line(line))
         
         # Recommendations
         if prediction.recommendations:
-            lines.append("║" + "─" * 60 + "║")
-            lines.append("║  RECOMMENDATIONS:".ljust(61) + "║")
+            lines.append(_INNER_SEP)
+            lines.append(_box_line("║  RECOMMENDATIONS:"))
             for rec in prediction.recommendations:
-                lines.append(f"║    • {rec[:50]}".ljust(61) + "║")
+                lines.append(_box_line(f"║    • {rec[:50]}"))
         
-        lines.append("╚" + "═" * 60 + "╝")
+        lines.append(_BOTTOM_BORDER)
         
         return "\n".join(lines)
     
@@ -193,31 +210,68 @@ class TextReporter:
         """Generate a text report of PTO conflicts."""
         lines = []
         
-        lines.append("╔" + "═" * 60 + "╗")
+        lines.append(_TOP_BORDER)
         lines.append("║" + "PTO CONFLICT REPORT".center(60) + "║")
-        lines.append("╠" + "═" * 60 + "╣")
+        lines.append(_MID_BORDER)
         
         if not conflicts:
-            lines.append("║  ✓ No PTO conflicts detected in upcoming period".ljust(61) + "║")
+            lines.append(_box_line("║  ✓ No PTO conflicts detected in upcoming period"))
         else:
-            lines.append(f"║  ⚠ {len(conflicts)} potential conflicts found:".ljust(61) + "║")
-            lines.append("║" + "─" * 60 + "║")
+            lines.append(_box_line(f"║  ⚠ {len(conflicts)} potential conflicts found:"))
+            lines.append(_INNER_SEP)
             
             for conflict in conflicts:
-                severity_emoji = "🔴" if conflict["severity"] == "critical" else "🟡"
+                severity_emoji = ("🟡", "🔴")[conflict["severity"] == "critical"]
                 date_str = conflict["date"]
                 people = ", ".join(conflict["people_out"][:3])
                 if len(conflict["people_out"]) > 3:
                     people += f" +{len(conflict['people_out']) - 3} more"
                 
-                lines.append(f"║  {severity_emoji} {date_str}: {people}".ljust(61) + "║")
-                lines.append(f"║     Available: {conflict['available_count']}/{team_size}".ljust(61) + "║")
+                lines.append(_box_line(f"║  {severity_emoji} {date_str}: {people}"))
+                lines.append(_box_line(f"║     Available: {conflict['available_count']}/{team_size}"))
         
-        lines.append("╚" + "═" * 60 + "╝")
+        lines.append(_BOTTOM_BORDER)
         
         return "\n".join(lines)
 
 
+# Slack field labels, in display order
+_WORKLOAD_ALERT_LABELS = (
+    "*Workload:*\n", "*Status:*\n", "*Open PRs:*\n",
+    "*Pending Reviews:*\n", "*Story Points:*\n", "*Meeting Hours:*\n"
+)
+_SPRINT_ALERT_LABELS = (
+    "*Completion Probability:*\n", "*Risk Level:*\n", "*Days Remaining:*\n", "*Progress:*\n"
+)
+
+# Display names, e.g. "At Capacity"
+_STATUS_NAMES = {status: status.value.replace("_", " ").title() for status in WorkloadStatus}
+
+# Daily summary workload bars with 0-10 of 10 cells filled
+_BARS = tuple("█" * filled + "░" * (10 - filled) for filled in range(11))
+
+_RISK_COLORS = {
+    RiskLevel.CRITICAL: "#FF0000",
+    RiskLevel.HIGH: "#FFA500",
+    RiskLevel.MEDIUM: "#FFFF00",
+    RiskLevel.LOW: "#00FF00"
+}
+
+
+def _summary_bar(percentage: float) -> str:
+    """10-cell workload bar for the daily summary."""
+    filled = int(percentage / 10)
+    if 0 <= filled <= 10:
+        return _BARS[filled]
+    # Past 110% the bar keeps growing to show how far over capacity
+    return "█" * filled + "░" * (10 - filled)
+
+
+def _mrkdwn_fields(labels: tuple[str, ...], values: tuple[str, ...]) -> list[dict]:
+    """Slack section fields pairing each label with its value."""
+    return [{"type": "mrkdwn", "text": label + value} for label, value in zip(labels, values)]
+
+
 class SlackFormatter:
     """Format messages for Slack."""
     
@@ -240,32 +294,14 @@ class SlackFormatter:
                     },
                     {
                         "type": "section",
-                        "fields": [
-                            {
-                                "type": "mrkdwn",
-                                "text": f"*Workload:*\n{member.workload_percentage:.0f}%"
-                            },
-                            {
-                                "type": "mrkdwn",
-                                "text": f"*Status:*\n{member.status.value.replace('_', ' ').title()}"
-                            },
-                            {
-                                "type": "mrkdwn",
-                                "text": f"*Open PRs:*\n{member.github_open_prs}"
-                            },
-                            {
-                                "type": "mrkdwn",
-                                "text": f"*Pending Reviews:*\n{member.github_pending_reviews}"
-                            },
-                            {
-                                "type": "mrkdwn",
-                                "text": f"*Story Points:*\n{member.jira_story_points:.0f}"
-                            },
-                            {
-                                "type": "mrkdwn",
-                                "text": f"*Meeting Hours:*\n{member.meeting_hours_this_week:.1f}h"
-                            }
-                        ]
+                        "fields": _mrkdwn_fields(_WORKLOAD_ALERT_LABELS, (
+                            f"{member.workload_percentage:.0f}%",
+                            _STATUS_NAMES[member.status],
+                            f"{member.github_open_prs}",
+                            f"{member.github_pending_reviews}",
+                            f"{member.jira_story_points:.0f}",
+                            f"{member.meeting_hours_this_week:.1f}h"
+                        ))
                     },
                     {
                         "type": "context",
@@ -287,11 +323,10 @@ class SlackFormatter:
         status_line = f"🟢 {summary.healthy_count} healthy • 🟡 {summary.at_capacity_count} at capacity • 🔴 {summary.overloaded_count} overloaded"
         
         # Build member list
-        member_lines = []
-        for member in summary.members[:10]:
-            emoji = member.status_emoji
-            bar = "█" * int(member.workload_percentage / 10) + "░" * (10 - int(member.workload_percentage / 10))
-            member_lines.append(f"{emoji} {member.name}: `{bar}` {member.workload_percentage:.0f}%")
+        member_lines = "\n".join([
+            f"{m.status_emoji} {m.name}: `{_summary_bar(m.workload_percentage)}` {m.workload_percentage:.0f}%"
+            for m in summary.members[:10]
+        ])
         
         return {
             "blocks": [
@@ -317,7 +352,7 @@ class SlackFormatter:
                     "type": "section",
                     "text": {
                         "type": "mrkdwn",
-                        "text": "\n".join(member_lines)
+                        "text": member_lines
                     }
                 }
             ]
@@ -326,12 +361,7 @@ class SlackFormatter:
     @staticmethod
     def sprint_alert(prediction: SprintPrediction) -> dict:
         """Create Slack alert for sprint at risk."""
-        color = {
-            RiskLevel.CRITICAL: "#FF0000",
-            RiskLevel.HIGH: "#FFA500",
-            RiskLevel.MEDIUM: "#FFFF00",
-            RiskLevel.LOW: "#00FF00"
-        }[prediction.risk_level]
+        color = _RISK_COLORS[prediction.risk_level]
         
         risk_tickets = "\n".join([
             f"• {t.ticket_key}: {t.ticket_title[:40]}..." 
@@ -354,24 +384,12 @@ class SlackFormatter:
                     },
                     {
                         "type": "section",
-                        "fields": [
-                            {
-                                "type": "mrkdwn",
-                                "text": f"*Completion Probability:*\n{prediction.completion_probability:.0f}%"
-                            },
-                            {
-                                "type": "mrkdwn",
-                                "text": f"*Risk Level:*\n{prediction.risk_level.value.upper()}"
-                            },
-                            {
-                                "type": "mrkdwn",
-                                "text": f"*Days Remaining:*\n{prediction.days_remaining}"
-                            },
-                            {
-                                "type": "mrkdwn",
-                                "text": f"*Progress:*\n{prediction.completed_points:.0f}/{prediction.total_points:.0f} points"
-                            }
-                        ]
+                        "fields": _mrkdwn_fields(_SPRINT_ALERT_LABELS, (
+                            f"{prediction.completion_probability:.0f}%",
+                            prediction.risk_level.value.upper(),
+                            f"{prediction.days_remaining}",
+                            f"{prediction.completed_points:.0f}/{prediction.total_points:.0f} points"
+                        ))
                     },
                     {
                         "type": "section",
@@ -392,37 +410,9 @@ class SlackFormatter:
         }
 
 
-class HTMLReporter:
-    """Generate HTML reports (for dashboard or email)."""
-    
-    @staticmethod
-    def team_dashboard(summary: TeamWorkloadSummary) -> str:
-        """Generate HTML dashboard for team workload."""
-        # Generate member cards
-        member_cards = ""
-        for member in summary.members:
-            status_color = {
-                WorkloadStatus.HEALTHY: "#22c55e",
-                WorkloadStatus.AT_CAPACITY: "#eab308",
-                WorkloadStatus.OVERLOADED: "#ef4444"
-            }[member.status]
-            
-            member_cards += f"""
-            <div class="member-card">
-                <div class="member-name">{member.name}</div>
-                <div class="progress-bar">
-                    <div class="progress-fill" style="width: {min(member.workload_percentage, 100)}%; background-color: {status_color};"></div>
-                </div>
-                <div class="workload-value">{member.workload_percentage:.0f}%</div>
-                <div class="member-details">
-                    <span>PRs: {member.github_open_prs}</span>
-                    <span>Reviews: {member.github_pending_reviews}</span>
-                    <span>Points: {member.jira_story_points:.0f}</span>
-                </div>
-            </div>
-            """
-        
-        return f"""
+# Static dashboard markup, built once at import; the head is filled in with
+# str.format (CSS braces are doubled) and the tail is used as is
+_DASHBOARD_HEAD = """
         <!DOCTYPE html>
         <html>
         <head>
@@ -449,30 +439,32 @@ class HTMLReporter:
             <div class="dashboard">
                 <div class="header">
                     <h1>🎯 Team Capacity Dashboard</h1>
-                    <p>Updated: {summary.calculated_at.strftime('%Y-%m-%d %H:%M')}</p>
+                    <p>Updated: {calculated_at}</p>
                 </div>
                 
                 <div class="stats">
                     <div class="stat-card">
-                        <div class="stat-value">{summary.team_size}</div>
+                        <div class="stat-value">{team_size}</div>
                         <div class="stat-label">Team Members</div>
                     </div>
                     <div class="stat-card">
-                        <div class="stat-value">{summary.average_workload:.0f}%</div>
+                        <div class="stat-value">{average_workload:.0f}%</div>
                         <div class="stat-label">Average Workload</div>
                     </div>
                     <div class="stat-card">
-                        <div class="stat-value" style="color: #ef4444;">{summary.overloaded_count}</div>
+                        <div class="stat-value" style="color: #ef4444;">{overloaded_count}</div>
                         <div class="stat-label">Overloaded</div>
                     </div>
                     <div class="stat-card">
-                        <div class="stat-value" style="color: #22c55e;">{summary.healthy_count}</div>
+                        <div class="stat-value" style="color: #22c55e;">{healthy_count}</div>
                         <div class="stat-label">Healthy</div>
                     </div>
                 </div>
                 
                 <div class="members">
-                    {member_cards}
+                    """
+
+_DASHBOARD_TAIL = """
                 </div>
             </div>
         </body>
@@ -480,6 +472,65 @@ class HTMLReporter:
         """
 
 
+class HTMLReporter:
+    """Generate HTML reports (for dashboard or email)."""
+    
+    STATUS_COLORS = {
+        WorkloadStatus.HEALTHY: "#22c55e",
+        WorkloadStatus.AT_CAPACITY: "#eab308",
+        WorkloadStatus.OVERLOADED: "#ef4444"
+    }
+    
+    @staticmethod
+    def team_dashboard(summary: TeamWorkloadSummary) -> str:
+        """Generate HTML dashboard for team workload."""
+        return "".join(HTMLReporter.iter_team_dashboard(summary))
+    
+    @staticmethod
+    def iter_team_dashboard(summary: TeamWorkloadSummary, cards_per_chunk: int = 64) -> Iterator[str]:
+        """
+        Generate the HTML dashboard as a sequence of fragments.
+        
+        Yields the page head, then member cards in batches of cards_per_chunk,
+        then the closing markup, so large teams can be streamed.
+        """
+        yield _DASHBOARD_HEAD.format(
+            calculated_at=summary.calculated_at_str,
+            team_size=summary.team_size,
+            average_workload=summary.average_workload,
+            overloaded_count=summary.overloaded_count,
+            healthy_count=summary.healthy_count
+        )
+        
+        status_colors = HTMLReporter.STATUS_COLORS
+        cards = []
+        for member in summary.members:
+            status_color = status_colors[member.status]
+            percentage = member.workload_percentage
+            bar_width = 100 if percentage > 100 else percentage
+            cards.append(f"""
+            <div class="member-card">
+                <div class="member-name">{member.name}</div>
+                <div class="progress-bar">
+                    <div class="progress-fill" style="width: {bar_width}%; background-color: {status_color};"></div>
+                </div>
+                <div class="workload-value">{percentage:.0f}%</div>
+                <div class="member-details">
+                    <span>PRs: {member.github_open_prs}</span>
+                    <span>Reviews: {member.github_pending_reviews}</span>
+                    <span>Points: {member.jira_story_points:.0f}</span>
+                </div>
+            </div>
+            """)
+            if len(cards) >= cards_per_chunk:
+                yield "".join(cards)
+                cards.clear()
+        if cards:
+            yield "".join(cards)
+        
+        yield _DASHBOARD_TAIL
+
+
 # Main visualization class
 class Visualizer:
     """
@@ -498,11 +549,23 @@ class Visualizer:
         html = viz.team_report(summary, format="html")
     """
     
-    def __init__(self):
-        self.text = TextReporter()
-        self.slack = SlackFormatter()
-        self.html = HTMLReporter()
-        self.ascii = ASCIICharts()
+    # Reporters are created on first use, so e.g. a Slack-only job never builds the others
+    
+    @cached_property
+    def text(self) -> TextReporter:
+        return TextReporter()
+    
+    @cached_property
+    def slack(self) -> SlackFormatter:
+        return SlackFormatter()
+    
+    @cached_property
+    def html(self) -> HTMLReporter:
+        return HTMLReporter()
+    
+    @cached_property
+    def ascii(self) -> ASCIICharts:
+        return ASCIICharts()
     
     def team_report(
         self,
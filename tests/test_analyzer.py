@@ -2,6 +2,7 @@
 Tests for the workload analyzer.
 """
 
+import json
 import pytest
 from datetime import date
 
@@ -102,6 +103,21 @@ class TestWorkloadAnalyzer:
         assert member.status == WorkloadStatus.OVERLOADED
         assert member.status_emoji == "🔴"
     
+    def test_workload_status_boundaries(self):
+        """Test status band edges are inclusive of their lower bound."""
+        assert TeamMemberWorkload(name="T", workload_percentage=79.9).status == WorkloadStatus.HEALTHY
+        assert TeamMemberWorkload(name="T", workload_percentage=80).status == WorkloadStatus.AT_CAPACITY
+        assert TeamMemberWorkload(name="T", workload_percentage=100).status == WorkloadStatus.OVERLOADED
+    
+    def test_workload_status_follows_percentage(self):
+        """Test status tracks workload_percentage after it is reassigned."""
+        member = TeamMemberWorkload(name="Test", workload_percentage=50.0)
+        assert member.status == WorkloadStatus.HEALTHY
+        
+        member.workload_percentage = 150.0
+        assert member.status == WorkloadStatus.OVERLOADED
+        assert member.to_dict()["workload"]["status"] == "overloaded"
+    
     def test_analyze_team(self):
         """Test analyzing a full team."""
         analyzer = WorkloadAnalyzer()
@@ -134,6 +150,23 @@ class TestWorkloadAnalyzer:
         assert summary.overloaded_count == 1
         assert summary.average_workload == pytest.approx(83.33, rel=0.01)
     
+    def test_team_summary_metrics_follow_member_changes(self):
+        """Test summary metrics reflect members replaced or edited in place."""
+        summary = TeamWorkloadSummary(members=[
+            TeamMemberWorkload(name="A", workload_percentage=60),
+            TeamMemberWorkload(name="B", workload_percentage=110),
+        ])
+        assert summary.average_workload == pytest.approx(85.0)
+        assert summary.overloaded_count == 1
+        
+        summary.members[1] = TeamMemberWorkload(name="B", workload_percentage=10)
+        assert summary.average_workload == pytest.approx(35.0)
+        assert summary.overloaded_count == 0
+        
+        summary.members[0].workload_percentage = 90
+        assert summary.at_capacity_count == 1
+        assert summary.healthy_count == 1
+    
     def test_identify_overloaded(self):
         """Test identifying overloaded members."""
         analyzer = WorkloadAnalyzer()
@@ -168,6 +201,38 @@ class TestWorkloadAnalyzer:
         assert suggestions[0]["from"] == "Overloaded"
         assert suggestions[0]["to"] == "Available"
     
+    def test_suggest_rebalancing_picks_least_loaded(self):
+        """Work goes to the least-loaded healthy member, not the first listed."""
+        analyzer = WorkloadAnalyzer()
+        
+        members = [
+            TeamMemberWorkload(name="Busy", workload_percentage=60),
+            TeamMemberWorkload(name="Heavy", workload_percentage=140),
+            TeamMemberWorkload(name="Light", workload_percentage=30),
+            TeamMemberWorkload(name="Over", workload_percentage=110),
+        ]
+        summary = TeamWorkloadSummary(members=members)
+        
+        suggestions = analyzer.suggest_rebalancing(summary)
+        
+        assert [(s["from"], s["to"]) for s in suggestions] == [("Heavy", "Light"), ("Over", "Light")]
+        assert suggestions[0]["to_load"] == 30.0
+    
+    def test_suggest_rebalancing_skips_small_gaps(self):
+        """Overloads within 30 points of the lightest healthy member get no suggestion."""
+        analyzer = WorkloadAnalyzer()
+        
+        members = [
+            TeamMemberWorkload(name="Heavy", workload_percentage=140),
+            TeamMemberWorkload(name="Over", workload_percentage=105),
+            TeamMemberWorkload(name="Busy", workload_percentage=75),
+        ]
+        summary = TeamWorkloadSummary(members=members)
+        
+        suggestions = analyzer.suggest_rebalancing(summary)
+        
+        assert [(s["from"], s["to"]) for s in suggestions] == [("Heavy", "Busy")]
+    
     def test_member_to_dict(self):
         """Test member serialization."""
         member = TeamMemberWorkload(
@@ -186,6 +251,53 @@ class TestWorkloadAnalyzer:
         assert data["jira"]["story_points"] == 5
         assert data["workload"]["percentage"] == 75.0
         assert data["workload"]["status"] == "healthy"
+    
+    def test_member_to_dict_rounding(self):
+        """Test scores round to one decimal like round(), including negatives."""
+        data = TeamMemberWorkload(name="T", workload_score=-12.34, workload_percentage=0.25).to_dict()
+        
+        assert data["workload"]["score"] == -12.3
+        assert data["workload"]["percentage"] == 0.2  # not the half-up 0.3
+    
+    def test_member_to_dict_reflects_changes(self):
+        """Test serialization follows later field changes and hands out fresh dicts."""
+        member = TeamMemberWorkload(name="Test", workload_percentage=50.0)
+        first = member.to_dict()
+        first["name"] = "Changed"
+        
+        member.email = "test@example.com"
+        member.github_open_prs = 4
+        data = member.to_dict()
+        
+        assert data["name"] == "Test"
+        assert data["email"] == "test@example.com"
+        assert data["github"]["open_prs"] == 4
+    
+    def test_summary_to_json_bytes(self):
+        """Test JSON bytes match the dict serialization."""
+        summary = TeamWorkloadSummary(members=[
+            TeamMemberWorkload(name="A", workload_percentage=60),
+            TeamMemberWorkload(name="B", workload_percentage=110),
+        ])
+        
+        assert json.loads(summary.to_json_bytes()) == summary.to_dict()
+    
+    def test_summary_get_member(self):
+        """Test case-insensitive member lookup."""
+        summary = TeamWorkloadSummary(members=[
+            TeamMemberWorkload(name="Alice", workload_percentage=60),
+        ])
+        
+        assert summary.get_member("alice").name == "Alice"
+        assert summary.get_member("ALICE").name == "Alice"
+        assert summary.get_member("bob") is None
+        
+        summary.members.append(TeamMemberWorkload(name="Bob"))
+        assert summary.get_member("bob").name == "Bob"
+        
+        summary.members[0] = TeamMemberWorkload(name="Carol")
+        assert summary.get_member("alice") is None
+        assert summary.get_member("carol").name == "Carol"
 
 
 class TestWorkloadWeights:
@@ -207,6 +319,18 @@ class TestWorkloadWeights:
         # vs default: 2*3.0 + 5*2.0 = 16
         assert member.workload_score > 0
 
+    
+    def test_zero_max_score_rejected(self):
+        """Test weights that cannot normalize are rejected up front."""
+        with pytest.raises(ValueError):
+            WorkloadWeights(
+                github_open_prs=0,
+                github_pending_reviews=0,
+                github_assigned_issues=0,
+                jira_story_points=0,
+                meeting_hours=0,
+            )
+
 
 class TestConvenienceFunctions:
     """Tests for convenience functions."""
@@ -0,0 +1,180 @@
+"""
+Tests for the API caching helpers.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from starlette.requests import Request
+
+from src import api
+from src.analyzer import TeamMemberWorkload, TeamWorkloadSummary
+from src.api import GitHubSettings, JiraSettings
+from src.integrations.jira import Sprint
+
+
+def _request(if_none_match=None) -> Request:
+    """A bare GET request, optionally carrying If-None-Match."""
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+def _summary(score: float = 50.0) -> TeamWorkloadSummary:
+    """A one-member summary."""
+    return TeamWorkloadSummary(members=[
+        TeamMemberWorkload(name="Alice", workload_score=score, workload_percentage=score)
+    ])
+
+
+@pytest.fixture
+def analyze_calls(monkeypatch):
+    """
+    Empty workload cache with both integrations disabled; returns the list of
+    summaries the analyzer produced, one per upstream fetch.
+    """
+    calls = []
+    
+    def analyze(**kwargs):
+        calls.append(_summary())
+        return calls[-1]
+    
+    monkeypatch.setattr(api.config, "github", GitHubSettings())
+    monkeypatch.setattr(api.config, "jira", JiraSettings())
+    monkeypatch.setattr(api.analyzer, "analyze", analyze)
+    monkeypatch.setitem(api._cache, "team_workload", None)
+    monkeypatch.setitem(api._cache, "team_workload_expires", 0.0)
+    return calls
+
+
+class TestWorkloadCache:
+    """Tests for the TTL-bounded, single-flight workload cache."""
+    
+    @pytest.mark.asyncio
+    async def test_cached_within_ttl(self, analyze_calls, monkeypatch):
+        """Repeat requests within the TTL reuse the cached summary."""
+        monkeypatch.setattr(api.config, "cache_ttl", 300)
+        
+        first = await api._get_workload_summary()
+        second = await api._get_workload_summary()
+        
+        assert first is second
+        assert len(analyze_calls) == 1
+    
+    @pytest.mark.asyncio
+    async def test_refetched_after_expiry(self, analyze_calls, monkeypatch):
+        """An expired summary is fetched again."""
+        monkeypatch.setattr(api.config, "cache_ttl", 300)
+        first = await api._get_workload_summary()
+        
+        api._cache["team_workload_expires"] = 0.0
+        second = await api._get_workload_summary()
+        
+        assert second is not first
+        assert len(analyze_calls) == 2
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_fetch(self, analyze_calls, monkeypatch):
+        """Concurrent requests on a cold cache trigger a single upstream fetch."""
+        monkeypatch.setattr(api.config, "cache_ttl", 300)
+        
+        summaries = await asyncio.gather(*(api._get_workload_summary() for _ in range(5)))
+        
+        assert len(analyze_calls) == 1
+        assert all(summary is analyze_calls[0] for summary in summaries)
+
+
+class _FakeJira:
+    """Stands in for JiraClient, counting active-sprint lookups."""
+    
+    def __init__(self):
+        self.sprint_fetches = 0
+    
+    async def get_active_sprint(self):
+        self.sprint_fetches += 1
+        return Sprint(
+            id=1,
+            name="Sprint 1",
+            state="active",
+            start_date=datetime.now() - timedelta(days=5),
+            end_date=datetime.now() + timedelta(days=5)
+        )
+    
+    async def get_sprint_tickets(self, sprint_id):
+        return []
+    
+    async def get_velocity_history(self):
+        return []
+
+
+class TestSprintCache:
+    """Tests for the TTL-bounded sprint snapshot."""
+    
+    @pytest.fixture
+    def jira(self, monkeypatch):
+        """A fake Jira client behind an empty sprint cache."""
+        jira = _FakeJira()
+        monkeypatch.setattr(api.config, "jira", JiraSettings(url="https://jira", email="a@b.c", token="t"))
+        monkeypatch.setattr(api.config, "cache_ttl", 300)
+        monkeypatch.setattr(api.app.state, "jira", jira, raising=False)
+        monkeypatch.setitem(api._cache, "sprint", None)
+        monkeypatch.setitem(api._cache, "sprint_expires", 0.0)
+        return jira
+    
+    @pytest.mark.asyncio
+    async def test_cached_within_ttl(self, jira):
+        """Repeat lookups within the TTL reuse the snapshot."""
+        first = await api._get_sprint()
+        second = await api._get_sprint()
+        
+        assert first is second
+        assert jira.sprint_fetches == 1
+    
+    @pytest.mark.asyncio
+    async def test_refetched_after_expiry(self, jira):
+        """An expired snapshot is fetched again."""
+        first = await api._get_sprint()
+        
+        api._cache["sprint_expires"] = 0.0
+        second = await api._get_sprint()
+        
+        assert second is not first
+        assert jira.sprint_fetches == 2
+
+
+class TestWorkloadETag:
+    """Tests for ETag generation and If-None-Match matching."""
+    
+    def test_payload_cached_per_summary(self, monkeypatch):
+        """The same summary reuses its body; a new summary gets a new one."""
+        monkeypatch.setitem(api._cache, "team_workload_payload", None)
+        summary = _summary()
+        
+        etag, body = api._workload_payload(summary)
+        assert api._workload_payload(summary)[1] is body
+        assert etag.startswith('"') and etag.endswith('"')
+        
+        other_etag, _ = api._workload_payload(_summary(score=90.0))
+        assert other_etag != etag
+    
+    def test_etag_matches_exact(self):
+        """An identical strong tag matches."""
+        assert api._etag_matches(_request('"abc"'), '"abc"')
+        assert not api._etag_matches(_request('"xyz"'), '"abc"')
+    
+    def test_etag_matches_weak(self):
+        """If-None-Match uses weak comparison, so W/ tags match too."""
+        assert api._etag_matches(_request('W/"abc"'), '"abc"')
+    
+    def test_etag_matches_list(self):
+        """Any tag in a comma-separated list can match."""
+        assert api._etag_matches(_request('"one", W/"abc" ,"two"'), '"abc"')
+        assert not api._etag_matches(_request('"one", "two"'), '"abc"')
+    
+    def test_etag_matches_wildcard(self):
+        """* matches any current representation."""
+        assert api._etag_matches(_request("*"), '"abc"')
+    
+    def test_etag_matches_missing_header(self):
+        """Without If-None-Match nothing matches."""
+        assert not api._etag_matches(_request(), '"abc"')
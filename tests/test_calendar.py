@@ -0,0 +1,73 @@
+"""
+Tests for the calendar integration.
+"""
+
+import asyncio
+from datetime import date, timedelta
+
+import pytest
+
+from src.integrations.calendar import CalendarClient, PTOPeriod, UserAvailability
+
+
+def _client(failures: dict) -> CalendarClient:
+    """A CalendarClient whose lookups raise failures[email], or succeed."""
+    client = CalendarClient(provider="google", token="test-token")
+    
+    async def get_user_availability(email: str, days_ahead: int = 30) -> UserAvailability:
+        if email in failures:
+            raise failures[email]
+        return UserAvailability(user=email.split("@")[0], email=email)
+    
+    client.get_user_availability = get_user_availability
+    return client
+
+
+class TestUserAvailability:
+    """Tests for PTO lookups."""
+    
+    def test_pto_follows_replaced_period(self):
+        """Replacing a PTO period in place is reflected in the lookups."""
+        today = date.today()
+        past = PTOPeriod(user="alice", start_date=today - timedelta(days=10), end_date=today - timedelta(days=5))
+        availability = UserAvailability(user="alice", email="alice@co.com", pto_periods=[past])
+        assert availability.is_available_today
+        assert availability.next_pto is None
+        
+        current = PTOPeriod(user="alice", start_date=today - timedelta(days=1), end_date=today + timedelta(days=1))
+        availability.pto_periods[0] = current
+        
+        assert not availability.is_available_today
+        assert availability.next_pto is current
+    
+    def test_next_pto_earliest_unfinished(self):
+        """next_pto is the earliest-starting period not yet over."""
+        today = date.today()
+        later = PTOPeriod(user="alice", start_date=today + timedelta(days=20), end_date=today + timedelta(days=22))
+        sooner = PTOPeriod(user="alice", start_date=today + timedelta(days=3), end_date=today + timedelta(days=4))
+        over = PTOPeriod(user="alice", start_date=today - timedelta(days=9), end_date=today - timedelta(days=8))
+        availability = UserAvailability(user="alice", email="alice@co.com", pto_periods=[later, over, sooner])
+        
+        assert availability.is_available_today
+        assert availability.next_pto is sooner
+
+
+class TestTeamAvailability:
+    """Tests for fetching availability for a whole team."""
+    
+    @pytest.mark.asyncio
+    async def test_failed_user_skipped(self):
+        """A user whose lookup fails is left out; the rest are returned."""
+        client = _client({"bob@co.com": RuntimeError("calendar unavailable")})
+        
+        availabilities = await client.get_team_availability(["alice@co.com", "bob@co.com"])
+        
+        assert [a.email for a in availabilities] == ["alice@co.com"]
+    
+    @pytest.mark.asyncio
+    async def test_cancellation_propagates(self):
+        """Cancellation is re-raised rather than logged as a per-user failure."""
+        client = _client({"bob@co.com": asyncio.CancelledError()})
+        
+        with pytest.raises(asyncio.CancelledError):
+            await client.get_team_availability(["alice@co.com", "bob@co.com"])
@@ -0,0 +1,87 @@
+"""
+Tests for the GitHub integration.
+"""
+
+import httpx
+import pytest
+
+from src.integrations.github import GitHubClient
+
+
+def _issue(number: int, login: str) -> dict:
+    """A minimal issue object as returned by the issues endpoint."""
+    return {
+        "number": number,
+        "title": f"Issue {number}",
+        "state": "open",
+        "labels": [],
+        "created_at": "2024-01-01T00:00:00+00:00",
+        "assignee": {"login": login},
+        "assignees": [{"login": login}],
+    }
+
+
+def _client(handler) -> GitHubClient:
+    """A GitHubClient whose requests are answered by handler."""
+    return GitHubClient(
+        token="test-token",
+        org="acme",
+        repos=["api"],
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+
+
+class TestAssignedIssues:
+    """Tests for grouping assigned issues by login."""
+    
+    @pytest.mark.asyncio
+    async def test_team_workload_matches_logins_case_insensitively(self):
+        """Issues assigned to "Alice" count for member "alice"."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/repos/acme/api/issues":
+                return httpx.Response(200, json=[_issue(1, "Alice"), _issue(2, "Alice"), _issue(3, "bob")])
+            return httpx.Response(200, json=[])
+        
+        client = _client(handler)
+        workloads = await client.get_team_workload(members=["alice", "BOB"])
+        
+        assigned = {user.login: user.assigned_issues for user in workloads}
+        assert assigned == {"alice": 2, "BOB": 1}
+    
+    @pytest.mark.asyncio
+    async def test_all_assigned_issues_keyed_by_casefolded_login(self):
+        """Groups are keyed by casefolded login but keep the original assignee."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=[_issue(1, "Alice")])
+        
+        client = _client(handler)
+        by_assignee = await client.get_all_assigned_issues("api")
+        
+        assert list(by_assignee) == ["alice"]
+        assert by_assignee["alice"][0].assignee == "Alice"
+
+
+class TestConditionalRequests:
+    """Tests for ETag revalidation of GET requests."""
+    
+    @pytest.mark.asyncio
+    async def test_not_modified_replays_parsed_page(self):
+        """A 304 reuses the parsed page, and only the ETag and parsed result are kept."""
+        sent_etags = []
+        
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent_etags.append(request.headers.get("if-none-match"))
+            if request.headers.get("if-none-match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, json=[{"login": "alice"}], headers={"ETag": '"v1"'})
+        
+        client = _client(handler)
+        first = await client._paginate("/orgs/acme/members", parse=lambda page: [u["login"] for u in page])
+        first.append("mutated")
+        second = await client._paginate("/orgs/acme/members", parse=lambda page: [u["login"] for u in page])
+        
+        assert sent_etags == [None, '"v1"']
+        assert second == ["alice"]
+        (etag, result), = client._etag_results.values()
+        assert etag == '"v1"'
+        assert not isinstance(result, httpx.Response)
@@ -0,0 +1,211 @@
+"""
+Tests for the Jira integration.
+"""
+
+import httpx
+import pytest
+
+from src.integrations.jira import JiraClient, JiraTicket, JiraUser
+
+
+def _issue(key: str, assignee: dict = None) -> dict:
+    """A minimal /search result issue."""
+    return {
+        "key": key,
+        "fields": {
+            "summary": key,
+            "status": {"name": "To Do"},
+            "assignee": assignee,
+            "customfield_10016": 1.0
+        }
+    }
+
+
+def _client(handler) -> JiraClient:
+    """A JiraClient whose requests are answered by handler."""
+    return JiraClient(
+        url="https://acme.atlassian.net",
+        email="bot@acme.com",
+        token="test-token",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+
+
+def _search_handler(issues: list[dict], cap: int = 100, seen_offsets: list = None):
+    """Serve /search over issues, capping page size at cap like Jira Cloud does."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        start_at = int(request.url.params["startAt"])
+        limit = min(int(request.url.params["maxResults"]), cap)
+        if seen_offsets is not None:
+            seen_offsets.append(start_at)
+        return httpx.Response(200, json={
+            "startAt": start_at,
+            "maxResults": limit,
+            "total": len(issues),
+            "issues": issues[start_at:start_at + limit]
+        })
+    return handler
+
+
+class TestJiraUser:
+    """Tests for per-user ticket totals."""
+    
+    def test_totals_follow_replaced_ticket(self):
+        """Replacing a ticket in place is reflected in the totals."""
+        user = JiraUser(account_id="a-1", display_name="Alice", assigned_tickets=[
+            JiraTicket(key="PROJ-1", summary="Task", status="To Do", assignee="Alice", story_points=3)
+        ])
+        assert user.total_story_points == 3
+        assert user.workload_score == 3.0
+        
+        user.assigned_tickets[0] = JiraTicket(
+            key="PROJ-2", summary="Task", status="In Progress", assignee="Alice",
+            story_points=8, labels=["blocked"]
+        )
+        
+        assert user.total_story_points == 8
+        assert user.tickets_in_progress == 1
+        assert user.tickets_blocked == 1
+        assert user.workload_score == 13.0
+    
+    def test_totals_follow_edited_ticket(self):
+        """Editing a ticket's points in place is reflected in the totals."""
+        ticket = JiraTicket(key="PROJ-1", summary="Task", status="To Do", assignee="Alice", story_points=3)
+        user = JiraUser(account_id="a-1", display_name="Alice", assigned_tickets=[ticket])
+        assert user.total_story_points == 3
+        
+        ticket.story_points = 5
+        
+        assert user.total_story_points == 5
+
+
+class TestSearchPagination:
+    """Tests for following /search pagination."""
+    
+    @pytest.mark.asyncio
+    async def test_fetches_remaining_pages_by_capped_size(self):
+        """After the first page, the rest are requested at the page size Jira allowed."""
+        offsets = []
+        issues = [_issue(f"PROJ-{i}") for i in range(250)]
+        client = _client(_search_handler(issues, seen_offsets=offsets))
+        
+        tickets = await client.search_tickets("project = PROJ")
+        
+        assert [t.key for t in tickets] == [f"PROJ-{i}" for i in range(250)]
+        assert offsets[0] == 0
+        assert sorted(offsets[1:]) == [100, 200]
+    
+    @pytest.mark.asyncio
+    async def test_max_results_limits_pages(self):
+        """Only enough pages for max_results are fetched."""
+        offsets = []
+        issues = [_issue(f"PROJ-{i}") for i in range(250)]
+        client = _client(_search_handler(issues, seen_offsets=offsets))
+        
+        tickets = await client.search_tickets("project = PROJ", max_results=150)
+        
+        assert len(tickets) == 150
+        assert sorted(offsets) == [0, 100]
+    
+    @pytest.mark.asyncio
+    async def test_overlapping_pages_deduplicated_by_key(self):
+        """An issue appearing on two offset pages is kept once."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            start_at = int(request.url.params["startAt"])
+            if start_at == 0:
+                page = [_issue(f"PROJ-{i}") for i in range(100)]
+            else:
+                # An issue moved while paging, shifting PROJ-99 onto this page too
+                page = [_issue("PROJ-99"), _issue("PROJ-100")]
+            return httpx.Response(200, json={"maxResults": 100, "total": 102, "issues": page})
+        
+        client = _client(handler)
+        tickets = await client.search_tickets("project = PROJ")
+        
+        keys = [t.key for t in tickets]
+        assert len(keys) == len(set(keys)) == 101
+        assert keys[-1] == "PROJ-100"
+
+
+class TestTeamWorkload:
+    """Tests for splitting one `assignee in (...)` search back out per user."""
+    
+    @pytest.mark.asyncio
+    async def test_matches_by_any_identifier(self):
+        """Tickets match the requested name by display name, account ID or email."""
+        jql = []
+        issues = [
+            _issue("PROJ-1", {"displayName": "Alice Smith", "accountId": "a-1"}),
+            _issue("PROJ-2", {"displayName": "Robert", "accountId": "b-2"}),
+            _issue("PROJ-3", {"displayName": "Carol", "accountId": "c-3", "emailAddress": "carol@acme.com"}),
+            _issue("PROJ-4", {"displayName": "alice smith", "accountId": "a-9"}),
+            _issue("PROJ-5", {"displayName": "Mallory", "accountId": "m-5"}),
+            _issue("PROJ-6", None)
+        ]
+        
+        def handler(request: httpx.Request) -> httpx.Response:
+            jql.append(request.url.params["jql"])
+            found = issues if jql[-1].startswith("assignee in") else []
+            return httpx.Response(200, json={"maxResults": 100, "total": len(found), "issues": found})
+        
+        client = _client(handler)
+        users = ["Alice Smith", "b-2", "Carol@Acme.com", "dave"]
+        workloads = await client.get_team_workload(users)
+        
+        assert jql[0].startswith('assignee in ("Alice Smith", "b-2", "Carol@Acme.com", "dave")')
+        # Mallory's and the unassigned issue match nobody, so dave is searched for alone
+        assert [q.split(" AND ")[0] for q in jql[1:]] == ['assignee = "dave"']
+        tickets = {u.display_name: [t.key for t in u.assigned_tickets] for u in workloads}
+        assert tickets == {
+            "Alice Smith": ["PROJ-1", "PROJ-4"],
+            "b-2": ["PROJ-2"],
+            "Carol@Acme.com": ["PROJ-3"],
+            "dave": []
+        }
+    
+    @pytest.mark.asyncio
+    async def test_email_member_falls_back_to_own_search(self, caplog):
+        """A member configured by email, which Jira doesn't return, is searched for alone."""
+        jql = []
+        carol = _issue("PROJ-1", {"displayName": "Carol", "accountId": "c-3"})
+        bob = _issue("PROJ-2", {"displayName": "Bob", "accountId": "b-2"})
+        
+        def handler(request: httpx.Request) -> httpx.Response:
+            jql.append(request.url.params["jql"])
+            if jql[-1].startswith("assignee in"):
+                found = [carol, bob]
+            elif jql[-1].startswith('assignee = "carol@acme.com"'):
+                found = [carol]
+            else:
+                found = []
+            return httpx.Response(200, json={"maxResults": 100, "total": len(found), "issues": found})
+        
+        client = _client(handler)
+        workloads = await client.get_team_workload(["carol@acme.com", "Bob"])
+        
+        tickets = {u.display_name: [t.key for t in u.assigned_tickets] for u in workloads}
+        assert tickets == {"carol@acme.com": ["PROJ-1"], "Bob": ["PROJ-2"]}
+        assert len(jql) == 2
+        assert "matched no requested user" not in caplog.text
+    
+    @pytest.mark.asyncio
+    async def test_unmatched_issues_logged(self, caplog):
+        """Issues no requested user accounts for are reported, not silently dropped."""
+        stray = _issue("PROJ-9", {"displayName": "Mallory", "accountId": "m-5"})
+        
+        def handler(request: httpx.Request) -> httpx.Response:
+            found = [stray] if request.url.params["jql"].startswith("assignee in") else []
+            return httpx.Response(200, json={"maxResults": 100, "total": len(found), "issues": found})
+        
+        workloads = await _client(handler).get_team_workload(["alice"])
+        
+        assert workloads[0].assigned_tickets == []
+        assert "1 Jira issues matched no requested user: PROJ-9" in caplog.text
+    
+    @pytest.mark.asyncio
+    async def test_no_users_skips_search(self):
+        """An empty user list makes no request."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise AssertionError("unexpected request")
+        
+        assert await _client(handler).get_team_workload([]) == []
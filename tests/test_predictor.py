@@ -175,10 +175,11 @@ class TestSprintPrediction:
             JiraTicket(key="P-4", summary="Todo", status="To Do", assignee="B", story_points=2),
         ]
         
+        # 5 points left over 2-3 days is on track at ~3 points/day
         velocity = [
-            {"completed_points": 15},
-            {"completed_points": 14},
-            {"completed_points": 16},
+            {"completed_points": 30},
+            {"completed_points": 28},
+            {"completed_points": 32},
         ]
         
         prediction = predictor.predict(sprint, tickets, velocity)
@@ -236,6 +237,59 @@ class TestSprintPrediction:
         assert data["risk"]["level"] == "medium"
 
 
+class TestCompletionForecast:
+    """Tests for the velocity-based completion probability."""
+    
+    @staticmethod
+    def _stats(average: float = 20.0, std_dev: float = 4.0) -> VelocityStats:
+        """Velocity stats from enough sprints to use the velocity model."""
+        return VelocityStats(
+            average=average,
+            median=average,
+            std_dev=std_dev,
+            min=average - std_dev,
+            max=average + std_dev,
+            trend="stable",
+            sprints_analyzed=5
+        )
+    
+    def _probability(self, remaining: float, days: int, stats: VelocityStats) -> float:
+        """Completion probability with remaining points and days left."""
+        _, probability = SprintPredictor()._forecast(
+            completed_points=10,
+            total_points=10 + remaining,
+            remaining_points=remaining,
+            days_remaining=days,
+            sprint_progress=0.5,
+            velocity_stats=stats
+        )
+        return probability
+    
+    def test_nothing_remaining(self):
+        """With no points left the sprint is certain to complete."""
+        assert self._probability(0, 5, self._stats()) == 100
+        assert self._probability(0, 0, self._stats()) == 100
+    
+    def test_no_days_left(self):
+        """With points left and no days left the sprint cannot complete."""
+        assert self._probability(5, 0, self._stats()) == 0
+    
+    def test_zero_std_dev(self):
+        """Without spread, completion is all or nothing."""
+        stats = self._stats(std_dev=0)
+        assert self._probability(10, 5, stats) == 100  # needs 20/sprint, averages 20
+        assert self._probability(12, 5, stats) == 0  # needs 24/sprint
+    
+    def test_normal_survival(self):
+        """Mid-range values follow the normal survival function of needed velocity."""
+        stats = self._stats(average=20, std_dev=4)
+        # Needed velocity equal to the mean
+        assert self._probability(10, 5, stats) == pytest.approx(50)
+        # One standard deviation above the mean
+        assert self._probability(12, 5, stats) == pytest.approx(15.8655, abs=1e-4)
+        # One standard deviation below the mean
+        assert self._probability(8, 5, stats) == pytest.approx(84.1345, abs=1e-4)
+
 class TestWhatIfScenarios:
     """Tests for what-if scenario analysis."""
     
@@ -280,12 +334,81 @@ class TestWhatIfScenarios:
             JiraTicket(key="P-1", summary="Task", status="In Progress", assignee="Alice", story_points=5),
         ]
         
-        original = predictor.predict(sprint, tickets, [])
-        scenario = predictor.what_if_add_scope(original, 10, tickets, sprint, [])
+        # With no history the forecast is a linear projection of completed work,
+        # which is 0% either way here, so give it a velocity to compare against
+        velocity = [
+            {"completed_points": 18},
+            {"completed_points": 22},
+            {"completed_points": 20},
+        ]
+        
+        original = predictor.predict(sprint, tickets, velocity)
+        scenario = predictor.what_if_add_scope(original, 10, tickets, sprint, velocity)
         
         assert "10" in scenario.scenario_name
         assert scenario.modified_prediction.total_points == 15
         assert scenario.probability_change < 0  # Adding scope = worse
+    
+    def test_what_if_add_scope_matches_full_prediction(self):
+        """Adding scope to a prediction gives what predict() gives with the ticket added."""
+        predictor = SprintPredictor()
+        
+        sprint = Sprint(
+            id=1,
+            name="Sprint 1",
+            state="active",
+            start_date=datetime.now() - timedelta(days=6),
+            end_date=datetime.now() + timedelta(days=4)
+        )
+        
+        tickets = [
+            JiraTicket(key="P-1", summary="Done", status="Done", assignee="Alice", story_points=5),
+            JiraTicket(key="P-2", summary="WIP", status="In Progress", assignee="Bob", story_points=3),
+            JiraTicket(key="P-3", summary="Todo", status="To Do", assignee="Alice", story_points=8),
+            JiraTicket(key="P-4", summary="Blocked", status="In Progress", assignee=None, story_points=2, labels=["blocked"]),
+        ]
+        
+        velocity = [
+            {"completed_points": 40},
+            {"completed_points": 50},
+            {"completed_points": 45},
+        ]
+        
+        predicted_at = datetime(2024, 1, 1)
+        original = predictor.predict(sprint, tickets, velocity, predicted_at=predicted_at)
+        scenario = predictor.what_if_add_scope(original, 5, tickets, sprint, velocity, predicted_at=predicted_at)
+        
+        added = JiraTicket(key="SCOPE-NEW", summary="Additional scope", status="To Do", assignee=None, story_points=5)
+        expected = predictor.predict(sprint, tickets + [added], velocity, predicted_at=predicted_at)
+        
+        assert 0 < original.completion_probability < 100
+        assert scenario.modified_prediction.to_dict() == expected.to_dict()
+        assert scenario.modified_prediction.completion_probability == pytest.approx(expected.completion_probability)
+        assert [r.ticket_key for r in scenario.modified_prediction.at_risk_tickets] == [
+            r.ticket_key for r in expected.at_risk_tickets
+        ]
+        assert scenario.probability_change < 0
+    
+    def test_what_if_add_scope_without_ticket_risks(self):
+        """A prediction not made by predict() falls back to a full prediction."""
+        predictor = SprintPredictor()
+        
+        sprint = Sprint(
+            id=1,
+            name="Sprint 1",
+            state="active",
+            start_date=datetime.now() - timedelta(days=5),
+            end_date=datetime.now() + timedelta(days=5)
+        )
+        tickets = [
+            JiraTicket(key="P-1", summary="Task", status="In Progress", assignee="Alice", story_points=5),
+        ]
+        original = SprintPrediction(sprint_name="Sprint 1", sprint_id=1, total_points=5, remaining_points=5)
+        
+        scenario = predictor.what_if_add_scope(original, 3, tickets, sprint, [])
+        
+        assert scenario.modified_prediction.total_points == 8
+        assert scenario.modified_prediction.remaining_points == 8
 
 
 class TestConvenienceFunctions:
@@ -0,0 +1,103 @@
+"""
+Tests for retrying transient upstream failures.
+"""
+
+import time
+
+import httpx
+import pytest
+
+from src.integrations import _retry
+from src.integrations._retry import MAX_DELAY, retry_delay, with_retry
+
+
+def _response(status: int = 429, **headers) -> httpx.Response:
+    """A response carrying the given headers (underscores become dashes)."""
+    return httpx.Response(
+        status,
+        headers={name.replace("_", "-"): value for name, value in headers.items()},
+        request=httpx.Request("GET", "https://api.example.com/")
+    )
+
+
+class TestRetryDelay:
+    """Tests for choosing the wait between attempts."""
+    
+    def test_retry_after(self):
+        """Retry-After seconds are used as-is."""
+        assert retry_delay(0, _response(Retry_After="3")) == 3.0
+    
+    def test_retry_after_capped(self):
+        """A long Retry-After is capped at MAX_DELAY."""
+        assert retry_delay(0, _response(Retry_After="120")) == MAX_DELAY
+    
+    def test_retry_after_preferred_over_reset(self):
+        """Retry-After wins when both headers are present."""
+        reset = str(int(time.time()) + 5)
+        response = _response(Retry_After="1", X_RateLimit_Reset=reset, X_RateLimit_Remaining="0")
+        assert retry_delay(0, response) == 1.0
+    
+    def test_rate_limit_reset(self):
+        """With the quota used up, wait until X-RateLimit-Reset."""
+        reset = str(int(time.time()) + 5)
+        delay = retry_delay(0, _response(403, X_RateLimit_Reset=reset, X_RateLimit_Remaining="0"))
+        assert 3.0 < delay <= 5.0
+    
+    def test_rate_limit_reset_in_past(self):
+        """A reset time already passed means no wait."""
+        reset = str(int(time.time()) - 10)
+        assert retry_delay(0, _response(403, X_RateLimit_Reset=reset, X_RateLimit_Remaining="0")) == 0.0
+    
+    def test_rate_limit_reset_ignored_with_quota_left(self):
+        """X-RateLimit-Reset only applies once the quota is exhausted."""
+        reset = str(int(time.time()) + 60)
+        delay = retry_delay(0, _response(500, X_RateLimit_Reset=reset, X_RateLimit_Remaining="10"))
+        assert delay <= 0.5
+    
+    def test_backoff_grows_with_attempt(self):
+        """Without hints, the delay is jittered exponential backoff."""
+        for attempt in range(3):
+            base = 2 ** attempt * 0.25
+            assert base <= retry_delay(attempt) <= base + 0.25
+    
+    def test_backoff_capped(self):
+        """Backoff never exceeds MAX_DELAY."""
+        assert retry_delay(10) == MAX_DELAY
+
+
+class TestWithRetry:
+    """Tests for the retry loop."""
+    
+    @pytest.mark.asyncio
+    async def test_retries_transient_status(self, monkeypatch):
+        """A 429 is retried after the delay the server asked for."""
+        delays = []
+        
+        async def sleep(seconds):
+            delays.append(seconds)
+        
+        monkeypatch.setattr(_retry.asyncio, "sleep", sleep)
+        responses = [_response(429, Retry_After="2"), _response(200)]
+        
+        async def fetch():
+            response = responses.pop(0)
+            response.raise_for_status()
+            return response
+        
+        response = await with_retry(fetch)
+        
+        assert response.status_code == 200
+        assert delays == [2.0]
+    
+    @pytest.mark.asyncio
+    async def test_does_not_retry_client_errors(self):
+        """A 404 is raised on the first attempt."""
+        calls = []
+        
+        async def fetch():
+            calls.append(1)
+            _response(404).raise_for_status()
+        
+        with pytest.raises(httpx.HTTPStatusError):
+            await with_retry(fetch)
+        assert len(calls) == 1
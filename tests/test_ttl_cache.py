@@ -0,0 +1,85 @@
+"""
+Tests for the integration clients' TTL cache.
+"""
+
+import pytest
+
+from src.integrations import _ttl_cache
+from src.integrations._ttl_cache import TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """A controllable monotonic clock; advance it by adding to clock[0]."""
+    now = [1000.0]
+    monkeypatch.setattr(_ttl_cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+class TestTTLCache:
+    """Tests for expiry and size bounds."""
+    
+    def test_expires_after_ttl(self, clock):
+        """Entries are returned until their TTL runs out."""
+        cache = TTLCache(ttl=10)
+        cache.set("a", 1)
+        
+        clock[0] += 9
+        assert cache.get("a") == 1
+        clock[0] += 1
+        assert cache.get("a") is None
+    
+    def test_evicts_oldest_when_full(self, clock):
+        """Past maxsize the oldest-stored entry is dropped."""
+        cache = TTLCache(ttl=10, maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+        
+        assert len(cache) == 2
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.get("c") == 3
+    
+    def test_reset_key_becomes_newest(self, clock):
+        """Storing an existing key again moves it to the back of the eviction order."""
+        cache = TTLCache(ttl=10, maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("a", 10)
+        cache.set("c", 3)
+        
+        assert cache.get("a") == 10
+        assert cache.get("b") is None
+    
+    def test_full_set_purges_expired(self, clock):
+        """When full, expired entries are dropped before any live one is evicted."""
+        cache = TTLCache(ttl=10, maxsize=2)
+        cache.set("long", 1, ttl=100)
+        cache.set("short", 2, ttl=1)
+        
+        clock[0] += 5
+        cache.set("new", 3)
+        
+        assert len(cache) == 2
+        assert cache.get("long") == 1
+        assert cache.get("new") == 3
+    
+    def test_set_below_capacity_skips_purge(self, clock):
+        """Below maxsize, set leaves expired entries for get to drop."""
+        cache = TTLCache(ttl=10, maxsize=3)
+        cache.set("short", 1, ttl=1)
+        
+        clock[0] += 5
+        cache.set("new", 2)
+        
+        assert len(cache) == 2
+        assert cache.get("short") is None
+        assert len(cache) == 1
+    
+    def test_non_positive_ttl_not_stored(self, clock):
+        """A ttl of 0 disables caching for that entry."""
+        cache = TTLCache(ttl=0)
+        cache.set("a", 1)
+        
+        assert len(cache) == 0